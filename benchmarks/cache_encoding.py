@@ -0,0 +1,124 @@
+"""
+Benchmark cache entry encodings.
+
+Compares the stored size and encode/decode latency of plain ``json.dumps``
+(the format used before :class:`~itglue.serialization.CacheCodec`) with the
+codec's serializer and compression options, on synthetic JSON:API pages.
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/cache_encoding.py [--records 50 500] [--iterations 200]
+
+Options that need ``msgpack`` or ``zstandard`` are skipped when the package
+is not installed.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from itglue.serialization import CacheCodec
+
+
+def make_page(records: int) -> Dict[str, Any]:
+    """Build a JSON:API page shaped like a configurations listing."""
+    return {
+        "data": [
+            {
+                "id": str(1000 + i),
+                "type": "configurations",
+                "attributes": {
+                    "organization-id": 42,
+                    "organization-name": "Example Holdings",
+                    "name": f"server-{i:04d}",
+                    "hostname": f"srv{i:04d}.corp.example.com",
+                    "primary-ip": f"10.0.{i // 256}.{i % 256}",
+                    "configuration-type-name": "Managed Server",
+                    "configuration-status-name": "Active",
+                    "operating-system-notes": "Patched monthly",
+                    "serial-number": f"SN{i:08d}",
+                    "archived": False,
+                    "created-at": "2024-01-15T10:30:00.000Z",
+                    "updated-at": "2024-06-01T08:00:00.000Z",
+                },
+                "relationships": {},
+            }
+            for i in range(records)
+        ],
+        "meta": {
+            "current-page": 1,
+            "next-page": 2,
+            "total-pages": 10,
+            "total-count": records * 10,
+        },
+        "links": {},
+    }
+
+
+def _codecs() -> List[Tuple[str, Callable[[Any], Any], Callable[[Any], Any]]]:
+    """Encoders to compare, skipping those whose dependency is missing."""
+    candidates: List[Tuple[str, Optional[str]]] = [
+        ("json", None),
+        ("json", "zlib"),
+        ("json", "zstd"),
+        ("msgpack", None),
+        ("msgpack", "zlib"),
+        ("msgpack", "zstd"),
+    ]
+
+    codecs = [("json.dumps (legacy)", json.dumps, json.loads)]
+    for serializer, compression in candidates:
+        try:
+            codec = CacheCodec(
+                serializer=serializer, compression=compression, compress_threshold=0
+            )
+        except ImportError:
+            continue
+        name = f"{serializer}+{compression}" if compression else serializer
+        codecs.append((name, codec.encode, codec.decode))
+    return codecs
+
+
+def _time_per_call(func: Callable[[Any], Any], arg: Any, iterations: int) -> float:
+    """Mean seconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(arg)
+    return (time.perf_counter() - start) / iterations
+
+
+def run(records_list: List[int], iterations: int) -> None:
+    """Print a comparison table for each page size."""
+    for records in records_list:
+        page = make_page(records)
+        baseline = None
+
+        print(f"\n{records} records per page")
+        print(
+            f"{'encoding':<22}{'bytes':>10}{'ratio':>8}"
+            f"{'encode us':>12}{'decode us':>12}"
+        )
+
+        for name, encode, decode in _codecs():
+            encoded = encode(page)
+            size = len(encoded)
+            if baseline is None:
+                baseline = size
+            encode_us = _time_per_call(encode, page, iterations) * 1e6
+            decode_us = _time_per_call(decode, encoded, iterations) * 1e6
+            print(
+                f"{name:<22}{size:>10}{size / baseline:>8.2f}"
+                f"{encode_us:>12.1f}{decode_us:>12.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    run(args.records, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark decoding resources with and without the model cache.
+
+Compares validating JSON:API resources into pydantic models with
+``from_api_dict`` against copying them from a warm
+:class:`~itglue.cache.ModelCache`, on synthetic configuration pages.
+
+Usage (with the package installed, e.g. ``pip install -e .``):
+    python benchmarks/model_decoding.py [--records 50 500] [--iterations 50]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from itglue.cache import ModelCache
+from itglue.models.configuration import Configuration
+
+from cache_encoding import make_page
+
+
+def _time_per_record(
+    decode: Callable[[Dict[str, Any]], Any], items: List[Dict[str, Any]], iterations: int
+) -> float:
+    """Mean seconds to decode one record."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for item in items:
+            decode(item)
+    return (time.perf_counter() - start) / (iterations * len(items))
+
+
+def with_relationships(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the relationships an ``include``-d configuration carries."""
+    return {
+        **item,
+        "relationships": {
+            "organization": {"data": {"type": "organizations", "id": "42"}},
+            "passwords": {
+                "data": [{"type": "passwords", "id": str(i)} for i in range(3)]
+            },
+        },
+    }
+
+
+def run(records_list: List[int], iterations: int) -> None:
+    """Print a comparison table for each page size."""
+    for records in records_list:
+        flat = make_page(records)["data"]
+
+        print(f"\n{records} records per page")
+        print(f"{'resources':<22}{'validate us':>12}{'cached us':>12}{'ratio':>8}")
+
+        for name, items in (
+            ("flat", flat),
+            ("with relationships", [with_relationships(item) for item in flat]),
+        ):
+            cache = ModelCache(max_size=records)
+            for item in items:
+                cache.decode(Configuration, item)
+
+            validate_us = (
+                _time_per_record(Configuration.from_api_dict, items, iterations) * 1e6
+            )
+            cached_us = (
+                _time_per_record(
+                    lambda item: cache.decode(Configuration, item), items, iterations
+                )
+                * 1e6
+            )
+            print(
+                f"{name:<22}{validate_us:>12.1f}{cached_us:>12.1f}"
+                f"{cached_us / validate_us:>8.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    run(args.records, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,8 +9,14 @@ from .version import __version__
 from .config import ITGlueConfig, ITGlueRegion
 from .client import ITGlueClient
 from .http_client import ITGlueHTTPClient
-from .pagination import PaginationHandler, PaginatedResponse, PaginationInfo
+from .pagination import (
+    PaginationHandler,
+    PaginatedResponse,
+    PaginationInfo,
+    PaginationCursor,
+)
 from .cache import CacheManager
+from .warmup import WarmupQuery, WarmupResult, reference_data_queries
 from .exceptions import (
     ITGlueError,
     ITGlueAPIError,
@@ -56,7 +62,11 @@ __all__ = [
     "PaginationHandler",
     "PaginatedResponse",
     "PaginationInfo",
+    "PaginationCursor",
     "CacheManager",
+    "WarmupQuery",
+    "WarmupResult",
+    "reference_data_queries",
     "ITGlueError",
     "ITGlueAPIError",
     "ITGlueAuthError",
@@ -5,13 +5,27 @@ CRUD operations, pagination handling, error management, and response processing.
 """
 
 import logging
-from typing import Dict, List, Optional, TypeVar, Generic, Union, Any, Type, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+    Generic,
+    Union,
+    Any,
+    Type,
+    Callable,
+    Generator,
+    Iterable,
+)
 from urllib.parse import urljoin, urlencode
 import structlog
 
+from ..cache import CacheManager
 from ..http_client import ITGlueHTTPClient
 from ..models.base import ITGlueResource, ITGlueResourceCollection, ResourceType
-from ..pagination import PaginatedResponse, PaginationHandler
+from ..pagination import PaginatedResponse, PaginationHandler, PaginationInfo
 from ..exceptions import ITGlueValidationError, ITGlueNotFoundError, ITGlueAPIError
 
 logger = logging.getLogger(__name__)
@@ -31,6 +45,8 @@ class BaseAPI(Generic[T]):
         resource_type: The ITGlue resource type this API handles
         model_class: Pydantic model class for this resource
         endpoint_path: Base endpoint path (e.g., 'organizations')
+        cache: Optional cache manager that reads are served from and
+            writes invalidate
     """
 
     def __init__(
@@ -39,12 +55,15 @@ class BaseAPI(Generic[T]):
         resource_type: ResourceType,
         model_class: Type[T],
         endpoint_path: str,
+        cache: Optional[CacheManager] = None,
     ):
         self.client = client
         self.resource_type = resource_type
         self.model_class = model_class
         self.endpoint_path = endpoint_path
         self.base_url = f"/{endpoint_path}"
+        self.cache = cache
+        self.pagination = PaginationHandler(client, cache=cache)
         self.logger = structlog.get_logger().bind(component=self.__class__.__name__)
 
     def _build_url(self, resource_id: Optional[str] = None, subpath: str = "") -> str:
@@ -117,14 +136,130 @@ class BaseAPI(Generic[T]):
 
         return params
 
+    @staticmethod
+    def _lookup_params(params: Dict[str, str]) -> Dict[str, str]:
+        """Strip paging from query params so a lookup has one identity."""
+        return {
+            key: value
+            for key, value in params.items()
+            if key not in ("page[number]", "page[size]")
+        }
+
+    def _is_negative(self, url: str, params: Dict[str, str]) -> bool:
+        """Check if a lookup recently came back empty or 404."""
+        return bool(self.cache) and self.cache.is_negative(
+            self.base_url, url, self._lookup_params(params)
+        )
+
+    def _set_negative(self, url: str, params: Dict[str, str]) -> None:
+        """Remember that a lookup came back empty or 404."""
+        if self.cache:
+            self.cache.set_negative(self.base_url, url, self._lookup_params(params))
+
+    def _fetch(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        force_refresh: bool = False,
+        cache_ttl: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """GET an endpoint, through the cache when one is configured.
+
+        Args:
+            url: Endpoint path
+            params: Query parameters
+            force_refresh: Skip the cached copy but still store the response
+            cache_ttl: Override the endpoint's cache TTL policy; 0 skips caching
+
+        Returns:
+            Raw JSON response
+        """
+        if not self.cache:
+            if params is None:
+                return self.client.get(url)
+            return self.client.get(url, params=params)
+
+        if not force_refresh:
+            cached = self.cache.get(
+                url, params, refresh=lambda: self.client.get(url, params=params)
+            )
+            if cached is not None:
+                return cached
+
+        try:
+            response = self.client.get(url, params=params)
+        except Exception:
+            # Let callers waiting on this fetch try for themselves
+            self.cache.release_lease(url, params)
+            raise
+
+        self.cache.set(url, response, params, ttl=cache_ttl)
+        return response
+
+    def _write_through(self, response: Optional[Dict[str, Any]]) -> bool:
+        """Write the resource in a write response to the entity cache.
+
+        Returns:
+            Whether the resource was written through
+        """
+        if not (self.cache and self.cache.config.cache_normalize):
+            return False
+
+        data = response.get("data") if isinstance(response, dict) else None
+        if not (isinstance(data, dict) and "type" in data and "id" in data):
+            return False
+
+        self.cache.put_entities([data])
+        return True
+
+    def _invalidate_after_create(
+        self, response: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Drop cached results a newly created resource could change."""
+        if self.cache:
+            self.cache.invalidate_negative(self.base_url)
+            self.cache.invalidate_endpoint(self.base_url)
+            self._write_through(response)
+
+    def _invalidate_after_write(
+        self, resource_id: str, response: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Update or drop cached results that list or embed a changed resource.
+
+        When the updated resource is returned and the cache is normalized,
+        it is written through: cached lists keep referencing it and only
+        lists whose membership may have changed are dropped. Otherwise (and
+        on delete) every cached list of the resource is dropped.
+        """
+        if not self.cache:
+            return
+
+        # A changed resource can start matching a lookup that found nothing
+        self.cache.invalidate_negative(self.base_url)
+        self.cache.invalidate_resource(self.resource_type.value, resource_id)
+        if self._write_through(response):
+            self.cache.invalidate_queries(self.endpoint_path)
+        else:
+            self.cache.invalidate_endpoint(self.base_url)
+
+    def _decode(self, data: Dict[str, Any], cache_models: bool = True) -> T:
+        """Decode a JSON:API resource object, via the model cache if enabled."""
+        if self.cache and cache_models:
+            return self.cache.decode(self.model_class, data)
+        return self.model_class.from_api_dict(data)
+
     def _process_response(
-        self, response_data: Dict[str, Any], is_collection: bool = False
+        self,
+        response_data: Dict[str, Any],
+        is_collection: bool = False,
+        cache_models: bool = True,
     ) -> Union[T, ITGlueResourceCollection[T]]:
         """Process API response into model instances.
 
         Args:
             response_data: Raw JSON response from API
             is_collection: Whether response contains multiple resources
+            cache_models: Decode through the model cache, if enabled
 
         Returns:
             Model instance or collection of model instances
@@ -137,7 +272,7 @@ class BaseAPI(Generic[T]):
                 # Collection response
                 items = []
                 for item_data in response_data.get("data", []):
-                    item = self.model_class.from_api_dict(item_data)
+                    item = self._decode(item_data, cache_models)
                     items.append(item)
 
                 # Create collection with pagination metadata
@@ -153,20 +288,27 @@ class BaseAPI(Generic[T]):
                 resource_data = response_data.get("data")
                 if not resource_data:
                     raise ITGlueValidationError("No data in response")
-                return self.model_class.from_api_dict(resource_data)
+                return self._decode(resource_data, cache_models)
 
         except Exception as e:
             logger.error(f"Failed to process {self.resource_type.value} response: {e}")
             raise ITGlueValidationError(f"Invalid response format: {e}")
 
     def get(
-        self, resource_id: str, include: Optional[List[str]] = None, **kwargs
+        self,
+        resource_id: str,
+        include: Optional[List[str]] = None,
+        force_refresh: bool = False,
+        cache_ttl: Optional[int] = None,
+        **kwargs,
     ) -> T:
         """Get a single resource by ID.
 
         Args:
             resource_id: Resource ID to retrieve
             include: List of related resources to include
+            force_refresh: Skip any cached response and fetch live
+            cache_ttl: Override the cache TTL policy for this response
             **kwargs: Additional query parameters
 
         Returns:
@@ -180,15 +322,18 @@ class BaseAPI(Generic[T]):
 
         url = self._build_url(resource_id)
         params = self._build_query_params(include=include, **kwargs)
+        not_found = f"{self.resource_type.value.title()} {resource_id} not found"
+
+        if not force_refresh and self._is_negative(url, params):
+            raise ITGlueNotFoundError(not_found)
 
         try:
-            response = self.client.get(url, params=params)
+            response = self._fetch(url, params, force_refresh, cache_ttl)
             return self._process_response(response, is_collection=False)
         except ITGlueAPIError as e:
             if e.status_code == 404:
-                raise ITGlueNotFoundError(
-                    f"{self.resource_type.value.title()} {resource_id} not found"
-                )
+                self._set_negative(url, params)
+                raise ITGlueNotFoundError(not_found)
             raise
 
     def list(
@@ -198,6 +343,8 @@ class BaseAPI(Generic[T]):
         sort: Optional[str] = None,
         filter_params: Optional[Dict[str, Any]] = None,
         include: Optional[List[str]] = None,
+        force_refresh: bool = False,
+        cache_ttl: Optional[int] = None,
         **kwargs,
     ) -> ITGlueResourceCollection[T]:
         """List resources with pagination.
@@ -208,6 +355,8 @@ class BaseAPI(Generic[T]):
             sort: Sort field and direction (e.g., 'name', '-created-at')
             filter_params: Dictionary of filter parameters
             include: List of related resources to include
+            force_refresh: Skip any cached response and fetch live
+            cache_ttl: Override the cache TTL policy for this response
             **kwargs: Additional query parameters
 
         Returns:
@@ -225,8 +374,117 @@ class BaseAPI(Generic[T]):
             **kwargs,
         )
 
-        response = self.client.get(url, params=params)
-        return self._process_response(response, is_collection=True)
+        # Empty filtered lookups are remembered briefly (first page only)
+        negative_lookup = bool(filter_params) and page in (None, 1)
+        if negative_lookup and not force_refresh and self._is_negative(url, params):
+            return self._process_response(
+                {"data": [], "meta": {"total-count": 0}}, is_collection=True
+            )
+
+        response = self._fetch(url, params, force_refresh, cache_ttl)
+        collection = self._process_response(response, is_collection=True)
+
+        if negative_lookup and not collection.data:
+            self._set_negative(url, params)
+
+        return collection
+
+    def iter_pages(
+        self,
+        per_page: Optional[int] = None,
+        sort: Optional[str] = None,
+        filter_params: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+        max_pages: Optional[int] = None,
+        force_refresh: bool = False,
+        bypass_cache: bool = False,
+        **kwargs,
+    ) -> Generator[ITGlueResourceCollection[T], None, None]:
+        """Iterate over result pages, hydrating one page at a time.
+
+        Only the current page's raw data and models are held in memory, so
+        a full scan of a large resource stays at a constant footprint.
+        When a cache is configured, a repeated scan is served from the
+        cached snapshot of the previous complete scan.
+
+        Args:
+            per_page: Number of items per page (default: client default)
+            sort: Sort field and direction
+            filter_params: Dictionary of filter parameters
+            include: List of related resources to include
+            max_pages: Maximum number of pages to fetch
+            force_refresh: Ignore any cached snapshot and fetch live
+            bypass_cache: Fetch live and cache neither pages nor models,
+                for one-off bulk scans
+            **kwargs: Additional query parameters
+
+        Yields:
+            Collection of resource model instances for each page
+        """
+        url = self._build_url()
+        params = self._build_query_params(
+            per_page=per_page,
+            sort=sort,
+            filter_params=filter_params,
+            include=include,
+            **kwargs,
+        )
+
+        for page in self.pagination.iterate_pages(
+            url,
+            params=params,
+            max_pages=max_pages,
+            force_refresh=force_refresh,
+            bypass_cache=bypass_cache,
+        ):
+            yield self._process_response(
+                {
+                    "data": page.data,
+                    "meta": page.meta,
+                    "links": page.links,
+                    "included": page.included,
+                },
+                is_collection=True,
+                cache_models=not bypass_cache,
+            )
+
+    def iter_all(
+        self,
+        per_page: Optional[int] = None,
+        sort: Optional[str] = None,
+        filter_params: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+        max_pages: Optional[int] = None,
+        force_refresh: bool = False,
+        bypass_cache: bool = False,
+        **kwargs,
+    ) -> Generator[T, None, None]:
+        """Iterate over every matching resource across all pages.
+
+        Args:
+            per_page: Number of items per page (default: client default)
+            sort: Sort field and direction
+            filter_params: Dictionary of filter parameters
+            include: List of related resources to include
+            max_pages: Maximum number of pages to fetch
+            force_refresh: Ignore any cached snapshot and fetch live
+            bypass_cache: Fetch live and cache neither pages nor models
+            **kwargs: Additional query parameters
+
+        Yields:
+            Resource model instances, fetched lazily page by page
+        """
+        for page in self.iter_pages(
+            per_page=per_page,
+            sort=sort,
+            filter_params=filter_params,
+            include=include,
+            max_pages=max_pages,
+            force_refresh=force_refresh,
+            bypass_cache=bypass_cache,
+            **kwargs,
+        ):
+            yield from page.data
 
     def list_all(
         self,
@@ -234,15 +492,23 @@ class BaseAPI(Generic[T]):
         sort: Optional[str] = None,
         filter_params: Optional[Dict[str, Any]] = None,
         include: Optional[List[str]] = None,
+        force_refresh: bool = False,
+        bypass_cache: bool = False,
         **kwargs,
     ) -> ITGlueResourceCollection[T]:
         """List all resources by automatically handling pagination.
 
+        Prefer :meth:`iter_all` when the results do not need to be held in
+        memory at once.
+
         Args:
             per_page: Number of items per page (default: client default)
             sort: Sort field and direction
             filter_params: Dictionary of filter parameters
             include: List of related resources to include
+            force_refresh: Ignore any cached snapshot and fetch live
+            bypass_cache: Fetch live and cache neither pages nor models,
+                for one-off bulk scans
             **kwargs: Additional query parameters
 
         Returns:
@@ -250,43 +516,229 @@ class BaseAPI(Generic[T]):
         """
         logger.info(f"Listing all {self.resource_type.value}")
 
-        url = self._build_url()
-        params = self._build_query_params(
-            per_page=per_page,
+        items = list(
+            self.iter_all(
+                per_page=per_page,
+                sort=sort,
+                filter_params=filter_params,
+                include=include,
+                force_refresh=force_refresh,
+                bypass_cache=bypass_cache,
+                **kwargs,
+            )
+        )
+
+        return ITGlueResourceCollection[self.model_class](
+            data=items,
+            meta={"total-count": len(items)},
+            links={},
+        )
+
+    def take(
+        self,
+        n: int,
+        sort: Optional[str] = None,
+        filter_params: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+        predicate: Optional[Callable[[T], bool]] = None,
+        per_page: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        **kwargs,
+    ) -> List[T]:
+        """Fetch at most ``n`` matching resources, stopping as soon as possible.
+
+        Without a predicate the page size defaults to ``n``, so the common
+        case is a single request. With a predicate, pages are scanned
+        (at the server's default size unless ``per_page`` is given) until
+        enough resources pass it. Each page is read through the cache like
+        :meth:`list`, so a repeated lookup makes no requests, and an empty
+        filtered lookup is remembered in the negative cache.
+
+        Args:
+            n: Maximum number of resources to return
+            sort: Sort field and direction
+            filter_params: Dictionary of filter parameters
+            include: List of related resources to include
+            predicate: Optional client-side check each resource must pass
+            per_page: Override the page size used for the requests
+            max_pages: Maximum number of pages to scan
+            **kwargs: Additional query parameters
+
+        Returns:
+            List of up to ``n`` resource model instances
+        """
+        if n <= 0:
+            return []
+
+        if per_page is None and predicate is None:
+            per_page = n
+
+        results: List[T] = []
+        page_number = 1
+        while True:
+            page = self.list(
+                page=page_number,
+                per_page=per_page,
+                sort=sort,
+                filter_params=filter_params,
+                include=include,
+                **kwargs,
+            )
+            for item in page:
+                if predicate is None or predicate(item):
+                    results.append(item)
+                    if len(results) >= n:
+                        return results
+
+            pagination = PaginationInfo(page.meta or {})
+            if not pagination.has_next or (max_pages and page_number >= max_pages):
+                return results
+            page_number = int(pagination.next_page or page_number + 1)
+
+    def first(
+        self,
+        sort: Optional[str] = None,
+        filter_params: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+        predicate: Optional[Callable[[T], bool]] = None,
+        per_page: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        **kwargs,
+    ) -> Optional[T]:
+        """Fetch the first matching resource.
+
+        Args:
+            sort: Sort field and direction
+            filter_params: Dictionary of filter parameters
+            include: List of related resources to include
+            predicate: Optional client-side check the resource must pass
+            per_page: Override the page size used for the requests
+            max_pages: Maximum number of pages to scan
+            **kwargs: Additional query parameters
+
+        Returns:
+            First matching resource, or None if nothing matches
+        """
+        results = self.take(
+            1,
             sort=sort,
             filter_params=filter_params,
             include=include,
+            predicate=predicate,
+            per_page=per_page,
+            max_pages=max_pages,
             **kwargs,
         )
+        return results[0] if results else None
 
-        # Use pagination handler to get all pages - but synchronously
-        all_data = []
-        page = 1
-        while True:
-            page_params = params.copy()
-            page_params["page[number]"] = str(page)
-            
-            response = self.client.get(url, params=page_params)
-            if not response or "data" not in response:
-                break
-                
-            all_data.extend(response["data"])
-            
-            # Check if there are more pages
-            meta = response.get("meta", {})
-            if not meta.get("has-next-page", False):
-                break
-                
-            page += 1
-
-        # Create a combined response
-        combined_response = {
-            "data": all_data,
-            "meta": {"total-count": len(all_data)},
-            "links": {}
-        }
-        
-        return self._process_response(combined_response, is_collection=True)
+    def count(
+        self,
+        filter_params: Optional[Dict[str, Any]] = None,
+        force_refresh: bool = False,
+        **kwargs,
+    ) -> int:
+        """Count matching resources without fetching them.
+
+        Issues a single ``page[size]=1`` probe and reads the total from the
+        response metadata. Results are cached alongside page responses.
+
+        Args:
+            filter_params: Dictionary of filter parameters
+            force_refresh: Ignore any cached count and probe live
+            **kwargs: Additional query parameters
+
+        Returns:
+            Number of matching resources
+        """
+        url = self._build_url()
+        params = self._build_query_params(
+            page=1, per_page=1, filter_params=filter_params, **kwargs
+        )
+
+        if self.cache and not force_refresh:
+            cached = self.cache.get(url, params, method="COUNT")
+            if cached is not None:
+                return cached["count"]
+
+        response = self.client.get(url, params=params)
+        total = (response.get("meta") or {}).get("total-count")
+
+        if total is None:
+            # Endpoint does not report totals; fall back to a full scan
+            self.logger.warning(
+                "No total-count in response, counting by scan", endpoint=url
+            )
+            total = sum(
+                len(page)
+                for page in self.iter_pages(
+                    filter_params=filter_params, force_refresh=force_refresh, **kwargs
+                )
+            )
+
+        total = int(total)
+        if self.cache:
+            self.cache.set(url, {"count": total}, params, method="COUNT")
+
+        return total
+
+    @staticmethod
+    def _merge_statistics(
+        totals: Dict[str, Any], page_stats: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Add one page's statistics into running totals."""
+        for key, value in page_stats.items():
+            if isinstance(value, dict):
+                distribution = totals.setdefault(key, {})
+                for bucket, count in value.items():
+                    distribution[bucket] = distribution.get(bucket, 0) + count
+            else:
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def facet_counts(
+        self,
+        field: str,
+        values: Iterable[Any],
+        filter_params: Optional[Dict[str, Any]] = None,
+        force_refresh: bool = False,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[Any, int]:
+        """Count matching resources for each value of a filter field.
+
+        Runs one :meth:`count` probe per value concurrently, e.g.
+        ``facet_counts("organization-status-name", ["Active", "Inactive"])``.
+
+        Args:
+            field: Filter field name (without the ``filter[...]`` wrapper)
+            values: Values of ``field`` to count
+            filter_params: Filters applied to every probe
+            force_refresh: Ignore any cached counts and probe live
+            max_workers: Maximum concurrent probes (default: connection pool size)
+            **kwargs: Additional query parameters
+
+        Returns:
+            Dictionary mapping each value to its count
+        """
+        values = list(dict.fromkeys(values))
+        if not values:
+            return {}
+
+        def _probe(value: Any) -> int:
+            return self.count(
+                filter_params={**(filter_params or {}), field: value},
+                force_refresh=force_refresh,
+                **kwargs,
+            )
+
+        if max_workers is None:
+            max_workers = getattr(self.client.config, "connection_pool_size", 1)
+        max_workers = max(1, min(max_workers, len(values)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = list(executor.map(_probe, values))
+
+        return dict(zip(values, counts))
 
     def create(self, data: Union[T, Dict[str, Any]], **kwargs) -> T:
         """Create a new resource.
@@ -321,6 +773,7 @@ class BaseAPI(Generic[T]):
         params = self._build_query_params(**kwargs)
 
         response = self.client.post(url, json_data=request_data, params=params)
+        self._invalidate_after_create(response)
         return self._process_response(response, is_collection=False)
 
     def update(
@@ -361,6 +814,7 @@ class BaseAPI(Generic[T]):
 
         try:
             response = self.client.patch(url, json_data=request_data, params=params)
+            self._invalidate_after_write(resource_id, response)
             return self._process_response(response, is_collection=False)
         except ITGlueAPIError as e:
             if e.status_code == 404:
@@ -387,6 +841,7 @@ class BaseAPI(Generic[T]):
 
         try:
             self.client.delete(url, params=params)
+            self._invalidate_after_write(resource_id)
             logger.info(
                 f"Successfully deleted {self.resource_type.value} {resource_id}"
             )
@@ -433,10 +888,10 @@ class BaseAPI(Generic[T]):
         self.logger.info("Getting resource by ID", resource_id=resource_id)
         
         try:
-            response = self.client.get(endpoint, params=params or {})
+            response = self._fetch(endpoint, params or {})
             
             if response and "data" in response:
-                return self.model_class.from_api_dict(response["data"])
+                return self._decode(response["data"])
             return None
             
         except Exception as e:
@@ -449,14 +904,14 @@ class BaseAPI(Generic[T]):
         self.logger.info("Getting all resources", params=params)
         
         try:
-            response = self.client.get(endpoint, params=params or {})
+            response = self._fetch(endpoint, params or {})
             
             if response and "data" in response:
                 all_data = response["data"]
                 if isinstance(all_data, list):
-                    return [self.model_class.from_api_dict(item) for item in all_data]
+                    return [self._decode(item) for item in all_data]
                 else:
-                    return [self.model_class.from_api_dict(all_data)]
+                    return [self._decode(all_data)]
             return []
             
         except Exception as e:
@@ -470,9 +925,10 @@ class BaseAPI(Generic[T]):
         
         try:
             response = self.client.post(endpoint, data=data, params=params or {})
+            self._invalidate_after_create(response)
             
             if response and "data" in response:
-                return self.model_class.from_api_dict(response["data"])
+                return self._decode(response["data"])
             return None
             
         except Exception as e:
@@ -486,9 +942,10 @@ class BaseAPI(Generic[T]):
         
         try:
             response = self.client.patch(endpoint, data=data, params=params or {})
+            self._invalidate_after_write(resource_id, response)
             
             if response and "data" in response:
-                return self.model_class.from_api_dict(response["data"])
+                return self._decode(response["data"])
             return None
             
         except Exception as e:
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Union, Any
 from .base import BaseAPI
 from ..models.configuration import Configuration, ConfigurationStatus
 from ..models.base import ResourceType, ITGlueResourceCollection
+from ..cache import CacheManager
 from ..http_client import ITGlueHTTPClient
 from ..exceptions import ITGlueValidationError
 
@@ -23,12 +24,15 @@ class ConfigurationsAPI(BaseAPI[Configuration]):
     including organization filtering, type-based queries, and asset management.
     """
 
-    def __init__(self, client: ITGlueHTTPClient):
+    def __init__(
+        self, client: ITGlueHTTPClient, cache: Optional[CacheManager] = None
+    ):
         super().__init__(
             client=client,
             resource_type=ResourceType.CONFIGURATIONS,
             model_class=Configuration,
             endpoint_path="configurations",
+            cache=cache,
         )
 
     def get_by_name(
@@ -281,17 +285,17 @@ class ConfigurationsAPI(BaseAPI[Configuration]):
         """
         logger.info("Getting configuration statistics")
         
-        # Get all configurations for analysis
-        all_configs = self.list_all()
-        
         stats = {
-            "total_count": len(all_configs.data),
+            "total_count": 0,
             "by_status": {},
             "by_type": {},
             "by_organization": {},
         }
         
-        for config in all_configs.data:
+        # Stream configurations page by page rather than loading them all
+        for config in self.iter_all():
+            stats["total_count"] += 1
+
             # Count by status
             status = config.configuration_status_name or "Unknown"
             stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
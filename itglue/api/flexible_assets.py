@@ -18,6 +18,7 @@ from ..models.flexible_asset import (
     FlexibleAssetStatus,
 )
 from ..models.base import ResourceType
+from ..cache import CacheManager
 from ..exceptions import ITGlueValidationError, ITGlueNotFoundError
 from .base import BaseAPI
 
@@ -30,9 +31,13 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
     structures that can be defined by users to document any type of information.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, cache: Optional[CacheManager] = None):
         super().__init__(
-            client, ResourceType.FLEXIBLE_ASSETS, FlexibleAsset, "flexible_assets"
+            client,
+            ResourceType.FLEXIBLE_ASSETS,
+            FlexibleAsset,
+            "flexible_assets",
+            cache=cache,
         )
 
     # Core CRUD operations (inherited from BaseAPI)
@@ -67,7 +72,7 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         if include:
             params["include"] = ",".join(include)
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetCollection.from_api_dict(response)
 
     def get_by_type(
@@ -98,7 +103,7 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         if organization_id:
             params["filter[organization_id]"] = str(organization_id)
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetCollection.from_api_dict(response)
 
     def search_by_name(
@@ -126,7 +131,7 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         if organization_id:
             params["filter[organization_id]"] = str(organization_id)
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetCollection.from_api_dict(response)
 
     def search_by_trait(
@@ -154,7 +159,7 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         if organization_id:
             params["filter[organization_id]"] = str(organization_id)
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetCollection.from_api_dict(response)
 
     def search_by_tag(
@@ -175,7 +180,7 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         if organization_id:
             params["filter[organization_id]"] = str(organization_id)
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetCollection.from_api_dict(response)
 
     def list_by_status(
@@ -210,7 +215,7 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         if organization_id:
             params["filter[organization_id]"] = str(organization_id)
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetCollection.from_api_dict(response)
 
     def get_active_assets(
@@ -283,7 +288,8 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
             data["attributes"]["tag_list"] = tags
 
         response = self.client.post(self._build_url(), {"data": data})
-        return FlexibleAsset.from_api_dict(response["data"])
+        self._invalidate_after_create(response)
+        return self._decode(response["data"])
 
     def update_traits(
         self,
@@ -304,7 +310,7 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         """
         if merge:
             # Get current asset to merge traits
-            current_asset = self.get(flexible_asset_id)
+            current_asset = self.get(flexible_asset_id, force_refresh=True)
             current_traits = current_asset.traits or {}
             updated_traits = {**current_traits, **traits}
         else:
@@ -315,7 +321,8 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         response = self.client.patch(
             self._build_url(flexible_asset_id), {"data": data}
         )
-        return FlexibleAsset.from_api_dict(response["data"])
+        self._invalidate_after_write(flexible_asset_id, response)
+        return self._decode(response["data"])
 
     def add_tags(
         self, flexible_asset_id: Union[str, int], tags: List[str]
@@ -330,7 +337,7 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         Returns:
             Updated flexible asset
         """
-        current_asset = self.get(flexible_asset_id)
+        current_asset = self.get(flexible_asset_id, force_refresh=True)
         current_tags = current_asset.tag_list or []
 
         # Add new tags, avoiding duplicates
@@ -344,7 +351,8 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         response = self.client.patch(
             self._build_url(flexible_asset_id), {"data": data}
         )
-        return FlexibleAsset.from_api_dict(response["data"])
+        self._invalidate_after_write(flexible_asset_id, response)
+        return self._decode(response["data"])
 
     def remove_tags(
         self, flexible_asset_id: Union[str, int], tags: List[str]
@@ -359,7 +367,7 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         Returns:
             Updated flexible asset
         """
-        current_asset = self.get(flexible_asset_id)
+        current_asset = self.get(flexible_asset_id, force_refresh=True)
         current_tags = current_asset.tag_list or []
 
         # Remove specified tags
@@ -370,7 +378,8 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         response = self.client.patch(
             self._build_url(flexible_asset_id), {"data": data}
         )
-        return FlexibleAsset.from_api_dict(response["data"])
+        self._invalidate_after_write(flexible_asset_id, response)
+        return self._decode(response["data"])
 
     def update_status(
         self,
@@ -396,7 +405,8 @@ class FlexibleAssetsAPI(BaseAPI[FlexibleAsset]):
         response = self.client.patch(
             self._build_url(flexible_asset_id), {"data": data}
         )
-        return FlexibleAsset.from_api_dict(response["data"])
+        self._invalidate_after_write(flexible_asset_id, response)
+        return self._decode(response["data"])
 
     def get_asset_statistics(
         self, organization_id: Optional[Union[str, int]] = None
@@ -448,12 +458,13 @@ class FlexibleAssetTypesAPI(BaseAPI[FlexibleAssetType]):
     the structure and fields for flexible assets.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, cache: Optional[CacheManager] = None):
         super().__init__(
             client,
             ResourceType.FLEXIBLE_ASSET_TYPES,
             FlexibleAssetType,
             "flexible_asset_types",
+            cache=cache,
         )
 
     def get_enabled_types(self) -> FlexibleAssetTypeCollection:
@@ -465,7 +476,7 @@ class FlexibleAssetTypesAPI(BaseAPI[FlexibleAssetType]):
         """
         params = {"filter[enabled]": "true"}
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetTypeCollection.from_api_dict(response)
 
     def get_builtin_types(self) -> FlexibleAssetTypeCollection:
@@ -477,7 +488,7 @@ class FlexibleAssetTypesAPI(BaseAPI[FlexibleAssetType]):
         """
         params = {"filter[builtin]": "true"}
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetTypeCollection.from_api_dict(response)
 
     def search_by_name(
@@ -498,7 +509,7 @@ class FlexibleAssetTypesAPI(BaseAPI[FlexibleAssetType]):
         else:
             params = {"filter[name]": f"*{name}*"}
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetTypeCollection.from_api_dict(response)
 
     def get_fields(
@@ -515,7 +526,7 @@ class FlexibleAssetTypesAPI(BaseAPI[FlexibleAssetType]):
         """
         url = f"{self._build_url(flexible_asset_type_id)}/relationships/flexible_asset_fields"
 
-        response = self.client.get(url)
+        response = self._fetch(url)
         return FlexibleAssetFieldCollection.from_api_dict(response)
 
 
@@ -527,12 +538,13 @@ class FlexibleAssetFieldsAPI(BaseAPI[FlexibleAssetField]):
     individual fields within flexible asset types.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, cache: Optional[CacheManager] = None):
         super().__init__(
             client,
             ResourceType.FLEXIBLE_ASSET_FIELDS,
             FlexibleAssetField,
             "flexible_asset_fields",
+            cache=cache,
         )
 
     def get_by_type(
@@ -549,7 +561,7 @@ class FlexibleAssetFieldsAPI(BaseAPI[FlexibleAssetField]):
         """
         params = {"filter[flexible_asset_type_id]": str(flexible_asset_type_id)}
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetFieldCollection.from_api_dict(response)
 
     def get_required_fields(
@@ -569,7 +581,7 @@ class FlexibleAssetFieldsAPI(BaseAPI[FlexibleAssetField]):
             "filter[required]": "true",
         }
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetFieldCollection.from_api_dict(response)
 
     def get_by_kind(
@@ -590,5 +602,5 @@ class FlexibleAssetFieldsAPI(BaseAPI[FlexibleAssetField]):
         if flexible_asset_type_id:
             params["filter[flexible_asset_type_id]"] = str(flexible_asset_type_id)
 
-        response = self.client.get(self._build_url(), params=params)
+        response = self._fetch(self._build_url(), params)
         return FlexibleAssetFieldCollection.from_api_dict(response)
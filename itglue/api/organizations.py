@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Union, Any
 from .base import BaseAPI
 from ..models.organization import Organization, OrganizationStatus, OrganizationTypeEnum
 from ..models.base import ResourceType, ITGlueResourceCollection
+from ..cache import CacheManager
 from ..http_client import ITGlueHTTPClient
 from ..exceptions import ITGlueValidationError
 
@@ -23,12 +24,15 @@ class OrganizationsAPI(BaseAPI[Organization]):
     including status filtering, type-based queries, and bulk operations.
     """
 
-    def __init__(self, client: ITGlueHTTPClient):
+    def __init__(
+        self, client: ITGlueHTTPClient, cache: Optional[CacheManager] = None
+    ):
         super().__init__(
             client=client,
             resource_type=ResourceType.ORGANIZATIONS,
             model_class=Organization,
             endpoint_path="organizations",
+            cache=cache,
         )
 
     def get_by_name(
@@ -52,11 +56,7 @@ class OrganizationsAPI(BaseAPI[Organization]):
             # Use partial matching
             filter_params = {"name": f"*{name}*"}
 
-        results = self.list(
-            filter_params=filter_params, include=include, per_page=1
-        )
-
-        return results.data[0] if results.data else None
+        return self.first(filter_params=filter_params, include=include)
 
     def list_by_status(
         self,
@@ -363,16 +363,17 @@ class OrganizationsAPI(BaseAPI[Organization]):
 
         stats = {"total": 0, "by_type": {}, "by_status": {}, "active": 0, "inactive": 0}
 
-        # Get all organizations (or just active ones)
-        if include_inactive:
-            organizations = self.list_all()
-        else:
-            organizations = self.get_active_organizations()
-
-        stats["total"] = len(organizations.data)
+        # Stream all organizations (or just active ones) page by page
+        filter_params = None
+        if not include_inactive:
+            filter_params = {
+                "organization-status-name": OrganizationStatus.ACTIVE.value
+            }
 
         # Count by type and status
-        for org in organizations.data:
+        for org in self.iter_all(filter_params=filter_params):
+            stats["total"] += 1
+
             # Count by type
             org_type = org.organization_type_name or "Unknown"
             stats["by_type"][org_type] = stats["by_type"].get(org_type, 0) + 1
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urlencode
 
 from .base import BaseAPI
+from ..cache import CacheManager
 from ..models.password import (
     Password,
     PasswordCollection,
@@ -27,13 +28,14 @@ class PasswordsAPI(BaseAPI[Password]):
     security filtering, sharing controls, and audit capabilities.
     """
 
-    def __init__(self, http_client):
+    def __init__(self, http_client, cache: Optional[CacheManager] = None):
         """Initialize PasswordsAPI with HTTP client."""
         super().__init__(
             client=http_client,
             resource_type=ResourceType.PASSWORDS,
             model_class=Password,
             endpoint_path="passwords",
+            cache=cache,
         )
 
     # Core CRUD operations (inherited from BaseAPI)
@@ -82,26 +84,22 @@ class PasswordsAPI(BaseAPI[Password]):
         Returns:
             Password if found, None otherwise
         """
-        params = {"filter[name]": name}
+        filter_params = {"name": name}
 
         if organization_id:
-            params["filter[organization-id]"] = organization_id
-
-        result = self.list(params=params)
-
-        # Convert to list if needed
-        if isinstance(result, PasswordCollection):
-            passwords = result.to_list()
-        else:
-            passwords = result if isinstance(result, list) else []
+            filter_params["organization-id"] = organization_id
 
-        # Find exact match (case-insensitive)
+        # The name filter narrows the candidates server-side, so one page is
+        # checked for an exact (case-insensitive) match rather than paging
+        # through every partial match
         name_lower = name.lower()
-        for password in passwords:
-            if password.name and password.name.lower() == name_lower:
-                return password
-
-        return None
+        return self.first(
+            filter_params=filter_params,
+            predicate=lambda password: bool(password.name)
+            and password.name.lower() == name_lower,
+            per_page=50,
+            max_pages=1,
+        )
 
     def search_by_username(
         self, username: str, organization_id: Optional[str] = None
@@ -635,7 +633,7 @@ class PasswordsAPI(BaseAPI[Password]):
             Updated password
         """
         # Get current password to check favorite status
-        password = self.get(password_id)
+        password = self.get(password_id, force_refresh=True)
         new_favorite = not password.favorite
 
         data = {
@@ -687,10 +685,23 @@ class PasswordsAPI(BaseAPI[Password]):
         Returns:
             Dictionary with password statistics
         """
-        # Get all active passwords
-        all_passwords = self.get_active_passwords(organization_id)
-
-        if not all_passwords:
+        active_filters = {"archived": "false"}
+        archived_filters = {"archived": "true"}
+        if organization_id:
+            active_filters["organization-id"] = organization_id
+            archived_filters["organization-id"] = organization_id
+
+        # Aggregate active passwords page by page to keep memory constant
+        stats: Optional[Dict[str, Any]] = None
+        for page in self.iter_pages(filter_params=active_filters):
+            page_stats = PasswordCollection(data=page.data).get_security_statistics()
+            stats = (
+                page_stats
+                if stats is None
+                else self._merge_statistics(stats, page_stats)
+            )
+
+        if not stats or not stats["total_passwords"]:
             return {
                 "total_passwords": 0,
                 "active_passwords": 0,
@@ -707,17 +718,8 @@ class PasswordsAPI(BaseAPI[Password]):
                 "type_distribution": {},
             }
 
-        # Convert to collection for analysis
-        collection = PasswordCollection.from_api_dict(
-            {"data": [p.model_dump_api() for p in all_passwords]}
-        )
-
-        # Get archived count separately
-        archived_passwords = self.get_archived_passwords(organization_id)
-
-        # Calculate statistics
-        stats = collection.get_security_statistics()
-        stats["archived_passwords"] = len(archived_passwords)
+        # Archived passwords only need a total, not their contents
+        stats["archived_passwords"] = self.count(filter_params=archived_filters)
         stats["total_passwords"] = (
             stats["active_passwords"] + stats["archived_passwords"]
         )
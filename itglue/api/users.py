@@ -10,6 +10,7 @@ from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 
 from .base import BaseAPI
+from ..cache import CacheManager
 from ..models.base import ResourceType
 from ..models.user import User, UserCollection, UserRole
 from ..exceptions import ITGlueAPIError
@@ -23,9 +24,9 @@ class UsersAPI(BaseAPI[User]):
     role assignments, and MyGlue integration.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, cache: Optional[CacheManager] = None):
         """Initialize the Users API."""
-        super().__init__(client, ResourceType.USERS, User, "users")
+        super().__init__(client, ResourceType.USERS, User, "users", cache=cache)
 
     def get_by_email(self, email: str, **kwargs) -> Optional[User]:
         """
@@ -42,15 +43,7 @@ class UsersAPI(BaseAPI[User]):
             ITGlueAPIError: If the API request fails
         """
         try:
-            params = {"filter[email]": email}
-            params.update(kwargs)
-
-            result = self.list(params=params, page_size=1)
-            if isinstance(result, UserCollection) and len(result) > 0:
-                return result[0]
-            elif isinstance(result, list) and len(result) > 0:
-                return result[0]
-            return None
+            return self.first(filter_params={"email": email}, **kwargs)
 
         except Exception as e:
             raise ITGlueAPIError(f"Failed to get user by email: {str(e)}") from e
@@ -386,32 +379,53 @@ class UsersAPI(BaseAPI[User]):
             ITGlueAPIError: If the API request fails
         """
         try:
-            # Get all users for statistics calculation
-            all_users = self.list(**kwargs)
-
-            if isinstance(all_users, UserCollection):
-                collection = all_users
-            else:
-                collection = UserCollection(
-                    all_users if isinstance(all_users, list) else []
+            # Aggregate page by page so large accounts stay in constant memory
+            stats: Dict[str, Any] = {}
+            reputation_sum = 0
+            top_users: List[User] = []
+            for page in self.iter_pages(**kwargs):
+                collection = UserCollection(data=page.data)
+                my_glue_stats = collection.get_my_glue_statistics()
+                my_glue_stats.pop("my_glue_adoption_percentage")
+                self._merge_statistics(
+                    stats,
+                    {
+                        "total_users": len(collection),
+                        "active_users": len(collection.filter_active_users()),
+                        "invited_users": len(collection.filter_invited_users()),
+                        "recently_active_users": len(
+                            collection.get_recently_active_users(30)
+                        ),
+                        "role_distribution": collection.get_role_distribution(),
+                        "my_glue_statistics": my_glue_stats,
+                    },
                 )
+                reputation_sum += sum(user.reputation or 0 for user in collection)
+                # Stable sort, so ties keep the earliest user
+                top_users = sorted(
+                    top_users + collection.get_top_reputation_users(5),
+                    key=lambda u: u.reputation or 0,
+                    reverse=True,
+                )[:5]
 
-            # Calculate various statistics
-            role_distribution = collection.get_role_distribution()
-            my_glue_stats = collection.get_my_glue_statistics()
-
-            active_users = collection.filter_active_users()
-            invited_users = collection.filter_invited_users()
-            recent_users = collection.get_recently_active_users(30)
-            top_users = collection.get_top_reputation_users(5)
+            total = stats.get("total_users", 0)
+            my_glue_stats = stats.get("my_glue_statistics", {})
+            with_my_glue = my_glue_stats.get("with_my_glue_access", 0)
 
             return {
-                "total_users": len(collection),
-                "active_users": len(active_users),
-                "invited_users": len(invited_users),
-                "recently_active_users": len(recent_users),
-                "role_distribution": role_distribution,
-                "my_glue_statistics": my_glue_stats,
+                "total_users": total,
+                "active_users": stats.get("active_users", 0),
+                "invited_users": stats.get("invited_users", 0),
+                "recently_active_users": stats.get("recently_active_users", 0),
+                "role_distribution": stats.get("role_distribution", {}),
+                "my_glue_statistics": {
+                    "total_users": total,
+                    "with_my_glue_access": with_my_glue,
+                    "without_my_glue_access": total - with_my_glue,
+                    "my_glue_adoption_percentage": (
+                        round((with_my_glue / total * 100), 2) if total > 0 else 0.0
+                    ),
+                },
                 "top_reputation_users": [
                     {
                         "id": user.id,
@@ -422,13 +436,7 @@ class UsersAPI(BaseAPI[User]):
                     for user in top_users
                 ],
                 "average_reputation": round(
-                    (
-                        sum(user.reputation or 0 for user in collection)
-                        / len(collection)
-                        if len(collection) > 0
-                        else 0
-                    ),
-                    2,
+                    reputation_sum / total if total > 0 else 0, 2
                 ),
             }
 
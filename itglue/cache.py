@@ -5,20 +5,98 @@ Provides caching capabilities for ITGlue API responses to improve performance
 and reduce API usage. Supports both in-memory and Redis caching.
 """
 
+import gzip
+import io
 import json
 import hashlib
+import math
+import os
+import sqlite3
 import time
+from time import perf_counter
+import uuid
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable, Union
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Protocol,
+    runtime_checkable,
+    Union,
+)
 import structlog
+from pydantic import TypeAdapter
 
 from .config import ITGlueConfig
 from .exceptions import ITGlueCacheError
+from .models.base import ITGlueRelationship
+from .serialization import CacheCodec
+
+
+# Marks values written by CacheManager, which carry freshness metadata
+_ENTRY_MARKER = "__itglue_cache_entry__"
+# Marks normalized responses, which hold (type, id) references to entities
+_REFS_MARKER = "__itglue_refs__"
+# Starts the keys of normalized entities, which memory caches bound by size only
+_ENTITY_KEY_PREFIX = "entity:"
+
+# Header of cache snapshot files written by CacheManager.export_snapshot
+_SNAPSHOT_FORMAT = "itglue-cache-snapshot"
+_SNAPSHOT_VERSION = 1
+# Resource types whose responses can carry secrets, left out of snapshots
+_SECRET_RESOURCE_TYPES = frozenset({"passwords"})
+
+# Reference data rarely changes; inventory changes often. Passwords are
+# never cached: detail responses carry the plaintext secret, which must
+# not reach Redis, disk or cache snapshots
+_REFERENCE_TTL = 6 * 3600
+DEFAULT_TTL_POLICIES: Dict[str, int] = {
+    "flexible_asset_types": _REFERENCE_TTL,
+    "flexible_asset_fields": _REFERENCE_TTL,
+    "configuration_types": _REFERENCE_TTL,
+    "configuration_statuses": _REFERENCE_TTL,
+    "organization_types": _REFERENCE_TTL,
+    "organization_statuses": _REFERENCE_TTL,
+    "contact_types": _REFERENCE_TTL,
+    "password_categories": _REFERENCE_TTL,
+    "manufacturers": _REFERENCE_TTL,
+    "models": _REFERENCE_TTL,
+    "operating_systems": _REFERENCE_TTL,
+    "platforms": _REFERENCE_TTL,
+    "countries": _REFERENCE_TTL,
+    "regions": _REFERENCE_TTL,
+    "passwords": 0,
+    "configurations": 120,
+}
 
 
 class CacheBackend(ABC):
     """Abstract base class for cache backends."""
 
+    #: Called with ``(event, value, size)`` when a value is stored
+    #: (``"set"``), evicted for space (``"eviction"``), found expired
+    #: (``"expiration"``) or turned away by an admission policy
+    #: (``"rejection"``). ``value`` is None when the backend cannot see it.
+    listener: Optional[Callable[[str, Any, int], None]] = None
+
+    def _notify(self, event: str, value: Any = None, size: int = 0) -> None:
+        """Report a storage event to the listener, if any."""
+        if self.listener is not None:
+            self.listener(event, value, size)
+
+    def stored_bytes(self) -> Optional[int]:
+        """Get the total size of stored values, if the backend tracks it."""
+        return None
+
     @abstractmethod
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get value from cache."""
@@ -44,93 +122,448 @@ class CacheBackend(ABC):
         """Check if key exists in cache."""
         pass
 
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several values at once.
+
+        Returns:
+            Values by key, omitting keys that are not cached
+        """
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def set_many(
+        self, items: Dict[str, Dict[str, Any]], ttl: Optional[int] = None
+    ) -> None:
+        """Set several values at once with a shared optional TTL."""
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+    def tag(self, key: str, tags: Iterable[str], ttl: Optional[int] = None) -> None:
+        """Associate a key with invalidation tags.
+
+        Backends without a tag index ignore tags.
+        """
+
+    def tag_many(
+        self, tags_by_key: Dict[str, List[str]], ttl: Optional[int] = None
+    ) -> None:
+        """Associate several keys with their invalidation tags."""
+        for key, tags in tags_by_key.items():
+            self.tag(key, tags, ttl)
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete every key associated with a tag.
+
+        Backends without a tag index cannot invalidate selectively, so they
+        clear everything.
+
+        Returns:
+            Number of keys deleted, if known
+        """
+        self.clear()
+        return 0
+
+    def acquire_lease(self, key: str, timeout: float) -> Optional[str]:
+        """Try to become the one caller that recomputes a key.
+
+        Backends private to one process have no other processes to
+        coordinate with, so the lease is always granted; callers within the
+        process are coordinated by :class:`CacheManager`.
+
+        Args:
+            key: Cache key
+            timeout: Seconds after which the lease lapses on its own
+
+        Returns:
+            A token for :meth:`release_lease`, or None if another process
+            holds the lease
+        """
+        return ""
+
+    def release_lease(self, key: str, token: str) -> None:
+        """Release a lease acquired with :meth:`acquire_lease`."""
+
+    def entries(self) -> Iterator[Tuple[str, Dict[str, Any], Optional[float], List[str]]]:
+        """Iterate over live entries, e.g. to export a snapshot.
+
+        Yields:
+            ``(key, value, seconds until expiry or None, tags)`` tuples
+
+        Raises:
+            NotImplementedError: If the backend cannot enumerate its entries
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support listing entries"
+        )
+
+    def close(self) -> None:
+        """Release background resources held by the backend."""
+
+
+def _process_rss_bytes() -> Optional[int]:
+    """Get the resident set size of this process, if it can be measured."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+# Validates the relationships object of a resource, as its model would
+_RELATIONSHIPS = TypeAdapter(Dict[str, ITGlueRelationship])
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the dicts and lists of decoded JSON, sharing scalar leaves."""
+    # Exact type checks: this runs on every model cache hit
+    kind = type(value)
+    if kind is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if kind is list:
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory weight of a value from its serialized size."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+#: Maps each byte to half its value, to age every sketch counter at once
+_HALVE = bytes(i >> 1 for i in range(256))
+
+#: Odd multipliers giving each sketch row its own multiply-shift hash
+_SKETCH_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+)
+
+
+class FrequencySketch:
+    """Approximate recent access counts of keys, for TinyLFU admission.
+
+    A count-min sketch: each key increments one counter in each of
+    ``depth`` rows and its frequency is the smallest of them, so collisions
+    can only overestimate it. Rows hold about four counters per cache
+    entry. Counters stop at 15, and all of them are halved after
+    ``10 * capacity`` increments so that keys which were popular long ago
+    lose out to keys popular now.
+
+    Args:
+        capacity: Number of entries the cache holds
+        depth: Number of rows
+    """
+
+    MAX_COUNT = 15
+
+    def __init__(self, capacity: int, depth: int = 4):
+        if not 1 <= depth <= len(_SKETCH_SEEDS):
+            raise ValueError(f"Sketch depth must be between 1 and {len(_SKETCH_SEEDS)}")
+
+        bits = max(4, (4 * capacity - 1).bit_length())
+        self.shift = 64 - bits
+        self.rows = [bytearray(1 << bits) for _ in range(depth)]
+        self.sample_size = 10 * max(1, capacity)
+        self.additions = 0
+
+    def _indexes(self, key: str) -> Iterator[int]:
+        """Get the counter index of a key in each row."""
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        for seed in _SKETCH_SEEDS[: len(self.rows)]:
+            yield ((h * seed) & 0xFFFFFFFFFFFFFFFF) >> self.shift
+
+    def increment(self, key: str) -> None:
+        """Count an access to a key."""
+        added = False
+        for counters, index in zip(self.rows, self._indexes(key)):
+            if counters[index] < self.MAX_COUNT:
+                counters[index] += 1
+                added = True
+
+        if added:
+            self.additions += 1
+            if self.additions >= self.sample_size:
+                self.reset()
+
+    def frequency(self, key: str) -> int:
+        """Estimate how often a key was accessed recently."""
+        return min(
+            counters[index] for counters, index in zip(self.rows, self._indexes(key))
+        )
+
+    def reset(self) -> None:
+        """Halve every counter."""
+        for counters in self.rows:
+            counters[:] = counters.translate(_HALVE)
+        self.additions //= 2
+
 
 class MemoryCache(CacheBackend):
-    """In-memory cache backend."""
+    """In-memory LRU cache backend.
+
+    Entries are kept in recency order, so lookups, writes and evictions are
+    all O(1). Expiry is checked lazily when an entry is read; expired
+    entries that are never read again age out through LRU eviction.
+
+    The cache is bounded by entry count and, optionally, by the estimated
+    serialized size of its values. With both ``max_bytes`` and
+    ``uncounted_prefix`` set, keys with that prefix (small normalized
+    entities) only count against ``max_bytes``. With ``max_rss_bytes`` set,
+    process RSS is sampled every ``rss_check_interval`` writes and the cache
+    sheds its least recently used quarter while RSS stays above the
+    threshold.
+
+    With ``admission="tinylfu"`` the cache counts reads and writes of each
+    key in a :class:`FrequencySketch`, and a new key that would evict an
+    entry is only stored if it has been used more often than that entry.
+    A scan that writes many pages once then cannot push out keys that are
+    read again and again; its pages are rejected instead.
+
+    Every operation holds the cache's lock, so one instance can be shared
+    by threads; see :class:`ShardedMemoryCache` to spread them over
+    several locks.
+    """
+
+    ADMISSION_POLICIES = ("always", "tinylfu")
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl: int = 3600,
+        max_bytes: Optional[int] = None,
+        max_rss_bytes: Optional[int] = None,
+        rss_check_interval: int = 100,
+        admission: str = "always",
+        uncounted_prefix: Optional[str] = None,
+    ):
+        if admission not in self.ADMISSION_POLICIES:
+            raise ValueError(f"Unknown cache admission policy: {admission}")
 
-    def __init__(self, max_size: int = 1000, ttl: int = 3600):
         self.max_size = max_size
         self.ttl = ttl
-        self.cache: Dict[str, Any] = {}
-        self.access_times: Dict[str, float] = {}
+        self.max_bytes = max_bytes
+        # Without a byte budget, uncounted entries would be unbounded
+        self.uncounted_prefix = uncounted_prefix if max_bytes is not None else None
+        self.counted = 0
+        self.max_rss_bytes = max_rss_bytes
+        self.rss_check_interval = rss_check_interval
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.tags: Dict[str, Set[str]] = {}
+        self.current_bytes = 0
+        self._writes_since_rss_check = 0
+        self.sketch = FrequencySketch(max_size) if admission == "tinylfu" else None
+        self._lock = threading.RLock()
         self.logger = structlog.get_logger().bind(component="memory_cache")
 
-    def _cleanup_expired(self) -> None:
-        """Remove expired cache entries."""
-        current_time = time.time()
-        expired_keys = [
-            key
-            for key, access_time in self.access_times.items()
-            if current_time - access_time > self.ttl
-        ]
-        for key in expired_keys:
-            self.cache.pop(key, None)
-            self.access_times.pop(key, None)
+    def _counts(self, key: str) -> bool:
+        """Check if a key counts against ``max_size``."""
+        return self.uncounted_prefix is None or not key.startswith(
+            self.uncounted_prefix
+        )
 
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
-        """Get value from cache."""
-        if key not in self.cache:
+    def _release(self, key: str, entry: Dict[str, Any]) -> None:
+        """Release a removed entry's weight and tag index references."""
+        self.current_bytes -= entry["size"]
+        self.counted -= self._counts(key)
+        for tag in entry.get("tags", ()):
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its weight."""
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self._release(key, entry)
+
+    def _evict_lru(self) -> None:
+        """Evict the least recently used entry."""
+        key, entry = self.cache.popitem(last=False)
+        self._release(key, entry)
+        self._notify("eviction", entry["data"], entry["size"])
+
+    def _get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a live entry and mark it most recently used."""
+        entry = self.cache.get(key)
+        if entry is None:
             return None
 
-        entry = self.cache[key]
-
-        # Check if expired
         if self._is_expired(entry):
-            del self.cache[key]
-            del self.access_times[key]
+            self._remove(key)
+            self._notify("expiration", entry["data"], entry["size"])
             return None
 
-        # Update access time
-        self.access_times[key] = time.time()
+        self.cache.move_to_end(key)
+        return entry
 
-        return entry["data"]
+    def _admit(self, key: str, size: int) -> bool:
+        """Check if a new key may take the place of the LRU entry."""
+        if (self.counted < self.max_size or not self._counts(key)) and (
+            self.max_bytes is None or self.current_bytes + size <= self.max_bytes
+        ):
+            return True
 
-    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
-        """Set value in cache with optional TTL."""
-        self._cleanup_expired()
-
-        # Check if we need to cleanup old entries due to size limit
-        if len(self.cache) >= self.max_size and key not in self.cache:
-            # Remove 20% of oldest entries
-            cleanup_count = max(1, int(self.max_size * 0.2))
-            oldest_keys = sorted(self.access_times.items(), key=lambda x: x[1])[:cleanup_count]
-            
-            for old_key, _ in oldest_keys:
-                self.cache.pop(old_key, None)
-                self.access_times.pop(old_key, None)
+        victim = next(iter(self.cache), None)
+        if victim is None or self._is_expired(self.cache[victim]):
+            return True
+        return self.sketch.frequency(key) > self.sketch.frequency(victim)
 
-        entry = {"data": value}
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get value from cache."""
+        with self._lock:
+            if self.sketch is not None:
+                self.sketch.increment(key)
+            entry = self._get_entry(key)
+            return entry["data"] if entry is not None else None
 
-        if ttl:
-            entry["expires_at"] = time.time() + ttl
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set value in cache with optional TTL (default: the cache TTL)."""
+        # Sizing serializes the value, so keep it outside the lock
+        size = _estimate_size(value)
+        with self._lock:
+            if self.sketch is not None:
+                self.sketch.increment(key)
+                if key not in self.cache and not self._admit(key, size):
+                    self._notify("rejection", value, size)
+                    return
+
+            self._remove(key)
+
+            if self.max_bytes is not None and size > self.max_bytes:
+                self.logger.debug("Value larger than cache, not cached", size=size)
+                return
+
+            counts = self._counts(key)
+            while self.cache and (
+                (counts and self.counted >= self.max_size)
+                or (
+                    self.max_bytes is not None
+                    and self.current_bytes + size > self.max_bytes
+                )
+            ):
+                self._evict_lru()
+
+            entry = {"data": value, "size": size}
+
+            if ttl is None:
+                ttl = self.ttl
+            if ttl:
+                entry["expires_at"] = time.time() + ttl
+
+            self.cache[key] = entry
+            self.current_bytes += size
+            self.counted += counts
+            self._notify("set", value, size)
+
+            if self.max_rss_bytes is not None:
+                self._writes_since_rss_check += 1
+                if self._writes_since_rss_check >= self.rss_check_interval:
+                    self._writes_since_rss_check = 0
+                    self._shrink_if_over_rss()
+
+    def _shrink_if_over_rss(self) -> None:
+        """Shed the least recently used quarter of entries if RSS is too high."""
+        rss = _process_rss_bytes()
+        if rss is None or rss <= self.max_rss_bytes:
+            return
 
-        self.cache[key] = entry
-        self.access_times[key] = time.time()
+        evict_count = max(1, len(self.cache) // 4)
+        for _ in range(min(evict_count, len(self.cache))):
+            self._evict_lru()
+
+        self.logger.warning(
+            "Process RSS over limit, shrank memory cache",
+            rss=rss,
+            max_rss=self.max_rss_bytes,
+            evicted=evict_count,
+            entries=len(self.cache),
+            bytes=self.current_bytes,
+        )
 
     def delete(self, key: str) -> None:
         """Delete value from cache."""
-        if key in self.cache:
-            del self.cache[key]
-            del self.access_times[key]
+        with self._lock:
+            self._remove(key)
+
+    def stored_bytes(self) -> Optional[int]:
+        """Get the estimated size of stored values."""
+        return self.current_bytes
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        self.cache.clear()
-        self.access_times.clear()
-        self.logger.info("Cleared all cache entries")
+        with self._lock:
+            self.cache.clear()
+            self.tags.clear()
+            self.current_bytes = 0
+            self.counted = 0
+            self.logger.info("Cleared all cache entries")
+
+    def tag(self, key: str, tags: Iterable[str], ttl: Optional[int] = None) -> None:
+        """Associate a cached key with invalidation tags."""
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return
+
+            entry_tags = entry.setdefault("tags", set())
+            for tag in tags:
+                entry_tags.add(tag)
+                self.tags.setdefault(tag, set()).add(key)
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete every key associated with a tag."""
+        with self._lock:
+            keys = self.tags.pop(tag, set())
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def entries(self) -> Iterator[Tuple[str, Dict[str, Any], Optional[float], List[str]]]:
+        """Iterate over live entries without changing their recency."""
+        now = time.time()
+        with self._lock:
+            items = [
+                (key, entry["data"], entry.get("expires_at"), sorted(entry.get("tags", ())))
+                for key, entry in self.cache.items()
+            ]
+
+        for key, value, expires_at, tags in items:
+            if expires_at is not None and expires_at <= now:
+                continue
+            remaining = expires_at - now if expires_at is not None else None
+            yield key, value, remaining, tags
 
     def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
-        if key not in self.cache:
-            return False
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return False
 
-        entry = self.cache[key]
-        if self._is_expired(entry):
-            del self.cache[key]
-            del self.access_times[key]
-            return False
+            if self._is_expired(entry):
+                self._remove(key)
+                return False
 
-        return True
+            return True
 
     def _is_expired(self, entry: Dict[str, Any]) -> bool:
         """Check if cache entry is expired."""
@@ -140,12 +573,157 @@ class MemoryCache(CacheBackend):
         return time.time() > entry["expires_at"]
 
 
+class ShardedMemoryCache(CacheBackend):
+    """In-memory cache split into independently locked shards.
+
+    Keys are spread over ``shards`` :class:`MemoryCache` instances by hash,
+    so threads working on different keys rarely contend for a lock. Size
+    limits are divided evenly between shards and LRU order is kept per
+    shard, which makes eviction approximately LRU across the whole cache.
+
+    Args:
+        shards: Number of shards
+        max_size: Maximum number of entries in total
+        ttl: Default TTL in seconds
+        max_bytes: Limit on the estimated size of all values
+        max_rss_bytes: Process RSS above which each shard sheds entries
+        admission: Admission policy of each shard, ``"always"`` or
+            ``"tinylfu"`` (see :class:`MemoryCache`)
+        uncounted_prefix: Prefix of keys bounded only by ``max_bytes``
+    """
+
+    def __init__(
+        self,
+        shards: int = 16,
+        max_size: int = 1000,
+        ttl: int = 3600,
+        max_bytes: Optional[int] = None,
+        max_rss_bytes: Optional[int] = None,
+        admission: str = "always",
+        uncounted_prefix: Optional[str] = None,
+    ):
+        if shards < 1:
+            raise ValueError("Shard count must be positive")
+
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.shards = [
+            MemoryCache(
+                max_size=max(1, math.ceil(max_size / shards)),
+                ttl=ttl,
+                max_bytes=math.ceil(max_bytes / shards) if max_bytes else max_bytes,
+                max_rss_bytes=max_rss_bytes,
+                admission=admission,
+                uncounted_prefix=uncounted_prefix,
+            )
+            for _ in range(shards)
+        ]
+
+    def _shard(self, key: str) -> MemoryCache:
+        """Get the shard that owns a key."""
+        return self.shards[hash(key) % len(self.shards)]
+
+    def _group(self, keys: Iterable[str]) -> Dict[int, List[str]]:
+        """Group keys by the index of their shard."""
+        groups: Dict[int, List[str]] = {}
+        for key in keys:
+            groups.setdefault(hash(key) % len(self.shards), []).append(key)
+        return groups
+
+    def count(self) -> int:
+        """Get the number of stored entries, including unread expired ones."""
+        return sum(len(shard.cache) for shard in self.shards)
+
+    @property
+    def listener(self) -> Optional[Callable[[str, Any, int], None]]:
+        """Storage events of every shard."""
+        return self.shards[0].listener
+
+    @listener.setter
+    def listener(self, listener: Optional[Callable[[str, Any, int], None]]) -> None:
+        for shard in self.shards:
+            shard.listener = listener
+
+    @property
+    def current_bytes(self) -> int:
+        """Get the estimated size of stored values across shards."""
+        return sum(shard.current_bytes for shard in self.shards)
+
+    def stored_bytes(self) -> Optional[int]:
+        """Get the estimated size of stored values."""
+        return self.current_bytes
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get value from the key's shard."""
+        return self._shard(key).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several values, locking each shard once."""
+        values: Dict[str, Dict[str, Any]] = {}
+        for index, shard_keys in self._group(keys).items():
+            shard = self.shards[index]
+            with shard._lock:
+                values.update(shard.get_many(shard_keys))
+        return values
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set value in the key's shard."""
+        self._shard(key).set(key, value, ttl)
+
+    def set_many(
+        self, items: Dict[str, Dict[str, Any]], ttl: Optional[int] = None
+    ) -> None:
+        """Set several values in their shards."""
+        for index, shard_keys in self._group(items).items():
+            self.shards[index].set_many({key: items[key] for key in shard_keys}, ttl)
+
+    def delete(self, key: str) -> None:
+        """Delete value from the key's shard."""
+        self._shard(key).delete(key)
+
+    def clear(self) -> None:
+        """Clear every shard."""
+        for shard in self.shards:
+            shard.clear()
+
+    def exists(self, key: str) -> bool:
+        """Check if key exists in its shard."""
+        return self._shard(key).exists(key)
+
+    def tag(self, key: str, tags: Iterable[str], ttl: Optional[int] = None) -> None:
+        """Tag a key in its shard, where its tag index lives."""
+        self._shard(key).tag(key, tags, ttl)
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete a tag's keys from every shard."""
+        return sum(shard.invalidate_tag(tag) for shard in self.shards)
+
+    def entries(self) -> Iterator[Tuple[str, Dict[str, Any], Optional[float], List[str]]]:
+        """Iterate over the live entries of every shard."""
+        for shard in self.shards:
+            yield from shard.entries()
+
+
 class RedisCache(CacheBackend):
-    """Redis cache backend."""
+    """Redis cache backend.
+
+    Multi-key operations are pipelined into a single round trip, and
+    :meth:`clear` walks the keyspace with ``SCAN`` and frees keys with
+    ``UNLINK`` so a shared server is never blocked. Values are encoded with
+    a :class:`~itglue.serialization.CacheCodec`.
+    """
 
-    def __init__(self, redis_client, key_prefix: str = "itglue:"):
+    def __init__(
+        self,
+        redis_client,
+        key_prefix: str = "itglue:",
+        scan_batch_size: int = 500,
+        codec: Optional[CacheCodec] = None,
+    ):
         self.redis = redis_client
         self.key_prefix = key_prefix
+        self.scan_batch_size = scan_batch_size
+        self.codec = codec or CacheCodec()
         self.logger = structlog.get_logger().bind(component="redis_cache")
 
     def _get_full_key(self, key: str) -> str:
@@ -161,27 +739,82 @@ class RedisCache(CacheBackend):
             if data is None:
                 return None
 
-            return json.loads(data)
+            return self._decode(key, data)
 
         except Exception as e:
             self.logger.error("Redis get error", key=key, error=str(e))
             raise ITGlueCacheError(f"Failed to get from Redis cache: {e}")
 
+    def _decode(self, key: str, data: Union[bytes, str]) -> Optional[Dict[str, Any]]:
+        """Decode a stored value, treating unreadable formats as misses."""
+        try:
+            return self.codec.decode(data)
+        except ValueError as e:
+            self.logger.warning("Unreadable Redis cache entry", key=key, error=str(e))
+            return None
+
     def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
         """Set value in cache with optional TTL."""
         try:
             full_key = self._get_full_key(key)
-            data = json.dumps(value)
+            data = self.codec.encode(value)
 
             if ttl:
                 self.redis.setex(full_key, ttl, data)
             else:
                 self.redis.set(full_key, data)
+            self._notify("set", value, len(data))
 
         except Exception as e:
             self.logger.error("Redis set error", key=key, error=str(e))
             raise ITGlueCacheError(f"Failed to set in Redis cache: {e}")
 
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several values with a single ``MGET``."""
+        if not keys:
+            return {}
+
+        try:
+            data = self.redis.mget([self._get_full_key(key) for key in keys])
+            values = {}
+            for key, value in zip(keys, data):
+                if value is not None:
+                    decoded = self._decode(key, value)
+                    if decoded is not None:
+                        values[key] = decoded
+            return values
+
+        except Exception as e:
+            self.logger.error("Redis get_many error", count=len(keys), error=str(e))
+            raise ITGlueCacheError(f"Failed to get from Redis cache: {e}")
+
+    def set_many(
+        self, items: Dict[str, Dict[str, Any]], ttl: Optional[int] = None
+    ) -> None:
+        """Set several values in one pipelined round trip."""
+        if not items:
+            return
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            sizes = []
+            for key, value in items.items():
+                full_key = self._get_full_key(key)
+                data = self.codec.encode(value)
+                sizes.append(len(data))
+                if ttl:
+                    pipe.setex(full_key, ttl, data)
+                else:
+                    pipe.set(full_key, data)
+            pipe.execute()
+
+            for value, size in zip(items.values(), sizes):
+                self._notify("set", value, size)
+
+        except Exception as e:
+            self.logger.error("Redis set_many error", count=len(items), error=str(e))
+            raise ITGlueCacheError(f"Failed to set in Redis cache: {e}")
+
     def delete(self, key: str) -> None:
         """Delete value from cache."""
         try:
@@ -192,20 +825,208 @@ class RedisCache(CacheBackend):
             self.logger.error("Redis delete error", key=key, error=str(e))
             raise ITGlueCacheError(f"Failed to delete from Redis cache: {e}")
 
+    # Delete the lease only if it is still ours, not one acquired after ours lapsed
+    _RELEASE_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
+
+    def _get_lease_key(self, key: str) -> str:
+        """Get the key holding a cache key's recompute lease."""
+        return f"{self.key_prefix}lease:{key}"
+
+    def acquire_lease(self, key: str, timeout: float) -> Optional[str]:
+        """Acquire a recompute lease with ``SET NX PX``."""
+        try:
+            token = uuid.uuid4().hex
+            acquired = self.redis.set(
+                self._get_lease_key(key),
+                token,
+                nx=True,
+                px=max(1, int(timeout * 1000)),
+            )
+            return token if acquired else None
+
+        except Exception as e:
+            self.logger.error("Redis lease error", key=key, error=str(e))
+            raise ITGlueCacheError(f"Failed to acquire Redis cache lease: {e}")
+
+    def release_lease(self, key: str, token: str) -> None:
+        """Release a recompute lease if it is still held with this token."""
+        try:
+            self.redis.eval(self._RELEASE_SCRIPT, 1, self._get_lease_key(key), token)
+
+        except Exception as e:
+            self.logger.error("Redis lease error", key=key, error=str(e))
+            raise ITGlueCacheError(f"Failed to release Redis cache lease: {e}")
+
+    def _get_tag_key(self, tag: str) -> str:
+        """Get the key of the set holding a tag's members."""
+        return f"{self.key_prefix}tag:{tag}"
+
+    # Add members to a tag set, only ever extending the set's expiry so it
+    # outlives members cached with a longer TTL than the newest one
+    _TAG_SCRIPT = (
+        "local existed = redis.call('exists', KEYS[1]) "
+        "redis.call('sadd', KEYS[1], unpack(ARGV, 2)) "
+        "local ttl = tonumber(ARGV[1]) "
+        "if ttl <= 0 then redis.call('persist', KEYS[1]) "
+        "else local current = redis.call('ttl', KEYS[1]) "
+        "if existed == 0 or (current >= 0 and current < ttl) then "
+        "redis.call('expire', KEYS[1], ttl) end end "
+        "return 1"
+    )
+
+    def tag(self, key: str, tags: Iterable[str], ttl: Optional[int] = None) -> None:
+        """Add a key to each tag's Redis set.
+
+        A tag set's expiry is only ever extended, so it outlives every
+        member whatever their TTLs; a member without a TTL makes the set
+        persistent. Stale members of expired keys are harmless.
+        """
+        self.tag_many({key: list(tags)}, ttl)
+
+    def tag_many(
+        self, tags_by_key: Dict[str, List[str]], ttl: Optional[int] = None
+    ) -> None:
+        """Add several keys to their tags' Redis sets in one round trip."""
+        members: Dict[str, List[str]] = {}
+        for key, tags in tags_by_key.items():
+            full_key = self._get_full_key(key)
+            for tag in tags:
+                members.setdefault(self._get_tag_key(tag), []).append(full_key)
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for tag_key, full_keys in members.items():
+                for start in range(0, len(full_keys), self.scan_batch_size):
+                    pipe.eval(
+                        self._TAG_SCRIPT,
+                        1,
+                        tag_key,
+                        ttl or 0,
+                        *full_keys[start : start + self.scan_batch_size],
+                    )
+            pipe.execute()
+
+        except Exception as e:
+            self.logger.error("Redis tag error", count=len(tags_by_key), error=str(e))
+            raise ITGlueCacheError(f"Failed to tag Redis cache entry: {e}")
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete every key in a tag's Redis set, then the set itself."""
+        return len(self.pop_tag(tag))
+
+    def pop_tag(self, tag: str) -> List[str]:
+        """Delete a tag's keys and set, returning the keys without prefix."""
+        try:
+            tag_key = self._get_tag_key(tag)
+            keys = list(self.redis.smembers(tag_key))
+            for start in range(0, len(keys), self.scan_batch_size):
+                self.redis.unlink(*keys[start : start + self.scan_batch_size])
+            self.redis.unlink(tag_key)
+
+            prefix = self.key_prefix.encode()
+            return [
+                (
+                    key[len(prefix) :].decode()
+                    if isinstance(key, bytes)
+                    else key[len(self.key_prefix) :]
+                )
+                for key in keys
+            ]
+
+        except Exception as e:
+            self.logger.error("Redis invalidate error", tag=tag, error=str(e))
+            raise ITGlueCacheError(f"Failed to invalidate Redis cache tag: {e}")
+
     def clear(self) -> None:
         """Clear all cache entries with our prefix."""
         try:
             pattern = f"{self.key_prefix}*"
-            keys = self.redis.keys(pattern)
+            batch: List[Any] = []
+            count = 0
 
-            if keys:
-                self.redis.delete(*keys)
-                self.logger.info("Cleared Redis cache entries", count=len(keys))
+            for key in self.redis.scan_iter(match=pattern, count=self.scan_batch_size):
+                batch.append(key)
+                if len(batch) >= self.scan_batch_size:
+                    self.redis.unlink(*batch)
+                    count += len(batch)
+                    batch = []
+
+            if batch:
+                self.redis.unlink(*batch)
+                count += len(batch)
+
+            if count:
+                self.logger.info("Cleared Redis cache entries", count=count)
 
         except Exception as e:
             self.logger.error("Redis clear error", error=str(e))
             raise ITGlueCacheError(f"Failed to clear Redis cache: {e}")
 
+    def entries(self) -> Iterator[Tuple[str, Dict[str, Any], Optional[float], List[str]]]:
+        """Iterate over entries with ``SCAN``, reading values in pipelined batches.
+
+        Tag sets and leases are not entries; tags are read from the tag
+        sets first and attached to their members.
+        """
+
+        def _text(key: Any) -> str:
+            return key.decode() if isinstance(key, bytes) else key
+
+        try:
+            tag_prefix = self._get_tag_key("")
+            lease_prefix = self._get_lease_key("")
+            tags_by_key: Dict[str, List[str]] = {}
+            for tag_key in self.redis.scan_iter(
+                match=f"{tag_prefix}*", count=self.scan_batch_size
+            ):
+                tag = _text(tag_key)[len(tag_prefix) :]
+                for member in self.redis.smembers(tag_key):
+                    tags_by_key.setdefault(_text(member), []).append(tag)
+
+            batch: List[str] = []
+            for full_key in self.redis.scan_iter(
+                match=f"{self.key_prefix}*", count=self.scan_batch_size
+            ):
+                full_key = _text(full_key)
+                if full_key.startswith((tag_prefix, lease_prefix)):
+                    continue
+                batch.append(full_key)
+                if len(batch) >= self.scan_batch_size:
+                    yield from self._entries_batch(batch, tags_by_key)
+                    batch = []
+            if batch:
+                yield from self._entries_batch(batch, tags_by_key)
+
+        except ITGlueCacheError:
+            raise
+        except Exception as e:
+            self.logger.error("Redis entries error", error=str(e))
+            raise ITGlueCacheError(f"Failed to list Redis cache entries: {e}")
+
+    def _entries_batch(
+        self, full_keys: List[str], tags_by_key: Dict[str, List[str]]
+    ) -> Iterator[Tuple[str, Dict[str, Any], Optional[float], List[str]]]:
+        """Read values and remaining TTLs of a batch of keys."""
+        pipe = self.redis.pipeline(transaction=False)
+        for full_key in full_keys:
+            pipe.get(full_key)
+            pipe.pttl(full_key)
+        results = pipe.execute()
+
+        for index, full_key in enumerate(full_keys):
+            data, pttl = results[2 * index], results[2 * index + 1]
+            # A negative PTTL means no expiry (-1) or already gone (-2)
+            if data is None or pttl == -2:
+                continue
+            key = full_key[len(self.key_prefix) :]
+            value = self._decode(key, data)
+            if value is not None:
+                remaining = pttl / 1000 if pttl >= 0 else None
+                yield key, value, remaining, sorted(tags_by_key.get(full_key, ()))
+
     def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
         try:
@@ -217,50 +1038,1037 @@ class RedisCache(CacheBackend):
             raise ITGlueCacheError(f"Failed to check Redis cache: {e}")
 
 
+class DiskCache(CacheBackend):
+    """Persistent cache backend stored in a SQLite database.
+
+    Entries survive restarts and can be shared by several processes on one
+    host. The database runs in WAL mode, so readers never block the writer,
+    and each thread uses its own connection. Opening the cache only creates
+    missing tables; nothing is loaded up front.
+
+    Expired entries are deleted when read and purged in bulk every
+    ``purge_interval`` writes, together with least recently read entries
+    while the stored size exceeds ``max_bytes``. Read times are only
+    recorded when older than ``touch_interval`` seconds, so hot reads do not
+    turn into writes.
+
+    Args:
+        path: Database file, created with its directory if missing
+        ttl: Default TTL in seconds; 0 or None keeps entries until evicted
+        max_bytes: Limit on the total size of stored values
+        codec: Encoding for stored values
+        purge_interval: Writes between expiry and size checks
+        touch_interval: Minimum seconds between read time updates of an entry
+        timeout: Seconds to wait for another process's write lock
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires_at REAL,
+            accessed_at REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at)",
+        "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)",
+        """
+        CREATE TABLE IF NOT EXISTS tags (
+            tag TEXT NOT NULL,
+            key TEXT NOT NULL REFERENCES entries (key) ON DELETE CASCADE,
+            PRIMARY KEY (tag, key)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS tags_key ON tags (key)",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[int] = 3600,
+        max_bytes: Optional[int] = None,
+        codec: Optional[CacheCodec] = None,
+        purge_interval: int = 100,
+        touch_interval: int = 60,
+        timeout: float = 10.0,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.codec = codec or CacheCodec()
+        self.purge_interval = purge_interval
+        self.touch_interval = touch_interval
+        self.timeout = timeout
+        self.logger = structlog.get_logger().bind(component="disk_cache")
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._writes_since_purge = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        try:
+            with self._connection() as conn:
+                for statement in self._SCHEMA:
+                    conn.execute(statement)
+        except sqlite3.Error as e:
+            raise ITGlueCacheError(f"Failed to open disk cache at {path}: {e}")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Each connection is used by one thread, but close() runs on any
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _decode(self, key: str, data: bytes) -> Optional[Dict[str, Any]]:
+        """Decode a stored value, treating unreadable formats as misses."""
+        try:
+            return self.codec.decode(data)
+        except ValueError as e:
+            self.logger.warning("Unreadable disk cache entry", key=key, error=str(e))
+            return None
+
+    def _expires_at(self, ttl: Optional[int]) -> Optional[float]:
+        """Get the expiry time for a TTL (default: the cache TTL)."""
+        if ttl is None:
+            ttl = self.ttl
+        return time.time() + ttl if ttl else None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get value from cache."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several values with one query."""
+        if not keys:
+            return {}
+
+        now = time.time()
+        values = {}
+        expired = []
+        stale_reads = []
+
+        try:
+            conn = self._connection()
+            placeholders = ",".join("?" * len(keys))
+            rows = conn.execute(
+                "SELECT key, value, expires_at, accessed_at FROM entries "
+                f"WHERE key IN ({placeholders})",
+                keys,
+            ).fetchall()
+
+            for key, data, expires_at, accessed_at in rows:
+                if expires_at is not None and expires_at <= now:
+                    expired.append((key,))
+                    if self.listener is not None:
+                        self._notify("expiration", self._decode(key, data), len(data))
+                    continue
+                value = self._decode(key, data)
+                if value is not None:
+                    values[key] = value
+                if now - accessed_at >= self.touch_interval:
+                    stale_reads.append((now, key))
+
+            if expired or stale_reads:
+                with conn:
+                    conn.executemany("DELETE FROM entries WHERE key = ?", expired)
+                    conn.executemany(
+                        "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                        stale_reads,
+                    )
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache get error", error=str(e))
+            raise ITGlueCacheError(f"Failed to get from disk cache: {e}")
+
+        return values
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set value in cache with optional TTL (default: the cache TTL)."""
+        self.set_many({key: value}, ttl)
+
+    def set_many(
+        self, items: Dict[str, Dict[str, Any]], ttl: Optional[int] = None
+    ) -> None:
+        """Set several values in one transaction."""
+        if not items:
+            return
+
+        now = time.time()
+        expires_at = self._expires_at(ttl)
+        rows = []
+        stored = []
+        for key, value in items.items():
+            data = self.codec.encode(value)
+            if self.max_bytes is not None and len(data) > self.max_bytes:
+                self.logger.debug("Value larger than cache, not cached", key=key)
+                continue
+            rows.append((key, data, len(data), expires_at, now))
+            stored.append((value, len(data)))
+
+        try:
+            with self._connection() as conn:
+                # Replacing a row drops its tags through the foreign key
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, value, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache set error", error=str(e))
+            raise ITGlueCacheError(f"Failed to set in disk cache: {e}")
+
+        for value, size in stored:
+            self._notify("set", value, size)
+
+        self._writes_since_purge += len(rows)
+        if self._writes_since_purge >= self.purge_interval:
+            self._writes_since_purge = 0
+            self.purge()
+
+    def purge(self) -> int:
+        """Delete expired entries, then least recently read ones over the limit.
+
+        Returns:
+            Number of entries deleted
+        """
+        try:
+            with self._connection() as conn:
+                expired = conn.execute(
+                    "DELETE FROM entries WHERE expires_at <= ?", (time.time(),)
+                ).rowcount
+                evicted = 0
+
+                if self.max_bytes is not None:
+                    total = conn.execute(
+                        "SELECT COALESCE(SUM(size), 0) FROM entries"
+                    ).fetchone()[0]
+                    excess = total - self.max_bytes
+                    if excess > 0:
+                        evict = []
+                        for key, size in conn.execute(
+                            "SELECT key, size FROM entries ORDER BY accessed_at"
+                        ):
+                            evict.append((key,))
+                            excess -= size
+                            if excess <= 0:
+                                break
+                        conn.executemany("DELETE FROM entries WHERE key = ?", evict)
+                        evicted = len(evict)
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache purge error", error=str(e))
+            raise ITGlueCacheError(f"Failed to purge disk cache: {e}")
+
+        for _ in range(expired):
+            self._notify("expiration")
+        for _ in range(evicted):
+            self._notify("eviction")
+
+        deleted = expired + evicted
+        if deleted:
+            self.logger.debug("Purged disk cache entries", count=deleted)
+        return deleted
+
+    def stored_bytes(self) -> Optional[int]:
+        """Get the encoded size of stored values."""
+        try:
+            return self._connection().execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache size error", error=str(e))
+            raise ITGlueCacheError(f"Failed to size disk cache: {e}")
+
+    def delete(self, key: str) -> None:
+        """Delete value from cache."""
+        try:
+            with self._connection() as conn:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache delete error", key=key, error=str(e))
+            raise ITGlueCacheError(f"Failed to delete from disk cache: {e}")
+
+    def clear(self) -> None:
+        """Clear all cache entries."""
+        try:
+            with self._connection() as conn:
+                conn.execute("DELETE FROM entries")
+            self.logger.info("Cleared disk cache entries")
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache clear error", error=str(e))
+            raise ITGlueCacheError(f"Failed to clear disk cache: {e}")
+
+    def exists(self, key: str) -> bool:
+        """Check if key exists in cache."""
+        try:
+            row = self._connection().execute(
+                "SELECT 1 FROM entries WHERE key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+            return row is not None
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache exists error", key=key, error=str(e))
+            raise ITGlueCacheError(f"Failed to check disk cache: {e}")
+
+    def tag(self, key: str, tags: Iterable[str], ttl: Optional[int] = None) -> None:
+        """Associate a cached key with invalidation tags."""
+        self.tag_many({key: list(tags)}, ttl)
+
+    def tag_many(
+        self, tags_by_key: Dict[str, List[str]], ttl: Optional[int] = None
+    ) -> None:
+        """Associate several cached keys with their tags in one transaction."""
+        try:
+            with self._connection() as conn:
+                # Keys that are not cached are skipped rather than orphaned
+                conn.executemany(
+                    "INSERT OR IGNORE INTO tags (tag, key) "
+                    "SELECT ?, key FROM entries WHERE key = ?",
+                    [
+                        (tag, key)
+                        for key, tags in tags_by_key.items()
+                        for tag in tags
+                    ],
+                )
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache tag error", error=str(e))
+            raise ITGlueCacheError(f"Failed to tag disk cache entry: {e}")
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete every key associated with a tag."""
+        try:
+            with self._connection() as conn:
+                return conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM tags WHERE tag = ?)",
+                    (tag,),
+                ).rowcount
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache invalidate error", tag=tag, error=str(e))
+            raise ITGlueCacheError(f"Failed to invalidate disk cache tag: {e}")
+
+    def entries(self) -> Iterator[Tuple[str, Dict[str, Any], Optional[float], List[str]]]:
+        """Iterate over unexpired entries without updating their read times."""
+        now = time.time()
+        try:
+            conn = self._connection()
+            tags_by_key: Dict[str, List[str]] = {}
+            for tag, key in conn.execute("SELECT tag, key FROM tags ORDER BY tag"):
+                tags_by_key.setdefault(key, []).append(tag)
+
+            rows = conn.execute(
+                "SELECT key, value, expires_at FROM entries "
+                "WHERE expires_at IS NULL OR expires_at > ?",
+                (now,),
+            ).fetchall()
+
+        except sqlite3.Error as e:
+            self.logger.error("Disk cache entries error", error=str(e))
+            raise ITGlueCacheError(f"Failed to list disk cache entries: {e}")
+
+        for key, data, expires_at in rows:
+            value = self._decode(key, data)
+            if value is not None:
+                remaining = expires_at - now if expires_at is not None else None
+                yield key, value, remaining, tags_by_key.get(key, [])
+
+    def close(self) -> None:
+        """Close every connection opened by this cache."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+class TieredCache(CacheBackend):
+    """Two-tier cache: an in-process L1 in front of a shared Redis L2.
+
+    Reads are served from L1 when possible and fall back to L2, copying the
+    value into L1. Writes go to both tiers and are broadcast over Redis
+    pub/sub so that other processes drop their L1 copies of changed keys.
+
+    Invalidation messages can be missed while a subscriber is disconnected,
+    so L1 entries live at most ``l1_ttl`` seconds, which bounds how long a
+    process can serve a value that was changed elsewhere.
+
+    Args:
+        l1: In-process cache
+        l2: Shared Redis cache
+        l1_ttl: Maximum lifetime of L1 entries in seconds
+        channel: Pub/sub channel, defaulting to ``<key_prefix>invalidate``
+        subscribe: Listen for invalidations from other processes
+    """
+
+    def __init__(
+        self,
+        l1: MemoryCache,
+        l2: RedisCache,
+        l1_ttl: int = 30,
+        channel: Optional[str] = None,
+        subscribe: bool = True,
+    ):
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.channel = channel or f"{l2.key_prefix}invalidate"
+        self.node_id = uuid.uuid4().hex
+        self.logger = structlog.get_logger().bind(component="tiered_cache")
+
+        # The subscriber thread changes L1 concurrently with callers
+        self._l1_lock = threading.RLock()
+        self._pubsub = None
+        self._listener = None
+        if subscribe:
+            self._subscribe()
+
+    def _subscribe(self) -> None:
+        """Start listening for invalidations in a background thread."""
+        try:
+            self._pubsub = self.l2.redis.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self.channel: self._handle_message})
+            self._listener = self._pubsub.run_in_thread(sleep_time=1, daemon=True)
+        except Exception as e:
+            self.logger.error("Redis subscribe error", error=str(e))
+            raise ITGlueCacheError(f"Failed to subscribe to invalidations: {e}")
+
+    def _l1_ttl(self, ttl: Optional[int]) -> int:
+        """Clamp a TTL to the L1 maximum."""
+        return min(ttl, self.l1_ttl) if ttl else self.l1_ttl
+
+    def _publish(self, keys: Optional[List[str]] = None) -> None:
+        """Tell other processes to drop keys from L1, or all of L1 if None."""
+        message = {"origin": self.node_id, "keys": keys}
+        try:
+            self.l2.redis.publish(self.channel, json.dumps(message))
+        except Exception as e:
+            # Peers fall back to their L1 TTL
+            self.logger.warning("Redis publish error", error=str(e))
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        """Apply an invalidation received from another process."""
+        try:
+            payload = json.loads(message["data"])
+        except (KeyError, TypeError, ValueError):
+            self.logger.warning("Malformed invalidation message")
+            return
+
+        if payload.get("origin") == self.node_id:
+            return
+
+        keys = payload.get("keys")
+        with self._l1_lock:
+            if keys is None:
+                self.l1.clear()
+            else:
+                for key in keys:
+                    self.l1.delete(key)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a value from L1, falling back to L2."""
+        with self._l1_lock:
+            value = self.l1.get(key)
+        if value is not None:
+            return value
+
+        value = self.l2.get(key)
+        if value is not None:
+            with self._l1_lock:
+                self.l1.set(key, value, self.l1_ttl)
+        return value
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get values from L1, fetching the rest from L2 in one batch."""
+        with self._l1_lock:
+            values = self.l1.get_many(keys)
+
+        missing = [key for key in keys if key not in values]
+        if missing:
+            fetched = self.l2.get_many(missing)
+            with self._l1_lock:
+                self.l1.set_many(fetched, self.l1_ttl)
+            values.update(fetched)
+        return values
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Set a value in both tiers and invalidate it in other processes."""
+        self.l2.set(key, value, ttl)
+        with self._l1_lock:
+            self.l1.set(key, value, self._l1_ttl(ttl))
+        self._publish([key])
+
+    def set_many(
+        self, items: Dict[str, Dict[str, Any]], ttl: Optional[int] = None
+    ) -> None:
+        """Set several values in both tiers."""
+        self.l2.set_many(items, ttl)
+        with self._l1_lock:
+            self.l1.set_many(items, self._l1_ttl(ttl))
+        self._publish(list(items))
+
+    def delete(self, key: str) -> None:
+        """Delete a value from both tiers and other processes' L1."""
+        self.l2.delete(key)
+        with self._l1_lock:
+            self.l1.delete(key)
+        self._publish([key])
+
+    def clear(self) -> None:
+        """Clear both tiers and other processes' L1."""
+        self.l2.clear()
+        with self._l1_lock:
+            self.l1.clear()
+        self._publish()
+
+    @property
+    def listener(self) -> Optional[Callable[[str, Any, int], None]]:
+        """Storage events of the shared tier; L1 evictions lose nothing."""
+        return self.l2.listener
+
+    @listener.setter
+    def listener(self, listener: Optional[Callable[[str, Any, int], None]]) -> None:
+        self.l2.listener = listener
+
+    def exists(self, key: str) -> bool:
+        """Check if a key exists in either tier."""
+        with self._l1_lock:
+            if self.l1.exists(key):
+                return True
+        return self.l2.exists(key)
+
+    def tag(self, key: str, tags: Iterable[str], ttl: Optional[int] = None) -> None:
+        """Tag a key in L2, where the shared tag index lives."""
+        self.l2.tag(key, tags, ttl)
+
+    def tag_many(
+        self, tags_by_key: Dict[str, List[str]], ttl: Optional[int] = None
+    ) -> None:
+        """Tag several keys in L2."""
+        self.l2.tag_many(tags_by_key, ttl)
+
+    def entries(self) -> Iterator[Tuple[str, Dict[str, Any], Optional[float], List[str]]]:
+        """Iterate over the entries of L2, which holds every entry."""
+        return self.l2.entries()
+
+    def acquire_lease(self, key: str, timeout: float) -> Optional[str]:
+        """Acquire a recompute lease shared through L2."""
+        return self.l2.acquire_lease(key, timeout)
+
+    def release_lease(self, key: str, token: str) -> None:
+        """Release a recompute lease held in L2."""
+        self.l2.release_lease(key, token)
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Delete a tag's keys from L2 and from every process's L1."""
+        keys = self.l2.pop_tag(tag)
+        if keys:
+            with self._l1_lock:
+                for key in keys:
+                    self.l1.delete(key)
+            self._publish(keys)
+        return len(keys)
+
+    def close(self) -> None:
+        """Stop listening for invalidations."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+
+class ModelCache:
+    """Decoded resources keyed by ``(type, id, updated-at)``.
+
+    Validating JSON into pydantic models can cost more than the request a
+    cache hit saved. ITGlue bumps ``updated-at`` on every change, so a
+    resource seen again with the same timestamp decodes to the same model
+    and can be copied from here instead of validated. The key also holds
+    the model class and the attribute names, so sparse fieldsets are
+    decoded separately.
+
+    Adding or removing a related record does not bump ``updated-at``, so
+    relationships are not cached: they are validated from each response,
+    which also gives every copy its own relationship objects.
+
+    Models are mutable, so the cache keeps its own copy and hands out
+    copies: the attributes and relationships of each are the caller's to
+    change. Copying costs a fraction of validation for flat resources and
+    about the same for ones made mostly of nested attributes, such as
+    flexible asset traits. Resources without an id or ``updated-at`` are
+    always validated.
+
+    Args:
+        max_size: Maximum number of models kept, least recently used first
+            out
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # Key -> (model, names of attributes holding dicts or lists)
+        self._models: "OrderedDict[Tuple[Any, ...], Tuple[Any, Tuple[str, ...]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(model_class: Any, data: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """Get the key of a resource, or None if it cannot be keyed."""
+        if not isinstance(data, dict):
+            return None
+        attributes = data.get("attributes")
+        if data.get("id") is None or not isinstance(attributes, dict):
+            return None
+        updated_at = attributes.get("updated-at", attributes.get("updated_at"))
+        if updated_at is None:
+            return None
+        return (
+            model_class,
+            data.get("type"),
+            str(data["id"]),
+            updated_at,
+            tuple(attributes),
+        )
+
+    @staticmethod
+    def _copy(model: Any, nested: Tuple[str, ...], relationships: Any = None) -> Any:
+        """Copy a model so that changes to it do not reach the cache.
+
+        Most attributes are scalars, so only those in ``nested`` need more
+        than a shallow copy. Relationships are validated from
+        ``relationships``, the raw JSON:API relationships object.
+        """
+        attributes = dict(model.attributes)
+        for name in nested:
+            attributes[name] = _copy_json(attributes[name])
+
+        copied = model.model_copy()
+        # Assigned directly: the values were validated with the original
+        copied.__dict__["attributes"] = attributes
+        copied.__dict__["relationships"] = (
+            None
+            if relationships is None
+            else _RELATIONSHIPS.validate_python(relationships)
+        )
+        return copied
+
+    def __len__(self) -> int:
+        """Get the number of cached models."""
+        return len(self._models)
+
+    def decode(self, model_class: Any, data: Dict[str, Any]) -> Any:
+        """Decode a resource, reusing a cached model of the same version.
+
+        Args:
+            model_class: Resource model with a ``from_api_dict`` constructor
+            data: JSON:API resource object
+
+        Returns:
+            A model instance owned by the caller
+        """
+        key = self._key(model_class, data)
+        if key is None:
+            return model_class.from_api_dict(data)
+
+        with self._lock:
+            cached = self._models.get(key)
+            if cached is not None:
+                self._models.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if cached is not None:
+            return self._copy(*cached, data.get("relationships"))
+
+        model = model_class.from_api_dict(data)
+        nested = tuple(
+            name
+            for name, value in model.attributes.items()
+            if isinstance(value, (dict, list))
+        )
+        cached = (self._copy(model, nested), nested)
+        with self._lock:
+            self._models[key] = cached
+            self._models.move_to_end(key)
+            while len(self._models) > self.max_size:
+                self._models.popitem(last=False)
+        return model
+
+    def clear(self) -> None:
+        """Drop every cached model."""
+        with self._lock:
+            self._models.clear()
+
+    def snapshot(self) -> Dict[str, int]:
+        """Get the hit and miss counts and the number of cached models."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._models)}
+
+
+class CacheStats:
+    """Thread-safe cache counters, broken down by endpoint prefix.
+
+    The prefix is the first segment of the endpoint path, so
+    ``/organizations/5/relationships/configurations`` is counted under
+    ``/organizations``. Events a backend cannot attribute to an endpoint,
+    such as purges of rows it has not read, are counted under ``other``.
+    """
+
+    COUNTERS = (
+        "hits",
+        "stale_hits",
+        "misses",
+        "sets",
+        "evictions",
+        "expirations",
+        "rejections",
+        "bytes_written",
+    )
+    OPERATIONS = ("get", "set")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def endpoint_prefix(endpoint: str) -> str:
+        """Get the prefix an endpoint is counted under."""
+        segments = [part for part in endpoint.split("?")[0].split("/") if part]
+        return f"/{segments[0]}" if segments else "/"
+
+    @classmethod
+    def _empty(cls) -> Dict[str, float]:
+        """Get a zeroed set of raw counters."""
+        counters: Dict[str, float] = dict.fromkeys(cls.COUNTERS, 0)
+        for operation in cls.OPERATIONS:
+            counters[f"{operation}_calls"] = 0
+            counters[f"{operation}_seconds"] = 0.0
+            counters[f"{operation}_max_seconds"] = 0.0
+        return counters
+
+    def _counters(self, prefix: str) -> Dict[str, float]:
+        """Get an endpoint's raw counters, creating them on first use."""
+        counters = self._endpoints.get(prefix)
+        if counters is None:
+            counters = self._endpoints[prefix] = self._empty()
+        return counters
+
+    def incr(self, prefix: str, counter: str, amount: int = 1) -> None:
+        """Add to a counter."""
+        with self._lock:
+            self._counters(prefix)[counter] += amount
+
+    def observe(self, prefix: str, operation: str, seconds: float) -> None:
+        """Record the latency of a backend ``get`` or ``set``."""
+        with self._lock:
+            counters = self._counters(prefix)
+            counters[f"{operation}_calls"] += 1
+            counters[f"{operation}_seconds"] += seconds
+            if seconds > counters[f"{operation}_max_seconds"]:
+                counters[f"{operation}_max_seconds"] = seconds
+
+    @classmethod
+    def _summarize(cls, counters: Dict[str, float]) -> Dict[str, Any]:
+        """Turn raw counters into the reported figures."""
+        summary: Dict[str, Any] = {name: counters[name] for name in cls.COUNTERS}
+        lookups = counters["hits"] + counters["misses"]
+        summary["hit_ratio"] = counters["hits"] / lookups if lookups else 0.0
+
+        for operation in cls.OPERATIONS:
+            calls = counters[f"{operation}_calls"]
+            total = counters[f"{operation}_seconds"]
+            summary[f"{operation}_latency_ms"] = {
+                "calls": calls,
+                "avg": total / calls * 1000 if calls else 0.0,
+                "max": counters[f"{operation}_max_seconds"] * 1000,
+            }
+        return summary
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get totals plus a per-endpoint breakdown under ``endpoints``."""
+        with self._lock:
+            endpoints = {
+                prefix: dict(counters) for prefix, counters in self._endpoints.items()
+            }
+
+        totals = self._empty()
+        for counters in endpoints.values():
+            for name, value in counters.items():
+                if name.endswith("_max_seconds"):
+                    totals[name] = max(totals[name], value)
+                else:
+                    totals[name] += value
+
+        result = self._summarize(totals)
+        result["endpoints"] = {
+            prefix: self._summarize(counters)
+            for prefix, counters in sorted(endpoints.items())
+        }
+        return result
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        with self._lock:
+            self._endpoints.clear()
+
+
 class CacheManager:
-    """Manages caching for ITGlue API responses."""
+    """Manages caching for ITGlue API responses.
+
+    Entries are stored with a soft expiry of ``cache_ttl`` and kept by the
+    backend for a further ``cache_stale_ttl`` seconds. Callers that pass a
+    ``refresh`` function to :meth:`get` are served stale entries from that
+    window immediately while the entry is refetched in the background.
+    With ``cache_refresh_ahead`` set, an entry read during the final
+    fraction of its TTL is refreshed before it expires, so keys that keep
+    being read never go stale.
+
+    With ``cache_model_max_size`` set, :meth:`decode` also keeps decoded
+    models, so cache hits skip validation too (see :class:`ModelCache`).
+
+    A miss on a :meth:`get` with ``refresh`` hands the caller a lease on
+    the key: that caller fetches and sets the value, while other
+    threads, and other processes sharing a Redis backend, wait up to
+    ``cache_lease_timeout`` seconds for it instead of calling ITGlue too.
+    Callers that fail to fetch release the lease with :meth:`release_lease`.
+
+    With ``cache_normalize`` set, JSON:API responses are stored as
+    ``(type, id)`` references and each resource is stored once as an
+    entity, shared by every response that lists or includes it. Writing a
+    new version with :meth:`put_entities` updates all of those responses
+    at once; a response whose entities have been evicted is a miss. With
+    ``cache_max_bytes`` set, memory caches bound entities by size only, so
+    they do not crowd responses out of the entry limit. Scan snapshot
+    pages are stored whole.
+    """
 
     def __init__(self, config: ITGlueConfig):
         self.config = config
         self.logger = structlog.get_logger().bind(component="cache_manager")
+        self._refresh_lock = threading.Lock()
+        self._refreshing: Dict[str, Future] = {}
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._lease_lock = threading.Lock()
+        # Key -> (event set when filled, backend lease token, lapse time)
+        self._leases: Dict[str, Tuple[threading.Event, Optional[str], float]] = {}
+        self.stats = CacheStats()
+        self.models: Optional[ModelCache] = None
+        if config.enable_caching and config.cache_model_max_size > 0:
+            self.models = ModelCache(config.cache_model_max_size)
+        self.ttl_policies = {
+            self._policy_key(key): ttl
+            for policies in (DEFAULT_TTL_POLICIES, config.cache_ttl_policies)
+            for key, ttl in policies.items()
+        }
 
         # Initialize cache backend
         if not config.enable_caching:
             self.backend = None
             self.logger.info("Caching disabled")
         elif config.cache_type == "memory":
-            self.backend = MemoryCache(max_size=1000)  # Default max size
+            self.backend = self._create_memory_backend()
             self.logger.info("Using memory cache")
-        elif config.cache_type == "redis":
+        elif config.cache_type in ("redis", "tiered"):
             if config.redis_url:
                 try:
-                    import redis
-
-                    redis_client = redis.from_url(config.redis_url)
-                    self.backend = RedisCache(redis_client)
-                    self.logger.info("Using Redis cache", url=config.redis_url)
-                except ImportError:
+                    redis_cache = self._create_redis_backend()
+                    if config.cache_type == "tiered":
+                        self.backend = TieredCache(
+                            self._create_memory_backend(),
+                            redis_cache,
+                            l1_ttl=config.cache_l1_ttl,
+                        )
+                    else:
+                        self.backend = redis_cache
+                    self.logger.info(
+                        "Using Redis cache",
+                        url=config.redis_url,
+                        tiered=config.cache_type == "tiered",
+                        max_connections=config.redis_max_connections,
+                    )
+                except ImportError as e:
                     self.logger.warning(
-                        "Redis not available, falling back to memory cache"
+                        "Redis not available, falling back to memory cache",
+                        error=str(e),
                     )
-                    self.backend = MemoryCache(max_size=1000)
+                    self.backend = self._create_memory_backend()
                 except Exception as e:
                     self.logger.error("Failed to connect to Redis", error=str(e))
-                    self.backend = MemoryCache(max_size=1000)
+                    self.backend = self._create_memory_backend()
             else:
                 self.logger.warning("Redis URL not provided, using memory cache")
-                self.backend = MemoryCache(max_size=1000)
+                self.backend = self._create_memory_backend()
+        elif config.cache_type == "disk":
+            path = config.cache_disk_path or os.path.join(
+                os.path.expanduser("~"), ".cache", "itglue", "cache.sqlite3"
+            )
+            try:
+                self.backend = DiskCache(
+                    path,
+                    ttl=None,
+                    max_bytes=config.cache_max_bytes,
+                    codec=CacheCodec(
+                        serializer=config.cache_serializer,
+                        compression=config.cache_compression,
+                        compress_threshold=config.cache_compress_threshold,
+                    ),
+                )
+                self.logger.info("Using disk cache", path=path)
+            except Exception as e:
+                self.logger.error("Failed to open disk cache", error=str(e))
+                self.backend = self._create_memory_backend()
         else:
             self.logger.warning(
                 f"Unknown cache backend: {config.cache_type}, using memory"
             )
-            self.backend = MemoryCache(max_size=1000)
+            self.backend = self._create_memory_backend()
+
+        if self.backend:
+            self.backend.listener = self._on_backend_event
+
+    def _on_backend_event(self, event: str, value: Any, size: int) -> None:
+        """Count a backend storage event under the entry's endpoint."""
+        prefix = "other"
+        if isinstance(value, dict) and _ENTRY_MARKER in value:
+            prefix = value.get("endpoint", prefix)
+
+        if event == "set":
+            self.stats.incr(prefix, "bytes_written", size)
+        elif event == "eviction":
+            self.stats.incr(prefix, "evictions")
+        elif event == "expiration":
+            self.stats.incr(prefix, "expirations")
+        elif event == "rejection":
+            self.stats.incr(prefix, "rejections")
+
+    @staticmethod
+    def _policy_key(key: str) -> str:
+        """Normalize a TTL policy key.
+
+        Endpoint prefixes lose any trailing slash; resource types are written
+        with underscores, as in endpoint paths, even where JSON:API types use
+        hyphens (``configuration-types``).
+        """
+        if key.startswith("/"):
+            return "/" + key.strip("/")
+        return key.replace("-", "_")
+
+    def ttl_for(self, endpoint: str) -> int:
+        """Get the TTL policy for an endpoint.
+
+        The most specific matching endpoint prefix wins, then the resource
+        type (the last path segment that is not an ID), then ``cache_ttl``.
+        """
+        segments = [part for part in endpoint.split("?")[0].split("/") if part]
+
+        for end in range(len(segments), 0, -1):
+            ttl = self.ttl_policies.get("/" + "/".join(segments[:end]))
+            if ttl is not None:
+                return ttl
+
+        for segment in reversed(segments):
+            if not segment.isdigit():
+                ttl = self.ttl_policies.get(self._policy_key(segment))
+                if ttl is not None:
+                    return ttl
+                break
+
+        return self.config.cache_ttl
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Hits, misses, sets, evictions, expirations, admission rejections,
+            bytes written and backend latency, in total and per endpoint
+            prefix, plus the bytes currently stored when the backend tracks
+            them and the model cache counts when it is enabled
+        """
+        stats = self.stats.snapshot()
+        stats["models"] = self.models.snapshot() if self.models else None
+        stats["bytes_stored"] = None
+        if self.backend:
+            try:
+                stats["bytes_stored"] = self.backend.stored_bytes()
+            except Exception as e:
+                self.logger.error("Cache stats error", error=str(e))
+        return stats
+
+    def reset_stats(self) -> None:
+        """Zero the cache statistics."""
+        self.stats.reset()
+
+    def _create_redis_backend(self) -> "RedisCache":
+        """Create the Redis backend with a bounded connection pool."""
+        import redis
+
+        # A blocking pool waits for a free connection rather than opening
+        # more than the configured number
+        pool = redis.BlockingConnectionPool.from_url(
+            self.config.redis_url,
+            max_connections=self.config.redis_max_connections,
+        )
+        return RedisCache(
+            redis.Redis(connection_pool=pool),
+            codec=CacheCodec(
+                serializer=self.config.cache_serializer,
+                compression=self.config.cache_compression,
+                compress_threshold=self.config.cache_compress_threshold,
+            ),
+        )
+
+    def _create_memory_backend(self) -> Union["MemoryCache", "ShardedMemoryCache"]:
+        """Create the in-memory backend with the configured size limits."""
+        if self.config.cache_memory_shards > 1:
+            return ShardedMemoryCache(
+                shards=self.config.cache_memory_shards,
+                max_size=1000,
+                max_bytes=self.config.cache_max_bytes,
+                max_rss_bytes=self.config.cache_max_rss_bytes,
+                admission=self.config.cache_admission,
+                uncounted_prefix=_ENTITY_KEY_PREFIX,
+            )
+        return MemoryCache(
+            max_size=1000,  # Default max size
+            max_bytes=self.config.cache_max_bytes,
+            max_rss_bytes=self.config.cache_max_rss_bytes,
+            admission=self.config.cache_admission,
+            uncounted_prefix=_ENTITY_KEY_PREFIX,
+        )
 
     def _generate_cache_key(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         method: str = "GET",
+        snapshot_id: Optional[str] = None,
     ) -> str:
         """Generate cache key for request."""
         # Create a consistent cache key
@@ -270,6 +2078,10 @@ class CacheManager:
         if params:
             key_data["params"] = dict(sorted(params.items()))
 
+        # Pages fetched as part of a multi-page scan are scoped to that scan
+        if snapshot_id:
+            key_data["snapshot"] = snapshot_id
+
         key_string = json.dumps(key_data, sort_keys=True)
         cache_key = hashlib.md5(key_string.encode()).hexdigest()
 
@@ -280,25 +2092,207 @@ class CacheManager:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         method: str = "GET",
+        snapshot_id: Optional[str] = None,
+        refresh: Optional[Callable[[], Dict[str, Any]]] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Get cached response."""
+        """Get cached response.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            method: HTTP method or cache namespace
+            snapshot_id: Scan snapshot the entry belongs to
+            refresh: Function that refetches the response. When given, a
+                stale entry is returned and refreshed in the background;
+                without it, stale entries are treated as misses.
+
+        Returns:
+            Cached response data, or None
+        """
         if not self.backend:
             return None
 
-        cache_key = self._generate_cache_key(endpoint, params, method)
+        # Uncached endpoints (passwords) never fill, so don't wait on a lease
+        if self.ttl_for(endpoint) <= 0:
+            return None
+
+        cache_key = self._generate_cache_key(endpoint, params, method, snapshot_id)
+        prefix = CacheStats.endpoint_prefix(endpoint)
 
+        started = perf_counter()
         try:
-            result = self.backend.get(cache_key)
-            if result:
-                self.logger.debug("Cache hit", endpoint=endpoint, key=cache_key)
-            else:
-                self.logger.debug("Cache miss", endpoint=endpoint, key=cache_key)
-            return result
+            entry = self.backend.get(cache_key)
+        except Exception as e:
+            self.logger.error("Cache get error", error=str(e))
+            self.stats.incr(prefix, "misses")
+            return None
+        finally:
+            self.stats.observe(prefix, "get", perf_counter() - started)
+
+        data = self._unwrap(entry, cache_key, endpoint, params, method, refresh)
+        if data is None and refresh is not None and self.config.cache_lease_timeout:
+            return self._wait_or_lease(cache_key, endpoint, params, method)
+        return data
+
+    def _wait_or_lease(
+        self,
+        cache_key: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        method: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Wait for another caller's fetch of a missed key, or take the lease.
+
+        Returns:
+            The value filled in by another caller, or None if this caller
+            should fetch it (holding the lease, or after waiting in vain)
+        """
+        timeout = self.config.cache_lease_timeout
+        deadline = perf_counter() + timeout
+
+        with self._lease_lock:
+            lease = self._leases.get(cache_key)
+            if lease is not None and lease[2] <= perf_counter():
+                # The holder never set the value nor released the lease
+                lease = None
+            if lease is None:
+                event = threading.Event()
+                self._leases[cache_key] = (event, None, deadline)
+
+        if lease is not None:
+            # Another thread in this process is fetching
+            lease[0].wait(max(0.0, lease[2] - perf_counter()))
+            return self._peek(cache_key, endpoint, params, method)
+
+        try:
+            token = self.backend.acquire_lease(cache_key, timeout)
+        except Exception as e:
+            self.logger.error("Cache lease error", error=str(e))
+            token = ""
+
+        if token is not None:
+            with self._lease_lock:
+                self._leases[cache_key] = (event, token, deadline)
+            self.logger.debug("Acquired cache lease", endpoint=endpoint)
+            return None
+
+        # Another process is fetching; poll for its result
+        data = None
+        while data is None and perf_counter() < deadline:
+            event.wait(min(0.05, max(0.0, deadline - perf_counter())))
+            data = self._peek(cache_key, endpoint, params, method)
 
+        if data is not None:
+            self._finish_lease(cache_key)
+        return data
+
+    def _peek(
+        self,
+        cache_key: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        method: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Read a fresh value without statistics, refreshes or leases."""
+        try:
+            entry = self.backend.get(cache_key)
         except Exception as e:
             self.logger.error("Cache get error", error=str(e))
             return None
 
+        if not entry:
+            return None
+        if _ENTRY_MARKER not in entry:
+            return entry
+        if time.time() >= entry["fresh_until"]:
+            return None
+        return self._hydrate(entry["data"])
+
+    def _finish_lease(self, cache_key: str) -> None:
+        """Release a key's lease and wake the callers waiting for it."""
+        with self._lease_lock:
+            lease = self._leases.pop(cache_key, None)
+        if lease is None:
+            return
+
+        event, token, _ = lease
+        if token:
+            try:
+                self.backend.release_lease(cache_key, token)
+            except Exception as e:
+                self.logger.error("Cache lease error", error=str(e))
+        event.set()
+
+    def release_lease(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        snapshot_id: Optional[str] = None,
+    ) -> None:
+        """Give up the lease from a missed :meth:`get` without setting a value.
+
+        Call this when fetching the value fails, so that waiting callers
+        fetch it themselves rather than waiting out the lease timeout.
+        """
+        if not self.backend:
+            return
+
+        self._finish_lease(
+            self._generate_cache_key(endpoint, params, method, snapshot_id)
+        )
+
+    def _unwrap(
+        self,
+        entry: Optional[Dict[str, Any]],
+        cache_key: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        method: str,
+        refresh: Optional[Callable[[], Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Unwrap a backend entry, applying staleness and refresh rules."""
+        prefix = CacheStats.endpoint_prefix(endpoint)
+
+        if not entry:
+            self.logger.debug("Cache miss", endpoint=endpoint, key=cache_key)
+            self.stats.incr(prefix, "misses")
+            return None
+
+        if _ENTRY_MARKER not in entry:
+            # Written directly to the backend without an envelope
+            self.stats.incr(prefix, "hits")
+            return entry
+
+        now = time.time()
+        fresh_until = entry["fresh_until"]
+
+        if now >= fresh_until:
+            if refresh is None:
+                self.logger.debug("Cache stale", endpoint=endpoint, key=cache_key)
+                self.stats.incr(prefix, "misses")
+                return None
+            self.logger.debug("Serving stale entry", endpoint=endpoint, key=cache_key)
+            self.stats.incr(prefix, "stale_hits")
+            self._schedule_refresh(
+                cache_key, endpoint, params, method, entry["ttl"], refresh
+            )
+        elif refresh is not None and self.config.cache_refresh_ahead:
+            if fresh_until - now <= entry["ttl"] * self.config.cache_refresh_ahead:
+                self._schedule_refresh(
+                    cache_key, endpoint, params, method, entry["ttl"], refresh
+                )
+
+        data = self._hydrate(entry["data"])
+        if data is None:
+            self.logger.debug("Cache entities missing", endpoint=endpoint, key=cache_key)
+            self.stats.incr(prefix, "misses")
+            return None
+
+        self.logger.debug("Cache hit", endpoint=endpoint, key=cache_key)
+        self.stats.incr(prefix, "hits")
+        return data
+
     def set(
         self,
         endpoint: str,
@@ -306,25 +2300,445 @@ class CacheManager:
         params: Optional[Dict[str, Any]] = None,
         method: str = "GET",
         ttl: Optional[int] = None,
+        snapshot_id: Optional[str] = None,
     ) -> None:
-        """Cache response data."""
+        """Cache response data.
+
+        Args:
+            endpoint: API endpoint
+            response_data: Response to cache
+            params: Query parameters
+            method: HTTP method or cache namespace
+            ttl: Time to live, overriding the endpoint's TTL policy (see
+                :meth:`ttl_for`); 0 skips caching. Endpoints whose policy
+                is 0 are never cached, since :meth:`get` does not read them.
+            snapshot_id: Scan snapshot the entry belongs to
+        """
         if not self.backend:
             return
 
-        cache_key = self._generate_cache_key(endpoint, params, method)
+        cache_key = self._generate_cache_key(endpoint, params, method, snapshot_id)
 
-        # Use configured TTL if not provided
+        # Use the endpoint's TTL policy if not provided
+        policy_ttl = self.ttl_for(endpoint)
         if ttl is None:
-            ttl = self.config.cache_ttl
+            ttl = policy_ttl
+        if ttl <= 0 or policy_ttl <= 0:
+            self._finish_lease(cache_key)
+            return
 
+        prefix = CacheStats.endpoint_prefix(endpoint)
+        started = perf_counter()
         try:
-            self.backend.set(cache_key, response_data, ttl)
+            backend_ttl = ttl + self.config.cache_stale_ttl
+            stored, entities = self._normalize(response_data, ttl, snapshot_id)
+            if entities:
+                self.backend.set_many(entities, backend_ttl)
+            self.backend.set(cache_key, self._wrap(stored, ttl, endpoint), backend_ttl)
+            self.backend.tag(
+                cache_key,
+                self._entry_tags(endpoint, params, response_data, bool(entities)),
+                backend_ttl,
+            )
+            self.stats.incr(prefix, "sets")
             self.logger.debug(
                 "Cached response", endpoint=endpoint, key=cache_key, ttl=ttl
             )
 
         except Exception as e:
             self.logger.error("Cache set error", error=str(e))
+        finally:
+            self.stats.observe(prefix, "set", perf_counter() - started)
+            self._finish_lease(cache_key)
+
+    @staticmethod
+    def _wrap(response_data: Dict[str, Any], ttl: int, endpoint: str) -> Dict[str, Any]:
+        """Wrap response data in an entry carrying its soft expiry."""
+        return {
+            _ENTRY_MARKER: 1,
+            "data": response_data,
+            "fresh_until": time.time() + ttl,
+            "ttl": ttl,
+            "endpoint": CacheStats.endpoint_prefix(endpoint),
+        }
+
+    def get_many(
+        self,
+        endpoint: str,
+        params_list: List[Optional[Dict[str, Any]]],
+        method: str = "GET",
+        snapshot_id: Optional[str] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Get cached responses for several queries of one endpoint.
+
+        The backend is read in a single batch, e.g. one round trip to Redis.
+        Stale entries are treated as misses.
+
+        Args:
+            endpoint: API endpoint
+            params_list: Query parameters of each request
+            method: HTTP method or cache namespace
+            snapshot_id: Scan snapshot the entries belong to
+
+        Returns:
+            Cached response data or None for each query, in order
+        """
+        if not self.backend:
+            return [None] * len(params_list)
+
+        keys = [
+            self._generate_cache_key(endpoint, params, method, snapshot_id)
+            for params in params_list
+        ]
+
+        prefix = CacheStats.endpoint_prefix(endpoint)
+        started = perf_counter()
+        try:
+            entries = self.backend.get_many(keys)
+        except Exception as e:
+            self.logger.error("Cache get error", error=str(e))
+            self.stats.incr(prefix, "misses", len(keys))
+            return [None] * len(params_list)
+        finally:
+            self.stats.observe(prefix, "get", perf_counter() - started)
+
+        return [
+            self._unwrap(entries.get(key), key, endpoint, params, method, None)
+            for key, params in zip(keys, params_list)
+        ]
+
+    def set_many(
+        self,
+        endpoint: str,
+        responses: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]],
+        method: str = "GET",
+        ttl: Optional[int] = None,
+        snapshot_id: Optional[str] = None,
+    ) -> None:
+        """Cache responses for several queries of one endpoint in one batch.
+
+        Args:
+            endpoint: API endpoint
+            responses: ``(params, response_data)`` pairs
+            method: HTTP method or cache namespace
+            ttl: Time to live, overriding the endpoint's TTL policy
+            snapshot_id: Scan snapshot the entries belong to
+        """
+        if not self.backend or not responses:
+            return
+
+        policy_ttl = self.ttl_for(endpoint)
+        if ttl is None:
+            ttl = policy_ttl
+        if ttl <= 0 or policy_ttl <= 0:
+            return
+
+        entities = {}
+        items = {}
+        tags_by_key = {}
+        for params, response_data in responses:
+            key = self._generate_cache_key(endpoint, params, method, snapshot_id)
+            stored, response_entities = self._normalize(
+                response_data, ttl, snapshot_id
+            )
+            entities.update(response_entities)
+            items[key] = self._wrap(stored, ttl, endpoint)
+            tags_by_key[key] = self._entry_tags(
+                endpoint, params, response_data, bool(response_entities)
+            )
+
+        prefix = CacheStats.endpoint_prefix(endpoint)
+        started = perf_counter()
+        try:
+            backend_ttl = ttl + self.config.cache_stale_ttl
+            # Entities first, so no response is stored without them
+            self.backend.set_many({**entities, **items}, backend_ttl)
+            self.backend.tag_many(tags_by_key, backend_ttl)
+            self.stats.incr(prefix, "sets", len(items))
+            self.logger.debug(
+                "Cached responses", endpoint=endpoint, count=len(items), ttl=ttl
+            )
+
+        except Exception as e:
+            self.logger.error("Cache set error", error=str(e))
+        finally:
+            self.stats.observe(prefix, "set", perf_counter() - started)
+
+    def _entity_key(self, resource_type: str, resource_id: Any) -> str:
+        """Get the backend key of a normalized resource."""
+        endpoint = f"/{self._policy_key(resource_type)}/{resource_id}"
+        return _ENTITY_KEY_PREFIX + self._generate_cache_key(endpoint, method="ENTITY")
+
+    @staticmethod
+    def _ref(resource: Any) -> Optional[List[str]]:
+        """Get the ``[type, id]`` reference of a JSON:API resource object."""
+        if isinstance(resource, dict) and "type" in resource and "id" in resource:
+            return [resource["type"], str(resource["id"])]
+        return None
+
+    def _normalize(
+        self, response_data: Any, ttl: int, snapshot_id: Optional[str] = None
+    ) -> Tuple[Any, Dict[str, Dict[str, Any]]]:
+        """Split a JSON:API response into references and entities.
+
+        Scan snapshot pages are kept whole, so a snapshot does not change
+        when the shared entities are written through.
+
+        Returns:
+            The value to store for the response and the wrapped entities to
+            store by key, or the response unchanged and no entities when
+            normalization is off, the response belongs to a snapshot or it
+            is not a JSON:API document
+        """
+        if not (
+            self.config.cache_normalize
+            and snapshot_id is None
+            and isinstance(response_data, dict)
+            and "data" in response_data
+        ):
+            return response_data, {}
+
+        data = response_data["data"]
+        many = isinstance(data, list)
+        resources = data if many else [data]
+        included = response_data.get("included") or []
+        if not isinstance(included, list):
+            return response_data, {}
+
+        refs = [self._ref(resource) for resource in resources]
+        included_refs = [self._ref(resource) for resource in included]
+        if any(ref is None for ref in refs + included_refs):
+            return response_data, {}
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        for resource in resources + included:
+            key = self._entity_key(resource["type"], resource["id"])
+            merged[key] = self._merge_entity(merged.get(key), resource)
+        entities = {
+            key: self._wrap(resource, ttl, "/" + self._policy_key(resource["type"]))
+            for key, resource in self._merge_cached_entities(merged).items()
+        }
+
+        stored = {
+            key: value
+            for key, value in response_data.items()
+            if key not in ("data", "included")
+        }
+        stored[_REFS_MARKER] = {"many": many, "data": refs}
+        if "included" in response_data:
+            stored[_REFS_MARKER]["included"] = included_refs
+        return stored, entities
+
+    @staticmethod
+    def _merge_entity(
+        existing: Optional[Dict[str, Any]], resource: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge a resource object into another version of the same entity.
+
+        List items and included resources can carry fewer attributes and
+        relationships than a detail response. Members the new resource
+        carries win; the rest are kept, so a sparse representation never
+        drops data that a fuller one cached.
+        """
+        if not existing:
+            return resource
+
+        merged = {**existing, **resource}
+        for member in ("attributes", "relationships"):
+            old, new = existing.get(member), resource.get(member)
+            if isinstance(old, dict) and isinstance(new, dict):
+                merged[member] = {**old, **new}
+        return merged
+
+    def _merge_cached_entities(
+        self, resources: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Merge resource objects by entity key into their cached versions."""
+        try:
+            entries = self.backend.get_many(list(resources))
+        except Exception as e:
+            self.logger.error("Cache get error", error=str(e))
+            return resources
+
+        return {
+            key: (
+                self._merge_entity(entries[key]["data"], resource)
+                if _ENTRY_MARKER in entries.get(key, {})
+                else resource
+            )
+            for key, resource in resources.items()
+        }
+
+    def _hydrate(self, data: Any) -> Any:
+        """Rebuild a normalized response from its entities.
+
+        Returns:
+            The response (other values unchanged), or None if any of its
+            entities has expired, been evicted or been invalidated
+        """
+        if not isinstance(data, dict) or _REFS_MARKER not in data:
+            return data
+
+        refs = data[_REFS_MARKER]
+        all_refs = refs["data"] + refs.get("included", [])
+        keys = [self._entity_key(resource_type, id_) for resource_type, id_ in all_refs]
+
+        try:
+            entries = self.backend.get_many(keys) if keys else {}
+        except Exception as e:
+            self.logger.error("Cache get error", error=str(e))
+            return None
+
+        resources = []
+        for key in keys:
+            entry = entries.get(key)
+            if not entry or _ENTRY_MARKER not in entry:
+                return None
+            resources.append(entry["data"])
+
+        count = len(refs["data"])
+        response = {"data": resources[:count] if refs["many"] else resources[0]}
+        response.update(
+            (key, value) for key, value in data.items() if key != _REFS_MARKER
+        )
+        if "included" in refs:
+            response["included"] = resources[count:]
+        return response
+
+    def _entry_tags(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        response_data: Any,
+        normalized: bool,
+    ) -> List[str]:
+        """Get the invalidation tags of a cached response.
+
+        Normalized responses are not tagged with their resources, since
+        they read them from the entities. Responses whose membership
+        depends on attribute values (filtered, sorted or nested lists) are
+        tagged ``query:<type>`` for :meth:`invalidate_queries`.
+        """
+        tags = self._endpoint_tags(endpoint)
+        if not normalized:
+            tags += self._resource_tags(response_data)
+
+        segments = [part for part in endpoint.split("?")[0].split("/") if part]
+        nested = len(segments) > 2 or (len(segments) == 2 and not segments[1].isdigit())
+        if nested or any(
+            key == "sort" or key.startswith("filter[") for key in (params or {})
+        ):
+            resource_type = next(
+                (part for part in reversed(segments) if not part.isdigit()), None
+            )
+            if resource_type:
+                tags.append(f"query:{self._policy_key(resource_type)}")
+        return tags
+
+    def put_entities(
+        self, resources: Iterable[Dict[str, Any]], ttl: Optional[int] = None
+    ) -> None:
+        """Write resources through to the normalized entity cache.
+
+        Cached responses that reference the resources see the new versions
+        without being refetched. Attributes and relationships the resources
+        omit keep their cached values. Does nothing unless
+        ``cache_normalize`` is set.
+
+        Args:
+            resources: JSON:API resource objects with ``type`` and ``id``
+            ttl: Time to live, overriding each type's TTL policy; with a TTL
+                of 0 the cached entity is dropped instead
+        """
+        if not self.backend or not self.config.cache_normalize:
+            return
+
+        for resource in resources:
+            if self._ref(resource) is None:
+                continue
+
+            endpoint = "/" + self._policy_key(resource["type"])
+            key = self._entity_key(resource["type"], resource["id"])
+            entity_ttl = self.ttl_for(endpoint) if ttl is None else ttl
+
+            try:
+                if entity_ttl <= 0:
+                    self.backend.delete(key)
+                    continue
+                resource = self._merge_cached_entities({key: resource})[key]
+                self.backend.set(
+                    key,
+                    self._wrap(resource, entity_ttl, endpoint),
+                    entity_ttl + self.config.cache_stale_ttl,
+                )
+                self.logger.debug(
+                    "Wrote entity through",
+                    resource_type=resource["type"],
+                    resource_id=resource["id"],
+                )
+            except Exception as e:
+                self.logger.error("Cache set error", error=str(e))
+
+    def get_entity(
+        self, resource_type: str, resource_id: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Get a normalized resource by type and ID, if cached."""
+        if not self.backend:
+            return None
+
+        try:
+            entry = self.backend.get(self._entity_key(resource_type, resource_id))
+        except Exception as e:
+            self.logger.error("Cache get error", error=str(e))
+            return None
+
+        if not entry or _ENTRY_MARKER not in entry:
+            return None
+        return entry["data"]
+
+    def _schedule_refresh(
+        self,
+        cache_key: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        method: str,
+        ttl: int,
+        refresh: Callable[[], Dict[str, Any]],
+    ) -> None:
+        """Refresh an entry in the background, at most once at a time per key."""
+
+        def _run() -> None:
+            token = None
+            try:
+                # Other processes sharing the backend keep serving stale data
+                token = self.backend.acquire_lease(
+                    cache_key, self.config.cache_lease_timeout or 30
+                )
+                if token is None:
+                    return
+                self.set(endpoint, refresh(), params, method, ttl=ttl)
+                self.logger.debug("Refreshed cache entry", endpoint=endpoint)
+            except Exception as e:
+                self.logger.warning(
+                    "Background cache refresh failed", endpoint=endpoint, error=str(e)
+                )
+            finally:
+                if token:
+                    try:
+                        self.backend.release_lease(cache_key, token)
+                    except Exception as e:
+                        self.logger.error("Cache lease error", error=str(e))
+                with self._refresh_lock:
+                    self._refreshing.pop(cache_key, None)
+
+        with self._refresh_lock:
+            if cache_key in self._refreshing:
+                return
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="itglue-cache-refresh"
+                )
+            self._refreshing[cache_key] = self._refresh_executor.submit(_run)
 
     def delete(
         self,
@@ -345,8 +2759,25 @@ class CacheManager:
         except Exception as e:
             self.logger.error("Cache delete error", error=str(e))
 
+    def decode(self, model_class: Any, data: Dict[str, Any]) -> Any:
+        """Decode a JSON:API resource into a model.
+
+        Args:
+            model_class: Resource model with a ``from_api_dict`` constructor
+            data: JSON:API resource object
+
+        Returns:
+            A model instance, copied from the model cache when it holds the
+            same version of the resource
+        """
+        if self.models is None:
+            return model_class.from_api_dict(data)
+        return self.models.decode(model_class, data)
+
     def clear(self) -> None:
         """Clear all cached data."""
+        if self.models is not None:
+            self.models.clear()
         if not self.backend:
             return
 
@@ -357,17 +2788,472 @@ class CacheManager:
         except Exception as e:
             self.logger.error("Cache clear error", error=str(e))
 
+    def close(self) -> None:
+        """Stop background refreshes and release backend resources."""
+        with self._refresh_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if self.backend:
+            self.backend.close()
+
+    def export_snapshot(self, path: str) -> int:
+        """Write every live cache entry to a snapshot file.
+
+        The file is gzip-compressed JSON lines: a header, then one line per
+        entry with its key, value, remaining lifetime and invalidation tags.
+        Values keep their freshness metadata (soft expiry and TTL), so an
+        imported entry goes stale when the original would have. Keys do not
+        depend on the backend, so a snapshot from one backend or host loads
+        into any other. The file is replaced atomically and is readable by
+        its owner only. Entries from endpoints that can carry secrets, such
+        as password details, are never written, even if a TTL policy caches
+        them.
+
+        Args:
+            path: File to write
+
+        Returns:
+            Number of entries written
+
+        Raises:
+            ITGlueCacheError: If caching is disabled, the backend cannot
+                list its entries or the file cannot be written
+        """
+        if not self.backend:
+            raise ITGlueCacheError("Caching is disabled")
+
+        created_at = time.time()
+        temp_path = f"{path}.tmp"
+        count = 0
+        try:
+            # Never reuse a leftover temporary file and its permissions
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with (
+                os.fdopen(fd, "wb") as raw,
+                gzip.GzipFile(fileobj=raw, mode="wb") as compressed,
+                io.TextIOWrapper(compressed, encoding="utf-8") as snapshot,
+            ):
+                header = {
+                    "format": _SNAPSHOT_FORMAT,
+                    "version": _SNAPSHOT_VERSION,
+                    "created_at": created_at,
+                }
+                snapshot.write(json.dumps(header) + "\n")
+                for key, value, remaining, tags in self.backend.entries():
+                    if self._holds_secrets(value, tags):
+                        continue
+                    record = {"key": key, "value": value, "ttl": remaining}
+                    if tags:
+                        record["tags"] = tags
+                    snapshot.write(json.dumps(record, separators=(",", ":")) + "\n")
+                    count += 1
+            os.replace(temp_path, path)
+
+        except NotImplementedError as e:
+            raise ITGlueCacheError(f"Cannot export cache snapshot: {e}")
+        except (OSError, TypeError, ValueError) as e:
+            raise ITGlueCacheError(f"Failed to write cache snapshot {path}: {e}")
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        self.logger.info("Exported cache snapshot", path=path, entries=count)
+        return count
+
+    @staticmethod
+    def _holds_secrets(value: Any, tags: List[str]) -> bool:
+        """Check whether a cache entry may contain secrets.
+
+        An entry holds secrets if it was cached from, or is tagged with, an
+        endpoint path or resource of a secret-bearing type.
+        """
+        paths = [tag.split(":", 1)[1] for tag in tags if tag.startswith("endpoint:")]
+        if isinstance(value, dict) and _ENTRY_MARKER in value:
+            paths.append(value.get("endpoint") or "")
+        if any(
+            segment in _SECRET_RESOURCE_TYPES
+            for path in paths
+            for segment in path.split("?")[0].split("/")
+        ):
+            return True
+
+        return any(
+            tag.split(":")[1].replace("-", "_") in _SECRET_RESOURCE_TYPES
+            for tag in tags
+            if tag.startswith("resource:")
+        )
+
+    def import_snapshot(self, path: str, batch_size: int = 500) -> int:
+        """Load entries from a file written by :meth:`export_snapshot`.
+
+        Entries keep the lifetime they had left when the snapshot was
+        made, less the time since; entries that have expired since are
+        skipped. Imported entries replace cached ones with the same key.
+        Writes are batched, e.g. into pipelined Redis round trips.
+
+        Args:
+            path: Snapshot file
+            batch_size: Maximum entries written per backend call
+
+        Returns:
+            Number of entries loaded
+
+        Raises:
+            ITGlueCacheError: If caching is disabled or the file is missing,
+                unreadable or not a supported snapshot
+        """
+        if not self.backend:
+            raise ITGlueCacheError("Caching is disabled")
+
+        # Entries sharing a whole-second TTL are written together
+        batches: Dict[Optional[int], Dict[str, Any]] = {}
+        tags_by_ttl: Dict[Optional[int], Dict[str, List[str]]] = {}
+        count = 0
+
+        def _flush(ttl: Optional[int]) -> None:
+            self.backend.set_many(batches.pop(ttl), ttl)
+            tags = tags_by_ttl.pop(ttl, None)
+            if tags:
+                self.backend.tag_many(tags, ttl)
+
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as snapshot:
+                header = json.loads(snapshot.readline() or "{}")
+                if header.get("format") != _SNAPSHOT_FORMAT:
+                    raise ITGlueCacheError(f"Not a cache snapshot: {path}")
+                if header.get("version") != _SNAPSHOT_VERSION:
+                    raise ITGlueCacheError(
+                        f"Unsupported cache snapshot version: {header.get('version')}"
+                    )
+                age = max(0.0, time.time() - header["created_at"])
+
+                for line in snapshot:
+                    record = json.loads(line)
+                    ttl = record["ttl"]
+                    if ttl is not None:
+                        if ttl - age <= 0:
+                            continue
+                        ttl = math.ceil(ttl - age)
+
+                    batches.setdefault(ttl, {})[record["key"]] = record["value"]
+                    if record.get("tags"):
+                        tags_by_ttl.setdefault(ttl, {})[record["key"]] = record["tags"]
+                    count += 1
+                    if len(batches[ttl]) >= batch_size:
+                        _flush(ttl)
+
+            for ttl in list(batches):
+                _flush(ttl)
+
+        except ITGlueCacheError:
+            raise
+        except (OSError, EOFError, KeyError, TypeError, ValueError) as e:
+            raise ITGlueCacheError(f"Failed to read cache snapshot {path}: {e}")
+
+        self.logger.info("Imported cache snapshot", path=path, entries=count)
+        return count
+
+    def new_snapshot_id(self) -> str:
+        """Generate an identifier for a new multi-page scan snapshot."""
+        return uuid.uuid4().hex
+
+    def get_scan_snapshot(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the manifest of a complete cached scan.
+
+        A manifest is only returned while every page it lists is still
+        cached, so callers never combine pages from different scans.
+
+        Args:
+            endpoint: API endpoint that was scanned
+            params: Query parameters of the scan, excluding the page number
+
+        Returns:
+            Manifest with ``snapshot_id`` and ``pages``, or None
+        """
+        if not self.backend:
+            return None
+
+        scan_key = self._generate_cache_key(endpoint, params, method="SCAN")
+
+        try:
+            manifest = self.backend.get(scan_key)
+            if not manifest:
+                return None
+
+            for page in manifest["pages"]:
+                page_params = dict(params or {})
+                page_params["page[number]"] = str(page)
+                page_key = self._generate_cache_key(
+                    endpoint, page_params, snapshot_id=manifest["snapshot_id"]
+                )
+                if not self.backend.exists(page_key):
+                    self.logger.debug(
+                        "Scan snapshot incomplete", endpoint=endpoint, page=page
+                    )
+                    self.backend.delete(scan_key)
+                    return None
+
+            return manifest
+
+        except Exception as e:
+            self.logger.error("Cache snapshot get error", error=str(e))
+            return None
+
+    def set_scan_snapshot(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        snapshot_id: str,
+        pages: List[int],
+        started_at: float,
+        responses: Optional[List[Tuple[Dict[str, Any], Dict[str, Any]]]] = None,
+    ) -> None:
+        """Publish the manifest of a completed scan.
+
+        The manifest and the pages cached with it expire one TTL after the
+        scan started, since the first page was fetched then.
+
+        Args:
+            endpoint: API endpoint that was scanned
+            params: Query parameters of the scan, excluding the page number
+            snapshot_id: Snapshot the scan's pages are cached under
+            pages: Page numbers fetched by the scan
+            started_at: Time the scan started (``time.time()``)
+            responses: ``(params, response_data)`` pairs of the scan's pages
+                to cache before the manifest
+        """
+        if not self.backend:
+            return
+
+        ttl = int(self.ttl_for(endpoint) - (time.time() - started_at))
+        if ttl <= 0:
+            return
+
+        if responses:
+            self.set_many(endpoint, responses, ttl=ttl, snapshot_id=snapshot_id)
+
+        scan_key = self._generate_cache_key(endpoint, params, method="SCAN")
+
+        try:
+            self.backend.set(
+                scan_key, {"snapshot_id": snapshot_id, "pages": pages}, ttl
+            )
+            # A write beneath the endpoint retires the snapshot with its pages
+            self.backend.tag(scan_key, self._endpoint_tags(endpoint), ttl)
+            self.logger.debug(
+                "Cached scan snapshot",
+                endpoint=endpoint,
+                snapshot_id=snapshot_id,
+                pages=len(pages),
+            )
+
+        except Exception as e:
+            self.logger.error("Cache snapshot set error", error=str(e))
+
+    def delete_scan_snapshot(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Retire the manifest of a cached scan so the next scan runs live.
+
+        Args:
+            endpoint: API endpoint that was scanned
+            params: Query parameters of the scan, excluding the page number
+        """
+        if not self.backend:
+            return
+
+        try:
+            self.backend.delete(
+                self._generate_cache_key(endpoint, params, method="SCAN")
+            )
+        except Exception as e:
+            self.logger.error("Cache snapshot delete error", error=str(e))
+
+    def _negative_scope_key(self, scope: str) -> str:
+        """Get the key of a scope's token.
+
+        ``users``, ``/users`` and ``/users/`` name the same scope, so the
+        typed APIs and raw client calls invalidate each other's entries.
+        """
+        scope = "/" + scope.split("?")[0].strip("/")
+        return self._generate_cache_key(scope, method="NEGATIVE_SCOPE")
+
+    def _negative_token(self, scope: str, create: bool = True) -> Optional[str]:
+        """Get the current negative-cache generation token for a scope."""
+        token_key = self._negative_scope_key(scope)
+        entry = self.backend.get(token_key)
+        if entry:
+            return entry["token"]
+        if not create:
+            return None
+
+        # Tokens never outlive the entries they scope, so expiry is safe
+        token = uuid.uuid4().hex
+        self.backend.set(token_key, {"token": token}, self.config.cache_negative_ttl)
+        return token
+
+    def is_negative(
+        self, scope: str, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Check whether a lookup is known to have no results.
+
+        Args:
+            scope: Resource collection the lookup belongs to (e.g. ``/users``)
+            endpoint: API endpoint of the lookup
+            params: Query parameters of the lookup
+
+        Returns:
+            True if the lookup recently returned 404 or no results
+        """
+        if not self.backend or not self.config.cache_negative_ttl:
+            return False
+
+        try:
+            token = self._negative_token(scope, create=False)
+            if token is None:
+                return False
+            key = self._generate_cache_key(endpoint, params, f"NEGATIVE:{token}")
+            return self.backend.exists(key)
+
+        except Exception as e:
+            self.logger.error("Negative cache get error", error=str(e))
+            return False
+
+    def set_negative(
+        self, scope: str, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Remember that a lookup returned 404 or no results.
+
+        Entries live for ``cache_negative_ttl`` seconds, or until
+        :meth:`invalidate_negative` is called for their scope.
+        """
+        if not self.backend or not self.config.cache_negative_ttl:
+            return
+
+        try:
+            token = self._negative_token(scope)
+            key = self._generate_cache_key(endpoint, params, f"NEGATIVE:{token}")
+            self.backend.set(key, {"missing": True}, self.config.cache_negative_ttl)
+            self.logger.debug("Cached negative result", endpoint=endpoint)
+
+        except Exception as e:
+            self.logger.error("Negative cache set error", error=str(e))
+
+    def invalidate_negative(self, scope: str) -> None:
+        """Forget every negative result in a scope, e.g. after a write."""
+        if not self.backend:
+            return
+
+        try:
+            self.backend.delete(self._negative_scope_key(scope))
+            self.logger.debug("Invalidated negative results", scope=scope)
+
+        except Exception as e:
+            self.logger.error("Negative cache invalidate error", error=str(e))
+
+    @staticmethod
+    def _endpoint_tags(endpoint: str) -> List[str]:
+        """Get tags for every path prefix of an endpoint.
+
+        ``/organizations/5/relationships/configurations`` is tagged with
+        ``/organizations``, ``/organizations/5`` and so on, so invalidating a
+        prefix reaches everything beneath it.
+        """
+        segments = [part for part in endpoint.split("?")[0].split("/") if part]
+        return [
+            "endpoint:/" + "/".join(segments[: index + 1])
+            for index in range(len(segments))
+        ]
+
+    @classmethod
+    def _resource_tag(cls, resource_type: str, resource_id: Any) -> str:
+        """Get the tag of a resource; hyphenated and underscored types match."""
+        return f"resource:{cls._policy_key(resource_type)}:{resource_id}"
+
+    @classmethod
+    def _resource_tags(cls, response_data: Any) -> List[str]:
+        """Get ``(type, id)`` tags for the resources in a JSON:API response."""
+        if not isinstance(response_data, dict):
+            return []
+
+        data = response_data.get("data")
+        resources = data if isinstance(data, list) else [data]
+        resources = resources + list(response_data.get("included") or [])
+
+        return [
+            cls._resource_tag(resource["type"], resource["id"])
+            for resource in resources
+            if isinstance(resource, dict) and "type" in resource and "id" in resource
+        ]
+
     def invalidate_endpoint(self, endpoint_pattern: str) -> None:
-        """Invalidate cache entries matching endpoint pattern."""
-        # This is a simplified implementation
-        # In a production system, you might want more sophisticated pattern matching
+        """Invalidate cache entries for an endpoint and every path beneath it."""
         if not self.backend:
             return
 
-        self.logger.info("Cache invalidation requested", pattern=endpoint_pattern)
-        # For now, we'll just clear everything
-        # TODO: Implement pattern-based invalidation
-        self.clear()
+        tags = self._endpoint_tags(endpoint_pattern)
+        if not tags:
+            self.clear()
+            return
+
+        try:
+            count = self.backend.invalidate_tag(tags[-1])
+            self.logger.info(
+                "Invalidated endpoint", pattern=endpoint_pattern, entries=count
+            )
+
+        except Exception as e:
+            self.logger.error("Cache invalidate error", error=str(e))
+
+    def invalidate_resource(self, resource_type: str, resource_id: Any) -> None:
+        """Invalidate every cached response that contains a resource.
+
+        The resource's normalized entity is dropped too, so responses that
+        reference it miss until it is written again.
+        """
+        if not self.backend:
+            return
+
+        try:
+            self.backend.delete(self._entity_key(resource_type, resource_id))
+            count = self.backend.invalidate_tag(
+                self._resource_tag(resource_type, resource_id)
+            )
+            self.logger.info(
+                "Invalidated resource",
+                resource_type=resource_type,
+                resource_id=resource_id,
+                entries=count,
+            )
+
+        except Exception as e:
+            self.logger.error("Cache invalidate error", error=str(e))
+
+    def invalidate_queries(self, resource_type: str) -> None:
+        """Invalidate cached lists of a type whose membership may change.
+
+        Drops filtered, sorted and nested lists, e.g. after an update that
+        may move a resource in or out of them. Plain collection pages and
+        single-resource responses are kept.
+        """
+        if not self.backend:
+            return
+
+        try:
+            count = self.backend.invalidate_tag(
+                f"query:{self._policy_key(resource_type)}"
+            )
+            self.logger.info(
+                "Invalidated queries", resource_type=resource_type, entries=count
+            )
+
+        except Exception as e:
+            self.logger.error("Cache invalidate error", error=str(e))
 
 
 def create_cache_manager(cache_config: Optional[Dict[str, Any]] = None) -> CacheManager:
@@ -381,6 +3267,8 @@ def create_cache_manager(cache_config: Optional[Dict[str, Any]] = None) -> Cache
         return MemoryCache(
             max_size=cache_config.get("max_size", 1000),
             ttl=cache_config.get("ttl", 3600),
+            max_bytes=cache_config.get("max_bytes"),
+            max_rss_bytes=cache_config.get("max_rss_bytes"),
         )
     elif cache_type == "redis":
         redis_config = cache_config.get("redis", {})
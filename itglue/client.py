@@ -6,12 +6,15 @@ Integrates HTTP client, pagination, caching, and provides high-level API interfa
 """
 
 import structlog
-from typing import Any, Dict, List, Optional, Generator
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Generator, Iterable, Union
 
 from .config import ITGlueConfig
 from .http_client import ITGlueHTTPClient
 from .pagination import PaginationHandler, PaginatedResponse
-from .cache import CacheManager
+from .cache import CacheManager, ShardedMemoryCache
 from .api.organizations import OrganizationsAPI
 from .api.configurations import ConfigurationsAPI
 from .api.flexible_assets import (
@@ -21,6 +24,7 @@ from .api.flexible_assets import (
 )
 from .api.users import UsersAPI
 from .api.passwords import PasswordsAPI
+from .warmup import WarmupQuery, WarmupResult
 
 
 class ITGlueClient:
@@ -38,17 +42,21 @@ class ITGlueClient:
 
         # Initialize components
         self.http_client = ITGlueHTTPClient(self.config)
-        self.pagination = PaginationHandler(self.http_client)
         self.cache = CacheManager(self.config)
+        self.pagination = PaginationHandler(self.http_client, cache=self.cache)
 
         # Initialize API resource endpoints
-        self.organizations = OrganizationsAPI(self.http_client)
-        self.configurations = ConfigurationsAPI(self.http_client)
-        self.flexible_assets = FlexibleAssetsAPI(self.http_client)
-        self.flexible_asset_types = FlexibleAssetTypesAPI(self.http_client)
-        self.flexible_asset_fields = FlexibleAssetFieldsAPI(self.http_client)
-        self.users = UsersAPI(self.http_client)
-        self.passwords = PasswordsAPI(self.http_client)
+        self.organizations = OrganizationsAPI(self.http_client, cache=self.cache)
+        self.configurations = ConfigurationsAPI(self.http_client, cache=self.cache)
+        self.flexible_assets = FlexibleAssetsAPI(self.http_client, cache=self.cache)
+        self.flexible_asset_types = FlexibleAssetTypesAPI(
+            self.http_client, cache=self.cache
+        )
+        self.flexible_asset_fields = FlexibleAssetFieldsAPI(
+            self.http_client, cache=self.cache
+        )
+        self.users = UsersAPI(self.http_client, cache=self.cache)
+        self.passwords = PasswordsAPI(self.http_client, cache=self.cache)
 
         self.logger.info(
             "ITGlue client initialized",
@@ -68,17 +76,31 @@ class ITGlueClient:
         params: Optional[Dict[str, Any]] = None,
         method: str = "GET",
         force_refresh: bool = False,
+        cache_ttl: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Get data from cache or fetch from API."""
+        """Get data from cache or fetch from API.
+
+        ``cache_ttl`` overrides the endpoint's cache TTL policy.
+        """
         # Check cache first (unless force refresh or non-GET method)
         if not force_refresh and method == "GET":
-            cached_data = self.cache.get(endpoint, params, method)
+            cached_data = self.cache.get(
+                endpoint,
+                params,
+                method,
+                refresh=lambda: self.http_client.get(endpoint, params),
+            )
             if cached_data:
                 return cached_data
 
         # Fetch from API
         if method == "GET":
-            response_data = self.http_client.get(endpoint, params)
+            try:
+                response_data = self.http_client.get(endpoint, params)
+            except Exception:
+                # Let callers waiting on this fetch try for themselves
+                self.cache.release_lease(endpoint, params, method)
+                raise
         elif method == "POST":
             response_data = self.http_client.post(endpoint, json_data=params)
         elif method == "PATCH":
@@ -90,7 +112,7 @@ class ITGlueClient:
 
         # Cache the response (only for GET requests)
         if method == "GET":
-            self.cache.set(endpoint, response_data, params)
+            self.cache.set(endpoint, response_data, params, ttl=cache_ttl)
 
         return response_data
 
@@ -102,12 +124,19 @@ class ITGlueClient:
         resource_id: Optional[str] = None,
         params: Optional[Dict[str, Any]] = None,
         force_refresh: bool = False,
+        cache_ttl: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Get a single resource or list of resources."""
+        """Get a single resource or list of resources.
+
+        ``cache_ttl`` overrides the endpoint's cache TTL policy for this
+        response; 0 skips caching it.
+        """
         if resource_id:
             endpoint = f"{endpoint}/{resource_id}"
 
-        return self._get_cached_or_fetch(endpoint, params, force_refresh=force_refresh)
+        return self._get_cached_or_fetch(
+            endpoint, params, force_refresh=force_refresh, cache_ttl=cache_ttl
+        )
 
     def get_resource_page(
         self,
@@ -116,21 +145,22 @@ class ITGlueClient:
         page_size: Optional[int] = None,
         params: Optional[Dict[str, Any]] = None,
         force_refresh: bool = False,
+        cache_ttl: Optional[int] = None,
     ) -> PaginatedResponse:
-        """Get a specific page of resources."""
-        if not force_refresh:
-            # Try to get from cache first
-            cache_params = params.copy() if params else {}
-            cache_params.update({"page[number]": page})
-            if page_size:
-                cache_params["page[size]"] = page_size
-
-            cached_data = self.cache.get(endpoint, cache_params)
-            if cached_data:
-                return self.pagination.parse_response(cached_data)
-
-        # Fetch from API
-        return self.pagination.get_page(endpoint, page, page_size, params)
+        """Get a specific page of resources.
+
+        Pages are cached by the pagination handler under a key made from the
+        query, page number and page size. ``cache_ttl`` overrides the
+        endpoint's cache TTL policy.
+        """
+        return self.pagination.get_page(
+            endpoint,
+            page,
+            page_size,
+            force_refresh=force_refresh,
+            cache_ttl=cache_ttl,
+            **(params or {}),
+        )
 
     def get_all_resources(
         self,
@@ -141,7 +171,9 @@ class ITGlueClient:
         force_refresh: bool = False,
     ) -> List[Dict[str, Any]]:
         """Get all resources from all pages."""
-        return self.pagination.get_all_pages(endpoint, page_size, params, max_pages)
+        return self.pagination.get_all_pages(
+            endpoint, page_size, max_pages, **(params or {})
+        )
 
     def iterate_resources(
         self,
@@ -149,9 +181,23 @@ class ITGlueClient:
         page_size: Optional[int] = None,
         params: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
+        consistent: bool = False,
+        bypass_cache: bool = False,
     ) -> Generator[Dict[str, Any], None, None]:
-        """Iterate over all resources across pages."""
-        return self.pagination.iterate_items(endpoint, page_size, params, max_pages)
+        """Iterate over all resources across pages.
+
+        Set ``consistent`` to de-duplicate records and recover records
+        skipped when the collection changes during the scan, and
+        ``bypass_cache`` to keep a one-off bulk scan out of the cache.
+        """
+        return self.pagination.iterate_items(
+            endpoint,
+            page_size,
+            params,
+            max_pages,
+            consistent=consistent,
+            bypass_cache=bypass_cache,
+        )
 
     def iterate_pages(
         self,
@@ -159,15 +205,19 @@ class ITGlueClient:
         page_size: Optional[int] = None,
         params: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
+        bypass_cache: bool = False,
     ) -> Generator[PaginatedResponse, None, None]:
-        """Iterate over pages of resources."""
-        return self.pagination.iterate_pages(endpoint, page_size, params, max_pages)
+        """Iterate over pages of resources, optionally bypassing the cache."""
+        return self.pagination.iterate_pages(
+            endpoint, page_size, params, max_pages, bypass_cache=bypass_cache
+        )
 
     def create_resource(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new resource."""
         response = self.http_client.post(endpoint, json_data=data)
 
-        # Invalidate related cache entries
+        # Invalidate related cache entries, including remembered misses
+        self.cache.invalidate_negative(endpoint)
         self.cache.invalidate_endpoint(endpoint)
 
         return response
@@ -179,9 +229,11 @@ class ITGlueClient:
         full_endpoint = f"{endpoint}/{resource_id}"
         response = self.http_client.patch(full_endpoint, json_data=data)
 
-        # Invalidate related cache entries
+        # Invalidate related cache entries, including remembered misses
+        self.cache.invalidate_negative(endpoint)
         self.cache.invalidate_endpoint(endpoint)
         self.cache.delete(full_endpoint)
+        self._invalidate_resource(endpoint, resource_id)
 
         return response
 
@@ -190,12 +242,119 @@ class ITGlueClient:
         full_endpoint = f"{endpoint}/{resource_id}"
         response = self.http_client.delete(full_endpoint)
 
-        # Invalidate related cache entries
+        # Invalidate related cache entries, including remembered misses
+        self.cache.invalidate_negative(endpoint)
         self.cache.invalidate_endpoint(endpoint)
         self.cache.delete(full_endpoint)
+        self._invalidate_resource(endpoint, resource_id)
 
         return response
 
+    def _invalidate_resource(self, endpoint: str, resource_id: str) -> None:
+        """Invalidate cached responses that embed a resource.
+
+        The resource type is taken from the last segment of the collection
+        endpoint, e.g. ``/organizations/1/relationships/configurations``.
+        """
+        resource_type = endpoint.rstrip("/").rsplit("/", 1)[-1]
+        self.cache.invalidate_resource(resource_type, resource_id)
+
+    def warm_cache(
+        self,
+        queries: Iterable[Union[WarmupQuery, str]],
+        progress: Optional[Callable[[WarmupResult, int, int], None]] = None,
+        max_workers: Optional[int] = None,
+        force_refresh: bool = False,
+    ) -> List[WarmupResult]:
+        """Prefill the cache by running queries concurrently.
+
+        Requests share the client's rate limiter, so a warm-up stays within
+        the rate budget however many workers run it. Queries already cached
+        are not refetched unless ``force_refresh`` is set. Failed queries
+        are reported rather than raised.
+
+        Args:
+            queries: :class:`WarmupQuery` objects or endpoint paths, e.g.
+                from :func:`~itglue.warmup.reference_data_queries`
+            progress: Called from this thread after each query with its
+                result, the number of queries done and the total so far
+                (which grows as queries add follow-up queries)
+            max_workers: Maximum concurrent requests (default: connection
+                pool size)
+            force_refresh: Refetch queries that are already cached
+
+        Returns:
+            Results in completion order
+        """
+        pending = deque(
+            query if isinstance(query, WarmupQuery) else WarmupQuery(query)
+            for query in queries
+        )
+        total = len(pending)
+        results: List[WarmupResult] = []
+        if not pending:
+            return results
+
+        if max_workers is None:
+            max_workers = self.config.connection_pool_size
+        max_workers = max(1, max_workers)
+
+        def _run(query: WarmupQuery) -> WarmupResult:
+            started = perf_counter()
+            try:
+                response = self._get_cached_or_fetch(
+                    query.endpoint,
+                    query.params,
+                    force_refresh=force_refresh,
+                    cache_ttl=query.cache_ttl,
+                )
+                return WarmupResult(query, response, seconds=perf_counter() - started)
+            except Exception as e:
+                return WarmupResult(query, error=e, seconds=perf_counter() - started)
+
+        started = perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="itglue-warmup"
+        ) as executor:
+            running = set()
+            while pending or running:
+                while pending and len(running) < max_workers:
+                    running.add(executor.submit(_run, pending.popleft()))
+
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result.ok and result.query.follow is not None:
+                        try:
+                            follow_ups = list(result.query.follow(result.response))
+                        except Exception as e:
+                            self.logger.warning(
+                                "Warm-up follow-up failed",
+                                endpoint=result.query.endpoint,
+                                error=str(e),
+                            )
+                            follow_ups = []
+                        pending.extend(follow_ups)
+                        total += len(follow_ups)
+
+                    results.append(result)
+                    if not result.ok:
+                        self.logger.warning(
+                            "Warm-up query failed",
+                            endpoint=result.query.endpoint,
+                            error=str(result.error),
+                        )
+                    if progress is not None:
+                        progress(result, len(results), total)
+
+        self.logger.info(
+            "Cache warm-up finished",
+            queries=len(results),
+            failed=sum(1 for result in results if not result.ok),
+            seconds=round(perf_counter() - started, 3),
+        )
+        return results
+
     # Utility methods
 
     def clear_cache(self) -> None:
@@ -204,18 +363,24 @@ class ITGlueClient:
         self.logger.info("Cleared all cache data")
 
     def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics (if available)."""
-        if hasattr(self.cache.backend, "cache"):
-            return {
-                "cache_enabled": self.config.enable_caching,
-                "cache_backend": self.config.cache_type,
-                "cache_size": len(self.cache.backend.cache),
-                "cache_max_size": getattr(self.cache.backend, "max_size", None),
-            }
-        return {
+        """Get cache statistics.
+
+        Includes hit ratio, evictions, bytes and latency in total and per
+        endpoint prefix (see :meth:`CacheManager.get_stats`), plus entry
+        counts for the memory backend.
+        """
+        stats = {
             "cache_enabled": self.config.enable_caching,
             "cache_backend": self.config.cache_type,
         }
+        if isinstance(self.cache.backend, ShardedMemoryCache):
+            stats["cache_size"] = self.cache.backend.count()
+            stats["cache_max_size"] = self.cache.backend.max_size
+        elif hasattr(self.cache.backend, "cache"):
+            stats["cache_size"] = len(self.cache.backend.cache)
+            stats["cache_max_size"] = getattr(self.cache.backend, "max_size", None)
+        stats.update(self.cache.get_stats())
+        return stats
 
     def test_connection(self) -> bool:
         """Test connection to ITGlue API."""
@@ -230,6 +395,7 @@ class ITGlueClient:
     def close(self) -> None:
         """Close the client and clean up resources."""
         self.http_client.close()
+        self.cache.close()
         self.logger.info("ITGlue client closed")
 
     def __enter__(self):
@@ -18,6 +18,28 @@ class ITGlueRegion(Enum):
     AU = "https://api.au.itglue.com"
 
 
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    """Parse an optional integer environment value."""
+    return int(value) if value else None
+
+
+def _parse_ttl_policies(value: Optional[str]) -> Dict[str, int]:
+    """Parse TTL policies written as ``passwords=60,/organizations=600``."""
+    policies = {}
+    for item in (value or "").split(","):
+        if item.strip():
+            key, _, ttl = item.partition("=")
+            policies[key.strip()] = int(ttl)
+    return policies
+
+
+def _optional_compression(value: Optional[str]) -> Optional[str]:
+    """Parse a compression environment value, where "none" disables it."""
+    if not value or value.lower() == "none":
+        return None
+    return value.lower()
+
+
 @dataclass
 class ITGlueConfig:
     """Configuration class for ITGlue SDK."""
@@ -45,8 +67,27 @@ class ITGlueConfig:
     # Caching
     enable_caching: bool = True
     cache_ttl: int = 300  # 5 minutes
-    cache_type: str = "memory"  # "memory", "redis"
+    # TTLs by endpoint prefix ("/organizations") or resource type ("passwords"),
+    # layered over the cache module's defaults; 0 disables caching
+    cache_ttl_policies: Dict[str, int] = field(default_factory=dict)
+    cache_type: str = "memory"  # "memory", "redis", "tiered", "disk"
+    cache_disk_path: Optional[str] = None  # Disk cache file (~/.cache/itglue)
     redis_url: Optional[str] = None
+    redis_max_connections: int = 10  # Redis connection pool size
+    cache_l1_ttl: int = 30  # Max lifetime of in-process entries with "tiered"
+    cache_serializer: str = "json"  # Redis entry encoding: "json", "msgpack"
+    cache_compression: Optional[str] = "zlib"  # "zlib", "zstd" or None
+    cache_compress_threshold: int = 1024  # Compress entries at least this large
+    cache_max_bytes: Optional[int] = None  # Memory or disk cache size limit
+    cache_max_rss_bytes: Optional[int] = None  # Shrink memory cache above this RSS
+    cache_memory_shards: int = 1  # Independently locked memory cache shards
+    cache_admission: str = "always"  # Memory cache admission: "always", "tinylfu"
+    cache_stale_ttl: int = 0  # Serve expired entries this long while refreshing
+    cache_refresh_ahead: float = 0.0  # Refresh entries read in this final TTL fraction
+    cache_negative_ttl: int = 60  # Remember 404s and empty lookups (0 disables)
+    cache_lease_timeout: float = 5.0  # Wait for another caller's fetch (0 disables)
+    cache_normalize: bool = False  # Store resources once by (type, id); lists hold IDs
+    cache_model_max_size: int = 0  # Decoded models kept by (type, id, updated-at) (0 disables)
 
     # Logging
     log_level: str = "INFO"
@@ -89,8 +130,32 @@ class ITGlueConfig:
             default_page_size=int(os.getenv("ITGLUE_PAGE_SIZE", "50")),
             enable_caching=os.getenv("ITGLUE_ENABLE_CACHING", "true").lower() == "true",
             cache_ttl=int(os.getenv("ITGLUE_CACHE_TTL", "300")),
+            cache_ttl_policies=_parse_ttl_policies(
+                os.getenv("ITGLUE_CACHE_TTL_POLICIES")
+            ),
             cache_type=os.getenv("ITGLUE_CACHE_TYPE", "memory"),
+            cache_disk_path=os.getenv("ITGLUE_CACHE_DISK_PATH"),
             redis_url=os.getenv("ITGLUE_REDIS_URL"),
+            redis_max_connections=int(os.getenv("ITGLUE_REDIS_MAX_CONNECTIONS", "10")),
+            cache_l1_ttl=int(os.getenv("ITGLUE_CACHE_L1_TTL", "30")),
+            cache_serializer=os.getenv("ITGLUE_CACHE_SERIALIZER", "json"),
+            cache_compression=_optional_compression(
+                os.getenv("ITGLUE_CACHE_COMPRESSION", "zlib")
+            ),
+            cache_compress_threshold=int(
+                os.getenv("ITGLUE_CACHE_COMPRESS_THRESHOLD", "1024")
+            ),
+            cache_max_bytes=_optional_int(os.getenv("ITGLUE_CACHE_MAX_BYTES")),
+            cache_max_rss_bytes=_optional_int(os.getenv("ITGLUE_CACHE_MAX_RSS_BYTES")),
+            cache_memory_shards=int(os.getenv("ITGLUE_CACHE_MEMORY_SHARDS", "1")),
+            cache_admission=os.getenv("ITGLUE_CACHE_ADMISSION", "always"),
+            cache_stale_ttl=int(os.getenv("ITGLUE_CACHE_STALE_TTL", "0")),
+            cache_refresh_ahead=float(os.getenv("ITGLUE_CACHE_REFRESH_AHEAD", "0")),
+            cache_negative_ttl=int(os.getenv("ITGLUE_CACHE_NEGATIVE_TTL", "60")),
+            cache_lease_timeout=float(os.getenv("ITGLUE_CACHE_LEASE_TIMEOUT", "5")),
+            cache_normalize=os.getenv("ITGLUE_CACHE_NORMALIZE", "false").lower()
+            == "true",
+            cache_model_max_size=int(os.getenv("ITGLUE_CACHE_MODEL_MAX_SIZE", "0")),
             log_level=os.getenv("ITGLUE_LOG_LEVEL", "INFO"),
             log_requests=os.getenv("ITGLUE_LOG_REQUESTS", "false").lower() == "true",
             log_responses=os.getenv("ITGLUE_LOG_RESPONSES", "false").lower() == "true",
@@ -118,8 +183,25 @@ class ITGlueConfig:
             "max_page_size": self.max_page_size,
             "enable_caching": self.enable_caching,
             "cache_ttl": self.cache_ttl,
+            "cache_ttl_policies": self.cache_ttl_policies,
             "cache_type": self.cache_type,
+            "cache_disk_path": self.cache_disk_path,
             "redis_url": self.redis_url,
+            "redis_max_connections": self.redis_max_connections,
+            "cache_l1_ttl": self.cache_l1_ttl,
+            "cache_serializer": self.cache_serializer,
+            "cache_compression": self.cache_compression,
+            "cache_compress_threshold": self.cache_compress_threshold,
+            "cache_max_bytes": self.cache_max_bytes,
+            "cache_max_rss_bytes": self.cache_max_rss_bytes,
+            "cache_memory_shards": self.cache_memory_shards,
+            "cache_admission": self.cache_admission,
+            "cache_stale_ttl": self.cache_stale_ttl,
+            "cache_refresh_ahead": self.cache_refresh_ahead,
+            "cache_negative_ttl": self.cache_negative_ttl,
+            "cache_lease_timeout": self.cache_lease_timeout,
+            "cache_normalize": self.cache_normalize,
+            "cache_model_max_size": self.cache_model_max_size,
             "log_level": self.log_level,
             "log_requests": self.log_requests,
             "log_responses": self.log_responses,
@@ -163,8 +245,53 @@ class ITGlueConfig:
         if self.default_page_size <= 0 or self.default_page_size > self.max_page_size:
             raise ValueError(f"Page size must be between 1 and {self.max_page_size}")
 
-        if self.cache_type == "redis" and not self.redis_url:
+        if self.cache_type in ("redis", "tiered") and not self.redis_url:
             raise ValueError("Redis URL is required when using Redis cache")
 
+        if self.cache_l1_ttl <= 0:
+            raise ValueError("Cache L1 TTL must be positive")
+
+        if self.redis_max_connections <= 0:
+            raise ValueError("Redis max connections must be positive")
+
+        if self.cache_serializer not in ("json", "msgpack"):
+            raise ValueError("Cache serializer must be 'json' or 'msgpack'")
+
+        if self.cache_compression not in (None, "zlib", "zstd"):
+            raise ValueError("Cache compression must be 'zlib', 'zstd' or None")
+
+        if self.cache_admission not in ("always", "tinylfu"):
+            raise ValueError("Cache admission must be 'always' or 'tinylfu'")
+
+        if self.cache_compress_threshold < 0:
+            raise ValueError("Cache compress threshold must be non-negative")
+
+        if self.cache_max_bytes is not None and self.cache_max_bytes <= 0:
+            raise ValueError("Cache max bytes must be positive")
+
+        if self.cache_max_rss_bytes is not None and self.cache_max_rss_bytes <= 0:
+            raise ValueError("Cache max RSS bytes must be positive")
+
+        if self.cache_memory_shards < 1:
+            raise ValueError("Cache memory shards must be at least 1")
+
+        if self.cache_stale_ttl < 0:
+            raise ValueError("Cache stale TTL must be non-negative")
+
+        if not 0 <= self.cache_refresh_ahead < 1:
+            raise ValueError("Cache refresh-ahead must be between 0 and 1")
+
+        if any(ttl < 0 for ttl in self.cache_ttl_policies.values()):
+            raise ValueError("Cache TTL policies must be non-negative")
+
+        if self.cache_lease_timeout < 0:
+            raise ValueError("Cache lease timeout must be non-negative")
+
+        if self.cache_negative_ttl < 0:
+            raise ValueError("Cache negative TTL must be non-negative")
+
+        if self.cache_model_max_size < 0:
+            raise ValueError("Cache model max size must be non-negative")
+
         if self.bulk_batch_size <= 0:
             raise ValueError("Bulk batch size must be positive")
@@ -9,6 +9,7 @@ Handles all HTTP interactions with the ITGlue API including:
 """
 
 import json
+import threading
 import time
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urljoin, urlencode
@@ -43,32 +44,45 @@ class SimpleRateLimiter:
         self.requests_per_5_minutes = requests_per_5_minutes
         self.minute_requests: List[float] = []
         self.five_minute_requests: List[float] = []
+        self._lock = threading.Lock()
 
     def wait_if_needed(self) -> None:
         """Wait if rate limits would be exceeded."""
-        current_time = time.time()
-
+        while True:
+            # Serialize callers so concurrent requests share one budget, but
+            # sleep without the lock so others can check the budget meanwhile
+            with self._lock:
+                wait_time = self._reserve(time.time())
+            if wait_time <= 0:
+                return
+            time.sleep(wait_time)
+
+    def _reserve(self, current_time: float) -> float:
+        """Record a request if the budget allows it.
+
+        Returns:
+            0 if the request was recorded, otherwise seconds to wait before
+            trying again
+        """
         # Clean old requests
         self._clean_old_requests(current_time)
 
+        wait_time = 0.0
         # Check minute limit
         if len(self.minute_requests) >= self.requests_per_minute:
             wait_time = 60 - (current_time - self.minute_requests[0])
-            if wait_time > 0:
-                time.sleep(wait_time)
-                self._clean_old_requests(time.time())
-
         # Check 5-minute limit
         if len(self.five_minute_requests) >= self.requests_per_5_minutes:
-            wait_time = 300 - (current_time - self.five_minute_requests[0])
-            if wait_time > 0:
-                time.sleep(wait_time)
-                self._clean_old_requests(time.time())
+            wait_time = max(
+                wait_time, 300 - (current_time - self.five_minute_requests[0])
+            )
+        if wait_time > 0:
+            return wait_time
 
         # Record this request
-        current_time = time.time()
         self.minute_requests.append(current_time)
         self.five_minute_requests.append(current_time)
+        return 0.0
 
     def _clean_old_requests(self, current_time: float) -> None:
         """Remove old request timestamps."""
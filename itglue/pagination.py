@@ -5,10 +5,26 @@ Handles pagination for ITGlue API responses following JSON API specification.
 Supports both automatic pagination (fetch all) and manual pagination control.
 """
 
-from typing import Any, Dict, List, Optional, Iterator, Generator
+import math
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Iterable,
+    Iterator,
+    Generator,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 import structlog
 
-from .exceptions import ITGlueAPIError
+from .exceptions import ITGlueAPIError, ITGlueCacheError
+
+if TYPE_CHECKING:
+    from .cache import CacheManager
 
 
 class PaginationInfo:
@@ -27,7 +43,7 @@ class PaginationInfo:
     @property
     def has_next(self) -> bool:
         """Check if there are more pages."""
-        return self.next_page is not None
+        return self.next_page is not None or bool(self.meta.get("has-next-page", False))
 
     @property
     def has_prev(self) -> bool:
@@ -59,10 +75,12 @@ class PaginatedResponse:
         data: List[Dict[str, Any]],
         meta: Dict[str, Any],
         links: Optional[Dict[str, Any]] = None,
+        included: Optional[List[Dict[str, Any]]] = None,
     ):
         self.data = data
         self.meta = meta
         self.links = links or {}
+        self.included = included or []
         self.pagination = PaginationInfo(meta)
 
     def __len__(self) -> int:
@@ -84,16 +102,86 @@ class PaginatedResponse:
         )
 
 
+class PaginationCursor:
+    """Pagination state for a single scan.
+
+    Each scan owns its cursor, so one ``PaginationHandler`` can drive any
+    number of concurrent scans from different threads or tasks. A cursor
+    itself must only be advanced by one caller at a time.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        query: Dict[str, Any],
+        page_size: Optional[int] = None,
+        snapshot_id: Optional[str] = None,
+        from_snapshot: bool = False,
+        bypass_cache: bool = False,
+    ):
+        self.endpoint = endpoint
+        self.query = query
+        self.page_size = page_size
+        self.snapshot_id = snapshot_id
+        self.from_snapshot = from_snapshot
+        self.bypass_cache = bypass_cache
+        self.publish_snapshot = not bypass_cache
+        self.started_at = time.time()
+        self.next_page: Optional[int] = 1
+        self.pages_fetched: List[int] = []
+        # Live pages are cached together with the manifest once the scan ends
+        self.pending_pages: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        self.last_response: Optional[PaginatedResponse] = None
+
+    @property
+    def has_next(self) -> bool:
+        """Check if the scan has more pages to fetch."""
+        return self.next_page is not None
+
+    @property
+    def completed(self) -> bool:
+        """Check if the scan reached the last page."""
+        return self.next_page is None
+
+    def page_info(self) -> Dict[str, Any]:
+        """Get information about the most recently fetched page."""
+        if self.last_response is None:
+            return {}
+
+        meta = self.last_response.meta
+        return {
+            "current_page": meta.get("current-page", 1),
+            "total_pages": meta.get("total-pages", 1),
+            "total_count": meta.get("total-count", 0),
+            "per_page": meta.get("per-page", 50),
+            "has_next_page": self.has_next,
+            "has_prev_page": meta.get("has-prev-page", False),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"PaginationCursor(endpoint={self.endpoint!r}, "
+            f"next_page={self.next_page}, pages={len(self.pages_fetched)})"
+        )
+
+
 class PaginationHandler:
-    """Handles pagination for ITGlue API responses."""
+    """Handles pagination for ITGlue API responses.
+
+    The handler holds no per-scan state; scan progress lives in a
+    :class:`PaginationCursor`, so a single handler is safe to share.
+    """
+
+    def __init__(self, http_client, cache: Optional["CacheManager"] = None):
+        """Initialize with HTTP client for making requests.
 
-    def __init__(self, http_client):
-        """Initialize with HTTP client for making requests."""
+        Args:
+            http_client: Client used to fetch pages
+            cache: Optional cache manager for page-level response caching
+        """
         self.http_client = http_client
+        self.cache = cache
         self.logger = structlog.get_logger().bind(component="pagination")
-        self.last_response = None
-        self.endpoint = ""
-        self.current_page = 1
 
     def parse_response(self, response_data: Dict[str, Any]) -> PaginatedResponse:
         """Parse API response into PaginatedResponse object."""
@@ -103,12 +191,13 @@ class PaginationHandler:
         data = response_data.get("data", [])
         meta = response_data.get("meta", {})
         links = response_data.get("links", {})
+        included = response_data.get("included", [])
 
         if not isinstance(data, list):
             # Single item response - wrap in list
             data = [data] if data else []
 
-        return PaginatedResponse(data, meta, links)
+        return PaginatedResponse(data, meta, links, included)
 
     def build_params(self, **kwargs) -> Dict[str, Any]:
         """Build parameters for pagination requests."""
@@ -118,16 +207,48 @@ class PaginationHandler:
                 params[key] = str(value)
         return params
 
-    def get_page(self, endpoint: str, page: int, page_size: Optional[int] = None, **kwargs) -> PaginatedResponse:
-        """Get specific page."""
+    def get_page(
+        self,
+        endpoint: str,
+        page: int,
+        page_size: Optional[int] = None,
+        force_refresh: bool = False,
+        cache_ttl: Optional[int] = None,
+        **kwargs,
+    ) -> PaginatedResponse:
+        """Get specific page.
+
+        When a cache is configured the page is served from it if present and
+        written to it after every fetch. ``force_refresh`` skips the lookup
+        but still refreshes the cached copy. ``cache_ttl`` overrides the
+        endpoint's cache TTL policy.
+        """
         params = self.build_params(**kwargs)
         params["page[number]"] = str(page)
         
         if page_size:
             params["page[size]"] = str(page_size)
-        
-        response = self.http_client.get(endpoint, params=params)
-        self.last_response = response
+
+        if self.cache and not force_refresh:
+            cached = self.cache.get(
+                endpoint,
+                params,
+                refresh=lambda: self.http_client.get(endpoint, params=params),
+            )
+            if cached:
+                return self.parse_response(cached)
+
+        try:
+            response = self.http_client.get(endpoint, params=params)
+        except Exception:
+            if self.cache:
+                # Let callers waiting on this fetch try for themselves
+                self.cache.release_lease(endpoint, params)
+            raise
+
+        if self.cache:
+            self.cache.set(endpoint, response, params, ttl=cache_ttl)
+
         return self.parse_response(response)
 
     def get_next_page(self, endpoint: str, current_response: PaginatedResponse, **kwargs) -> Optional[PaginatedResponse]:
@@ -136,6 +257,8 @@ class PaginationHandler:
             return None
         
         next_page = current_response.pagination.next_page
+        if next_page is None:
+            next_page = current_response.pagination.current_page + 1
         return self.get_page(endpoint, next_page, **kwargs)
 
     def get_prev_page(self, endpoint: str, current_response: PaginatedResponse, **kwargs) -> Optional[PaginatedResponse]:
@@ -149,26 +272,15 @@ class PaginationHandler:
     def get_all_pages(self, endpoint: str, page_size: Optional[int] = None, max_pages: Optional[int] = None, **kwargs) -> PaginatedResponse:
         """Get all pages of results."""
         all_data = []
-        page_num = 1
         pages_fetched = 0
-        
-        while True:
-            if max_pages and pages_fetched >= max_pages:
-                break
-                
-            response = self.get_page(endpoint, page_num, page_size, **kwargs)
-            if not response or not response.data:
+
+        for response in self.iterate_pages(endpoint, page_size, kwargs, max_pages):
+            if not response.data:
                 break
-                
+
             all_data.extend(response.data)
             pages_fetched += 1
             
-            # Check if there are more pages
-            if not response.pagination.has_next:
-                break
-                
-            page_num = response.pagination.next_page
-            
         # Create combined response
         combined_meta = {
             "total-count": len(all_data),
@@ -178,25 +290,162 @@ class PaginationHandler:
         
         return PaginatedResponse(all_data, combined_meta, {})
 
+    def open_cursor(
+        self,
+        endpoint: str,
+        page_size: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+        force_refresh: bool = False,
+        bypass_cache: bool = False,
+    ) -> PaginationCursor:
+        """Start a new scan and return its cursor.
+
+        With a cache configured, the cursor is bound to the cached snapshot
+        of the last complete scan of the same query if one exists, and to a
+        fresh snapshot ID otherwise. With ``bypass_cache`` the scan neither
+        reads nor writes the cache, so a one-off bulk export does not push
+        out entries that interactive reads depend on.
+        """
+        query = self.build_params(**(params or {}))
+        if page_size:
+            query["page[size]"] = str(page_size)
+
+        snapshot = None
+        snapshot_id = None
+        if self.cache and not bypass_cache:
+            if not force_refresh:
+                snapshot = self.cache.get_scan_snapshot(endpoint, query)
+            snapshot_id = (
+                snapshot["snapshot_id"] if snapshot else self.cache.new_snapshot_id()
+            )
+
+        return PaginationCursor(
+            endpoint,
+            query,
+            page_size=page_size,
+            snapshot_id=snapshot_id,
+            from_snapshot=snapshot is not None,
+            bypass_cache=bypass_cache,
+        )
+
+    def fetch_next(self, cursor: PaginationCursor) -> Optional[PaginatedResponse]:
+        """Fetch the cursor's next page and advance it.
+
+        Returns None once the scan is complete. Pages of a live scan are
+        held by the cursor until its last page is fetched, then cached
+        together with the snapshot manifest, so a scan that stops early
+        leaves nothing in the cache.
+
+        If a page of the cursor's snapshot has been evicted since the scan
+        started, the snapshot is retired. A scan that has not returned any
+        page yet restarts live under a new snapshot ID; otherwise
+        ITGlueCacheError is raised, since continuing live would mix pages
+        from different points in time. Rerunning the scan fetches it live.
+        """
+        if not cursor.has_next:
+            return None
+
+        page = cursor.next_page
+        page_params = cursor.query.copy()
+        page_params["page[number]"] = str(page)
+
+        response_data = None
+        if cursor.from_snapshot:
+            response_data = self.cache.get(
+                cursor.endpoint, page_params, snapshot_id=cursor.snapshot_id
+            )
+            if response_data is None:
+                # Only possible if the page was evicted mid-scan
+                self.logger.warning(
+                    "Snapshot page missing, retiring snapshot",
+                    endpoint=cursor.endpoint,
+                    page=page,
+                )
+                self.cache.delete_scan_snapshot(cursor.endpoint, cursor.query)
+                if cursor.pages_fetched:
+                    raise ITGlueCacheError(
+                        f"Snapshot of {cursor.endpoint} lost page {page} "
+                        "mid-scan; restart the scan"
+                    )
+                cursor.snapshot_id = self.cache.new_snapshot_id()
+                cursor.from_snapshot = False
+                cursor.started_at = time.time()
+
+        if response_data is None:
+            response_data = self.http_client.get(cursor.endpoint, params=page_params)
+            if self.cache and not (cursor.from_snapshot or cursor.bypass_cache):
+                cursor.pending_pages.append((page_params, response_data))
+
+        response = self.parse_response(response_data)
+        cursor.last_response = response
+        cursor.pages_fetched.append(page)
+
+        if response.pagination.has_next:
+            next_page = response.pagination.next_page
+            cursor.next_page = int(next_page) if next_page is not None else page + 1
+        else:
+            cursor.next_page = None
+            if cursor.publish_snapshot:
+                self._publish_snapshot(cursor)
+
+        return response
+
+    def _publish_snapshot(self, cursor: PaginationCursor) -> None:
+        """Cache the pages and manifest of a completed live scan."""
+        if (
+            self.cache
+            and cursor.completed
+            and not (cursor.from_snapshot or cursor.bypass_cache)
+        ):
+            self.cache.set_scan_snapshot(
+                cursor.endpoint,
+                cursor.query,
+                cursor.snapshot_id,
+                cursor.pages_fetched,
+                cursor.started_at,
+                responses=cursor.pending_pages,
+            )
+        cursor.pending_pages = []
+
     def iterate_pages(
         self,
         endpoint: str,
         page_size: Optional[int] = None,
         params: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
+        force_refresh: bool = False,
+        cursor: Optional[PaginationCursor] = None,
+        bypass_cache: bool = False,
     ) -> Generator[PaginatedResponse, None, None]:
-        """Generator that yields each page as PaginatedResponse."""
-        page = 1
-        pages_yielded = 0
+        """Generator that yields each page as PaginatedResponse.
+
+        With a cache configured, the pages of a scan that completes are
+        cached under a snapshot ID shared by that scan only, together with
+        its manifest, and later scans of the same query are served
+        entirely from that snapshot while all of its pages remain cached.
+        Otherwise the scan is fetched live under a new snapshot, so a cached
+        listing never mixes pages from different points in time.
+
+        Pass a cursor from :meth:`open_cursor` to observe or resume the
+        scan's progress; otherwise a new one is opened. ``bypass_cache``
+        fetches every page live and caches none of them, which also keeps
+        the cursor from holding a long scan's pages until it ends.
+        """
+        if cursor is None:
+            cursor = self.open_cursor(
+                endpoint, page_size, params, force_refresh, bypass_cache
+            )
 
         self.logger.info(
             "Starting page iteration",
-            endpoint=endpoint,
-            page_size=page_size,
+            endpoint=cursor.endpoint,
+            page_size=cursor.page_size,
             max_pages=max_pages,
+            from_snapshot=cursor.from_snapshot,
         )
 
-        while True:
+        pages_yielded = 0
+        while cursor.has_next:
             if max_pages and pages_yielded >= max_pages:
                 self.logger.warning(
                     "Reached max pages limit in iteration",
@@ -205,16 +454,9 @@ class PaginationHandler:
                 )
                 break
 
-            # Merge params with pagination params
-            all_params = params.copy() if params else {}
-            response = self.get_page(endpoint, page, page_size, **all_params)
-            yield response
+            response = self.fetch_next(cursor)
             pages_yielded += 1
-
-            if not response.pagination.has_next:
-                break
-
-            page = response.pagination.next_page
+            yield response
 
         self.logger.info("Completed page iteration", pages_yielded=pages_yielded)
 
@@ -224,30 +466,110 @@ class PaginationHandler:
         page_size: Optional[int] = None,
         params: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
+        consistent: bool = False,
+        bypass_cache: bool = False,
     ) -> Generator[Dict[str, Any], None, None]:
-        """Generator that yields individual items from all pages."""
-        for page_response in self.iterate_pages(endpoint, page_size, params, max_pages):
+        """Generator that yields individual items from all pages.
+
+        Page-number pagination over data that changes mid-scan can repeat
+        or skip records. With ``consistent=True`` the scan is fetched live,
+        items are de-duplicated by ``(type, id)``, and when ``total-count``
+        drops between pages the preceding pages that records may have
+        shifted into are fetched again. Changes that leave the total
+        unchanged (an insert and a delete together) cannot be detected.
+
+        With ``bypass_cache`` pages are fetched live and not cached.
+        """
+        if consistent:
+            yield from self._iterate_items_consistent(
+                endpoint, page_size, params, max_pages, bypass_cache
+            )
+            return
+
+        for page_response in self.iterate_pages(
+            endpoint, page_size, params, max_pages, bypass_cache=bypass_cache
+        ):
             for item in page_response.data:
                 yield item
 
-    def has_next_page(self) -> bool:
-        """Check if there's a next page based on last response."""
-        if not self.last_response:
-            return False
-        meta = self.last_response.get("meta", {})
-        return meta.get("has-next-page", False)
+    def _iterate_items_consistent(
+        self,
+        endpoint: str,
+        page_size: Optional[int],
+        params: Optional[Dict[str, Any]],
+        max_pages: Optional[int],
+        bypass_cache: bool = False,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Yield each item once, recovering records shifted by deletions."""
+        cursor = self.open_cursor(
+            endpoint, page_size, params, force_refresh=True, bypass_cache=bypass_cache
+        )
+        cursor.publish_snapshot = False
+
+        seen: Set[Tuple[Any, Any]] = set()
+        page_length = page_size
+        total_count = None
+        drifted = False
+
+        def _unseen(items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for item in items:
+                key = (item.get("type"), item.get("id"))
+                if key not in seen:
+                    seen.add(key)
+                    yield item
+
+        while cursor.has_next:
+            if max_pages and len(cursor.pages_fetched) >= max_pages:
+                break
 
-    def get_current_page_info(self) -> Dict[str, Any]:
-        """Get current page information from last response."""
-        if not self.last_response:
-            return {}
-            
-        meta = self.last_response.get("meta", {})
-        return {
-            "current_page": meta.get("current-page", 1),
-            "total_pages": meta.get("total-pages", 1),
-            "total_count": meta.get("total-count", 0),
-            "per_page": meta.get("per-page", 50),
-            "has_next_page": meta.get("has-next-page", False),
-            "has_prev_page": meta.get("has-prev-page", False),
-        }
+            previous_page = cursor.pages_fetched[-1] if cursor.pages_fetched else None
+            response = self.fetch_next(cursor)
+            page_length = page_length or len(response) or None
+            current_total = response.meta.get("total-count")
+
+            if (
+                total_count is not None
+                and current_total is not None
+                and current_total != total_count
+            ):
+                drifted = True
+                removed = total_count - current_total
+                self.logger.warning(
+                    "Total count changed during scan",
+                    endpoint=endpoint,
+                    page=cursor.pages_fetched[-1],
+                    previous_total=total_count,
+                    total=current_total,
+                )
+                if removed > 0 and previous_page and page_length:
+                    # Records from the head of this page shifted back into
+                    # the tail of the pages already read
+                    first_page = max(
+                        1, previous_page - math.ceil(removed / page_length) + 1
+                    )
+                    for page in range(first_page, previous_page + 1):
+                        yield from _unseen(self._fetch_live(cursor, page).data)
+
+            if current_total is not None:
+                total_count = current_total
+
+            yield from _unseen(response.data)
+
+        if not drifted:
+            self._publish_snapshot(cursor)
+
+    def _fetch_live(self, cursor: PaginationCursor, page: int) -> PaginatedResponse:
+        """Fetch one page of a cursor's query, bypassing the cache."""
+        page_params = cursor.query.copy()
+        page_params["page[number]"] = str(page)
+        return self.parse_response(
+            self.http_client.get(cursor.endpoint, params=page_params)
+        )
+
+    def has_next_page(self, cursor: PaginationCursor) -> bool:
+        """Check if the scan behind ``cursor`` has another page."""
+        return cursor.has_next
+
+    def get_current_page_info(self, cursor: PaginationCursor) -> Dict[str, Any]:
+        """Get page information for the scan behind ``cursor``."""
+        return cursor.page_info()
@@ -0,0 +1,213 @@
+"""
+ITGlue Cache Serialization
+
+Encodes cache entries for byte-oriented backends such as Redis. Each
+encoded value starts with a small header naming the format version, the
+serializer and the compression used, so entries written with different
+settings can share one store and be read back by any client.
+"""
+
+import json
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Union
+
+# Header: magic, format version, serializer id, compression id
+_MAGIC = b"IG"
+FORMAT_VERSION = 1
+_HEADER_SIZE = len(_MAGIC) + 3
+
+
+class CacheSerializer(ABC):
+    """Converts cache values to and from bytes."""
+
+    #: Identifier stored in the entry header
+    format_id: int
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serialize a value."""
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Deserialize a value."""
+        pass
+
+
+class JSONSerializer(CacheSerializer):
+    """Compact JSON serializer."""
+
+    format_id = 1
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class MsgpackSerializer(CacheSerializer):
+    """MessagePack serializer (requires the ``msgpack`` package)."""
+
+    format_id = 2
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError(
+                "msgpack is required for the msgpack cache serializer. "
+                "Install it with: pip install msgpack"
+            )
+        self._msgpack = msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False)
+
+
+class _Compressor(ABC):
+    """Compresses encoded payloads."""
+
+    format_id: int
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        pass
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        pass
+
+
+class _ZlibCompressor(_Compressor):
+    format_id = 1
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class _ZstdCompressor(_Compressor):
+    format_id = 2
+
+    def __init__(self, level: int = 3):
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstandard is required for zstd cache compression. "
+                "Install it with: pip install zstandard"
+            )
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+SERIALIZERS = {"json": JSONSerializer, "msgpack": MsgpackSerializer}
+COMPRESSIONS = {"zlib": _ZlibCompressor, "zstd": _ZstdCompressor}
+
+
+class CacheCodec:
+    """Encodes cache values with a serializer, optional compression and header.
+
+    Values whose serialized form is at least ``compress_threshold`` bytes are
+    compressed; smaller ones are stored as is, where compression costs more
+    time than it saves space. Data without a header is decoded as plain JSON,
+    the format used before headers were introduced.
+
+    Args:
+        serializer: ``"json"``, ``"msgpack"`` or a :class:`CacheSerializer`
+        compression: ``"zlib"``, ``"zstd"`` or None to disable compression
+        compress_threshold: Minimum serialized size in bytes to compress
+    """
+
+    def __init__(
+        self,
+        serializer: Union[str, CacheSerializer] = "json",
+        compression: Optional[str] = "zlib",
+        compress_threshold: int = 1024,
+    ):
+        if isinstance(serializer, str):
+            if serializer not in SERIALIZERS:
+                raise ValueError(f"Unknown cache serializer: {serializer}")
+            serializer = SERIALIZERS[serializer]()
+
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        self.serializer = serializer
+        self.compressor = COMPRESSIONS[compression]() if compression else None
+        self.compress_threshold = compress_threshold
+
+        # Decoders for every format this codec can read
+        self._serializers: Dict[int, CacheSerializer] = {
+            JSONSerializer.format_id: JSONSerializer(),
+            serializer.format_id: serializer,
+        }
+        self._compressors: Dict[int, _Compressor] = {
+            _ZlibCompressor.format_id: _ZlibCompressor(),
+        }
+        if self.compressor is not None:
+            self._compressors[self.compressor.format_id] = self.compressor
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value with its header."""
+        payload = self.serializer.dumps(value)
+        compression_id = 0
+
+        if self.compressor is not None and len(payload) >= self.compress_threshold:
+            payload = self.compressor.compress(payload)
+            compression_id = self.compressor.format_id
+
+        header = _MAGIC + bytes(
+            (FORMAT_VERSION, self.serializer.format_id, compression_id)
+        )
+        return header + payload
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """Decode a value written by :meth:`encode` or as plain JSON.
+
+        Raises:
+            ValueError: If the entry uses an unknown version or format
+        """
+        if isinstance(data, str):
+            data = data.encode()
+
+        if not data.startswith(_MAGIC):
+            return json.loads(data)
+
+        if len(data) < _HEADER_SIZE:
+            raise ValueError("Truncated cache entry header")
+
+        version, serializer_id, compression_id = data[len(_MAGIC) : _HEADER_SIZE]
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported cache entry version: {version}")
+
+        serializer = self._serializers.get(serializer_id)
+        if serializer is None:
+            raise ValueError(f"Unsupported cache serializer id: {serializer_id}")
+
+        payload = data[_HEADER_SIZE:]
+        if compression_id:
+            compressor = self._compressors.get(compression_id)
+            if compressor is None:
+                raise ValueError(
+                    f"Unsupported cache compression id: {compression_id}"
+                )
+            payload = compressor.decompress(payload)
+
+        return serializer.loads(payload)
@@ -0,0 +1,96 @@
+"""
+ITGlue Cache Warm-up
+
+Declarative queries for prefilling the cache, e.g. at service startup, so
+that the first real requests for reference data and hot listings are
+served from the cache. Run them with :meth:`ITGlueClient.warm_cache`.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class WarmupQuery:
+    """A request to prefetch into the cache.
+
+    The endpoint and params must be exactly those sent by the calls to be
+    served from the cache, since together they form the cache key. For
+    example ``FlexibleAssetTypesAPI.get_enabled_types()`` sends
+    ``{"filter[enabled]": "true"}`` to ``/flexible_asset_types``.
+
+    Args:
+        endpoint: API endpoint, e.g. ``/organization_types``
+        params: Query parameters
+        follow: Function returning further queries to warm from this
+            query's response, e.g. the fields of each flexible asset type
+        cache_ttl: Override the endpoint's cache TTL policy
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        follow: Optional[Callable[[Dict[str, Any]], Iterable["WarmupQuery"]]] = None,
+        cache_ttl: Optional[int] = None,
+    ):
+        self.endpoint = endpoint
+        self.params = params
+        self.follow = follow
+        self.cache_ttl = cache_ttl
+
+    def __repr__(self) -> str:
+        return f"WarmupQuery(endpoint={self.endpoint!r}, params={self.params!r})"
+
+
+class WarmupResult:
+    """Outcome of one warm-up query."""
+
+    def __init__(
+        self,
+        query: WarmupQuery,
+        response: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None,
+        seconds: float = 0.0,
+    ):
+        self.query = query
+        self.response = response
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        """Check if the query was fetched or already cached."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"WarmupResult(endpoint={self.query.endpoint!r}, {status})"
+
+
+def _flexible_asset_fields(response: Dict[str, Any]) -> List[WarmupQuery]:
+    """Queries for the fields of each type, as sent by ``get_by_type``."""
+    return [
+        WarmupQuery(
+            "/flexible_asset_fields",
+            {"filter[flexible_asset_type_id]": str(asset_type["id"])},
+        )
+        for asset_type in response.get("data") or []
+        if isinstance(asset_type, dict) and "id" in asset_type
+    ]
+
+
+def reference_data_queries() -> List[WarmupQuery]:
+    """Queries for the reference data most services read at startup.
+
+    Covers the first page of organizations, organization types and
+    statuses, the enabled flexible asset types and the fields of each.
+    """
+    return [
+        WarmupQuery("/organizations"),
+        WarmupQuery("/organization_types"),
+        WarmupQuery("/organization_statuses"),
+        WarmupQuery(
+            "/flexible_asset_types",
+            {"filter[enabled]": "true"},
+            follow=_flexible_asset_fields,
+        ),
+    ]
@@ -375,3 +375,544 @@ class TestAPIOperations:
             mock_http_client.get.assert_called_once_with(
                 "/test-resources", params=expected_params
             )
+
+
+class TestStreamingIteration:
+    """Test lazy page and item iteration."""
+
+    @staticmethod
+    def _page(ids, **meta):
+        return {
+            "data": [
+                {"type": "organizations", "id": i, "attributes": {"name": f"Org {i}"}}
+                for i in ids
+            ],
+            "meta": meta,
+        }
+
+    def test_iter_pages_hydrates_each_page(self, test_api, mock_http_client):
+        """Test that pages are fetched and hydrated one at a time."""
+        mock_http_client.get = Mock(
+            side_effect=[
+                self._page(["1", "2"], **{"current-page": 1, "next-page": 2}),
+                self._page(["3"], **{"current-page": 2}),
+            ]
+        )
+
+        pages = test_api.iter_pages(per_page=2)
+
+        first = next(pages)
+        assert isinstance(first, ITGlueResourceCollection)
+        assert [item.id for item in first] == ["1", "2"]
+        assert mock_http_client.get.call_count == 1
+
+        second = next(pages)
+        assert [item.id for item in second] == ["3"]
+        assert list(pages) == []
+
+        mock_http_client.get.assert_called_with(
+            "/test-resources", params={"page[size]": "2", "page[number]": "2"}
+        )
+
+    def test_iter_pages_has_next_page_flag(self, test_api, mock_http_client):
+        """Test pagination driven by the has-next-page flag."""
+        mock_http_client.get = Mock(
+            side_effect=[
+                self._page(["1"], **{"has-next-page": True}),
+                self._page(["2"], **{"has-next-page": False}),
+            ]
+        )
+
+        pages = list(test_api.iter_pages())
+
+        assert len(pages) == 2
+        assert mock_http_client.get.call_count == 2
+
+    def test_iter_pages_max_pages(self, test_api, mock_http_client):
+        """Test that max_pages stops iteration early."""
+        mock_http_client.get = Mock(
+            return_value=self._page(["1"], **{"next-page": 2})
+        )
+
+        pages = list(test_api.iter_pages(max_pages=1))
+
+        assert len(pages) == 1
+        mock_http_client.get.assert_called_once()
+
+    def test_iter_all_yields_models(self, test_api, mock_http_client):
+        """Test iterating individual models across pages."""
+        mock_http_client.get = Mock(
+            side_effect=[
+                self._page(["1", "2"], **{"next-page": 2}),
+                self._page(["3"]),
+            ]
+        )
+
+        items = list(test_api.iter_all(filter_params={"name": "Org"}))
+
+        assert [item.id for item in items] == ["1", "2", "3"]
+        assert all(isinstance(item, MockTestResource) for item in items)
+        params = mock_http_client.get.call_args_list[0][1]["params"]
+        assert params["filter[name]"] == "Org"
+
+    def test_list_all_collects_pages(self, test_api, mock_http_client):
+        """Test list_all gathers every page into one collection."""
+        mock_http_client.get = Mock(
+            side_effect=[
+                self._page(["1"], **{"has-next-page": True}),
+                self._page(["2"]),
+            ]
+        )
+
+        result = test_api.list_all()
+
+        assert isinstance(result, ITGlueResourceCollection)
+        assert [item.id for item in result] == ["1", "2"]
+        assert result.meta == {"total-count": 2}
+
+
+class TestEarlyExit:
+    """Test limit-aware take/first queries."""
+
+    _page = staticmethod(TestStreamingIteration._page)
+
+    def test_take_sizes_page_to_limit(self, test_api, mock_http_client):
+        """Test take requests exactly n items in one call."""
+        mock_http_client.get = Mock(
+            return_value=self._page(["1", "2", "3"], **{"next-page": 2})
+        )
+
+        items = test_api.take(3, filter_params={"name": "Org"})
+
+        assert [item.id for item in items] == ["1", "2", "3"]
+        mock_http_client.get.assert_called_once_with(
+            "/test-resources",
+            params={"page[size]": "3", "filter[name]": "Org", "page[number]": "1"},
+        )
+
+    def test_take_with_predicate_stops_paging(self, test_api, mock_http_client):
+        """Test predicate scans stop once enough matches are found."""
+        mock_http_client.get = Mock(
+            side_effect=[
+                self._page(["1", "2"], **{"next-page": 2}),
+                self._page(["3", "4"], **{"next-page": 3}),
+                self._page(["5"]),
+            ]
+        )
+
+        items = test_api.take(1, predicate=lambda item: item.id == "3")
+
+        assert [item.id for item in items] == ["3"]
+        assert mock_http_client.get.call_count == 2
+        assert "page[size]" not in mock_http_client.get.call_args[1]["params"]
+
+    def test_take_returns_fewer_when_exhausted(self, test_api, mock_http_client):
+        """Test take returns what exists when fewer than n match."""
+        mock_http_client.get = Mock(return_value=self._page(["1"]))
+
+        assert [item.id for item in test_api.take(5)] == ["1"]
+        assert test_api.take(0) == []
+        assert mock_http_client.get.call_count == 1
+
+    def test_first(self, test_api, mock_http_client):
+        """Test first returns a single resource or None."""
+        mock_http_client.get = Mock(
+            side_effect=[self._page(["7"]), self._page([])]
+        )
+
+        assert test_api.first(sort="name").id == "7"
+        assert test_api.first() is None
+        params = mock_http_client.get.call_args_list[0][1]["params"]
+        assert params["page[size]"] == "1"
+        assert params["sort"] == "name"
+
+
+class TestCounting:
+    """Test count probes and facet counts."""
+
+    def test_count_uses_single_item_probe(self, test_api, mock_http_client):
+        """Test count reads total-count from a page[size]=1 request."""
+        mock_http_client.get = Mock(
+            return_value={"data": [], "meta": {"total-count": 42}}
+        )
+
+        assert test_api.count(filter_params={"name": "Org"}) == 42
+        mock_http_client.get.assert_called_once_with(
+            "/test-resources",
+            params={"page[number]": "1", "page[size]": "1", "filter[name]": "Org"},
+        )
+
+    def test_count_falls_back_to_scan(self, test_api, mock_http_client):
+        """Test count scans pages when no total is reported."""
+        mock_http_client.get = Mock(
+            side_effect=[
+                {"data": [], "meta": {}},
+                {"data": [{"id": "1"}, {"id": "2"}], "meta": {"next-page": 2}},
+                {"data": [{"id": "3"}], "meta": {}},
+            ]
+        )
+
+        assert test_api.count() == 3
+
+    def test_count_is_cached(self, mock_http_client):
+        """Test repeated counts are served from the cache."""
+        from itglue.cache import CacheManager
+
+        api = MockTestAPI(mock_http_client)
+        api.cache = CacheManager(ITGlueConfig(api_key="test-key"))
+        mock_http_client.get = Mock(
+            return_value={"data": [], "meta": {"total-count": 7}}
+        )
+
+        assert api.count() == 7
+        assert api.count() == 7
+        assert mock_http_client.get.call_count == 1
+
+        assert api.count(force_refresh=True) == 7
+        assert mock_http_client.get.call_count == 2
+
+    def test_facet_counts(self, test_api, mock_http_client):
+        """Test one probe per facet value, keyed by value."""
+        totals = {"Active": 5, "Inactive": 2}
+
+        def _get(url, params):
+            return {"data": [], "meta": {"total-count": totals[params["filter[status]"]]}}
+
+        mock_http_client.get = Mock(side_effect=_get)
+
+        result = test_api.facet_counts(
+            "status", ["Active", "Inactive", "Active"], filter_params={"org": "1"}
+        )
+
+        assert result == {"Active": 5, "Inactive": 2}
+        assert mock_http_client.get.call_count == 2
+        for call in mock_http_client.get.call_args_list:
+            assert call[1]["params"]["filter[org]"] == "1"
+
+    def test_facet_counts_empty(self, test_api, mock_http_client):
+        """Test no probes are issued for no values."""
+        assert test_api.facet_counts("status", []) == {}
+        mock_http_client.get.assert_not_called()
+
+
+class TestNegativeCaching:
+    """Test remembered 404s and empty lookups."""
+
+    @pytest.fixture
+    def cached_api(self, mock_http_client):
+        """Test API instance backed by a memory cache."""
+        from itglue.cache import CacheManager
+
+        api = MockTestAPI(mock_http_client)
+        api.cache = CacheManager(ITGlueConfig(api_key="test-key"))
+        api.pagination.cache = api.cache
+        return api
+
+    def test_get_404_is_remembered(self, cached_api, mock_http_client):
+        """Test a missing resource is not requested again."""
+        mock_http_client.get = Mock(
+            side_effect=ITGlueAPIError("Not found", status_code=404)
+        )
+
+        for _ in range(2):
+            with pytest.raises(ITGlueNotFoundError):
+                cached_api.get("404")
+
+        assert mock_http_client.get.call_count == 1
+
+    def test_empty_filtered_list_is_remembered(self, cached_api, mock_http_client):
+        """Test an empty filtered list is served from the negative cache."""
+        mock_http_client.get = Mock(return_value={"data": [], "meta": {}})
+
+        first = cached_api.list(filter_params={"hostname": "missing"})
+        second = cached_api.list(filter_params={"hostname": "missing"}, per_page=5)
+
+        assert len(first) == 0
+        assert len(second) == 0
+        assert mock_http_client.get.call_count == 1
+
+    def test_unfiltered_and_later_pages_not_remembered(
+        self, cached_api, mock_http_client
+    ):
+        """Test only first-page filtered lookups are negatively cached."""
+        mock_http_client.get = Mock(return_value={"data": [], "meta": {}})
+
+        cached_api.list()
+        cached_api.list(page=3, filter_params={"name": "x"})
+
+        assert not cached_api.cache.is_negative("/test-resources", "/test-resources", {})
+        assert not cached_api.cache.is_negative(
+            "/test-resources", "/test-resources", {"filter[name]": "x"}
+        )
+
+    def test_empty_take_is_remembered(self, cached_api, mock_http_client):
+        """Test lookups through first() share the negative cache."""
+        mock_http_client.get = Mock(return_value={"data": [], "meta": {}})
+
+        assert cached_api.first(filter_params={"email": "nobody@example.com"}) is None
+        assert cached_api.first(filter_params={"email": "nobody@example.com"}) is None
+        assert cached_api.list(filter_params={"email": "nobody@example.com"}).data == []
+
+        assert mock_http_client.get.call_count == 1
+
+    def test_repeated_first_is_served_from_cache(self, cached_api, mock_http_client):
+        """Test early-exit lookups share the page cache and leave no snapshots."""
+        mock_http_client.get = Mock(
+            return_value=TestStreamingIteration._page(["1"], **{"next-page": 2})
+        )
+
+        for _ in range(5):
+            assert cached_api.first(filter_params={"email": "a@example.com"}).id == "1"
+
+        assert mock_http_client.get.call_count == 1
+        assert len(list(cached_api.cache.backend.entries())) == 1
+
+    def test_predicate_miss_is_not_remembered(self, cached_api, mock_http_client):
+        """Test a client-side predicate miss is not treated as empty."""
+        mock_http_client.get = Mock(
+            return_value=TestStreamingIteration._page(["1"])
+        )
+
+        assert cached_api.take(1, filter_params={"name": "x"}, predicate=lambda i: False) == []
+        assert not cached_api.cache.is_negative(
+            "/test-resources", "/test-resources", {"filter[name]": "x"}
+        )
+
+    def test_create_invalidates_negative_results(self, cached_api, mock_http_client):
+        """Test a created resource is found by a previously empty lookup."""
+        created = {"type": "organizations", "id": "9", "attributes": {"name": "New"}}
+        mock_http_client.get = Mock(
+            side_effect=[
+                {"data": [], "meta": {}},
+                {"data": [created], "meta": {}},
+            ]
+        )
+        mock_http_client.post = Mock(return_value={"data": created})
+
+        assert cached_api.first(filter_params={"name": "New"}) is None
+        cached_api.create({"name": "New"})
+        found = cached_api.first(filter_params={"name": "New"})
+
+        assert found.id == "9"
+        assert mock_http_client.get.call_count == 2
+
+    def test_update_invalidates_negative_results(self, cached_api, mock_http_client):
+        """Test an updated resource is found by a previously empty lookup."""
+        renamed = {"type": "organizations", "id": "9", "attributes": {"name": "New"}}
+        mock_http_client.get = Mock(
+            side_effect=[
+                {"data": [], "meta": {}},
+                {"data": [renamed], "meta": {}},
+            ]
+        )
+        mock_http_client.patch = Mock(return_value={"data": renamed})
+
+        assert cached_api.first(filter_params={"name": "New"}) is None
+        cached_api.update("9", {"name": "New"})
+        found = cached_api.first(filter_params={"name": "New"})
+
+        assert found.id == "9"
+        assert mock_http_client.get.call_count == 2
+
+    def test_negative_scope_matches_raw_endpoint(self, cached_api):
+        """Test raw endpoint and API scopes name the same negative scope."""
+        cache = cached_api.cache
+        cache.set_negative(cached_api.base_url, "/test-resources", {"filter[x]": "1"})
+
+        cache.invalidate_negative("test-resources")
+
+        assert not cache.is_negative(
+            cached_api.base_url, "/test-resources", {"filter[x]": "1"}
+        )
+
+    def test_update_invalidates_only_affected_entries(
+        self, cached_api, mock_http_client
+    ):
+        """Test a write updates or drops only entries with the resource."""
+        cache = cached_api.cache
+        cache.config.cache_normalize = True
+        changed = {"type": "organizations", "id": "1"}
+        renamed = {**changed, "attributes": {"name": "Renamed"}}
+        cache.set("/test-resources", {"data": [changed]}, {"page[number]": "1"})
+        cache.set("/test-resources", {"data": [changed]}, {"filter[name]": "x"})
+        cache.set("/configurations/3", {"data": {}, "included": [changed]})
+        cache.set("/users", {"data": []})
+        mock_http_client.patch = Mock(return_value={"data": renamed})
+
+        cached_api.update("1", {"name": "Renamed"})
+
+        # The plain page is written through; the filtered one may have changed
+        assert cache.get("/test-resources", {"page[number]": "1"}) == {
+            "data": [renamed]
+        }
+        assert cache.get("/test-resources", {"filter[name]": "x"}) is None
+        assert cache.get("/configurations/3") is None
+        assert cache.get("/users") == {"data": []}
+
+    def test_update_without_normalization_drops_collection(self, mock_http_client):
+        """Test writes drop the whole collection when lists embed resources."""
+        from itglue.cache import CacheManager
+
+        api = MockTestAPI(mock_http_client)
+        api.cache = CacheManager(ITGlueConfig(api_key="test-key", cache_normalize=False))
+        changed = {"type": "organizations", "id": "1"}
+        api.cache.set("/test-resources", {"data": [changed]})
+        mock_http_client.patch = Mock(return_value={"data": changed})
+
+        api.update("1", {"name": "Renamed"})
+
+        assert api.cache.get("/test-resources") is None
+
+
+class TestReadThroughCache:
+    """Test resource reads are served from and invalidated in the cache."""
+
+    @pytest.fixture
+    def cached_api(self, mock_http_client):
+        """Test API instance backed by a memory cache."""
+        from itglue.cache import CacheManager
+
+        api = MockTestAPI(mock_http_client)
+        api.cache = CacheManager(ITGlueConfig(api_key="test-key"))
+        api.pagination.cache = api.cache
+        return api
+
+    @staticmethod
+    def _resource(name):
+        return {"data": {"type": "organizations", "id": "1", "attributes": {"name": name}}}
+
+    def test_get_and_list_are_cached(self, cached_api, mock_http_client):
+        """Test repeated reads are served from the cache."""
+        mock_http_client.get = Mock(
+            side_effect=[self._resource("Acme"), {"data": [], "meta": {}}]
+        )
+
+        assert cached_api.get("1").name == "Acme"
+        assert cached_api.get("1").name == "Acme"
+        cached_api.list(sort="name")
+        cached_api.list(sort="name")
+
+        assert mock_http_client.get.call_count == 2
+
+    def test_force_refresh_and_cache_ttl(self, cached_api, mock_http_client):
+        """Test per-call cache options."""
+        mock_http_client.get = Mock(
+            side_effect=[
+                self._resource("Old"),
+                self._resource("New"),
+                self._resource("Newest"),
+                self._resource("Latest"),
+            ]
+        )
+
+        cached_api.get("1")
+        assert cached_api.get("1", force_refresh=True).name == "New"
+        assert cached_api.get("1").name == "New"
+
+        # A TTL of 0 leaves nothing cached
+        cached_api.get("1", force_refresh=True, cache_ttl=0)
+        cached_api.cache.delete("/test-resources/1")
+        assert cached_api.get("1").name == "Latest"
+        assert mock_http_client.get.call_count == 4
+
+    def test_write_invalidates_cached_reads(self, cached_api, mock_http_client):
+        """Test updates and deletes drop the cached resource."""
+        mock_http_client.get = Mock(
+            side_effect=[self._resource("Old"), self._resource("New")]
+        )
+        mock_http_client.patch = Mock(return_value=self._resource("New"))
+        mock_http_client.delete = Mock(return_value=None)
+
+        cached_api.get("1")
+        cached_api.update("1", {"name": "New"})
+        assert cached_api.get("1").name == "New"
+
+        cached_api.delete("1")
+        assert cached_api.cache.get("/test-resources/1") is None
+
+    def test_failed_fetch_is_not_cached(self, cached_api, mock_http_client):
+        """Test errors propagate and leave no cache entry."""
+        mock_http_client.get = Mock(side_effect=ITGlueAPIError("boom", status_code=500))
+
+        with pytest.raises(ITGlueAPIError):
+            cached_api.list()
+
+        assert cached_api.cache.get("/test-resources", {}) is None
+
+
+class TestModelCache:
+    """Test decoded models are reused across reads."""
+
+    @pytest.fixture
+    def cached_api(self, mock_http_client):
+        """Test API instance with the model cache enabled."""
+        from itglue.cache import CacheManager
+
+        api = MockTestAPI(mock_http_client)
+        api.cache = CacheManager(
+            ITGlueConfig(api_key="test-key", cache_model_max_size=100)
+        )
+        api.pagination.cache = api.cache
+        return api
+
+    @staticmethod
+    def _resource(name, updated_at="2024-06-01T08:00:00.000Z"):
+        return {
+            "type": "organizations",
+            "id": "1",
+            "attributes": {"name": name, "updated-at": updated_at},
+        }
+
+    def test_repeated_reads_skip_validation(self, cached_api, mock_http_client):
+        """Test a resource seen again at the same version is not validated."""
+        mock_http_client.get = Mock(
+            return_value={"data": [self._resource("Acme")], "meta": {}}
+        )
+
+        first = cached_api.list(force_refresh=True)[0]
+        with patch.object(
+            MockTestResource, "from_api_dict", side_effect=AssertionError
+        ):
+            second = cached_api.list(force_refresh=True)[0]
+            assert cached_api.get_all()[0].name == "Acme"
+
+        assert second.name == "Acme"
+        assert second is not first
+        assert cached_api.cache.get_stats()["models"]["hits"] == 2
+
+    def test_copies_are_independent(self, cached_api, mock_http_client):
+        """Test changing a returned model does not change later reads."""
+        mock_http_client.get = Mock(return_value={"data": self._resource("Acme")})
+
+        model = cached_api.get("1", force_refresh=True)
+        model.name = "Changed"
+
+        assert cached_api.get("1", force_refresh=True).name == "Acme"
+
+    def test_new_version_is_decoded(self, cached_api, mock_http_client):
+        """Test a changed updated-at is validated again."""
+        mock_http_client.get = Mock(
+            side_effect=[
+                {"data": self._resource("Old")},
+                {"data": self._resource("New", "2024-06-02T08:00:00.000Z")},
+            ]
+        )
+
+        assert cached_api.get("1", force_refresh=True).name == "Old"
+        assert cached_api.get("1", force_refresh=True).name == "New"
+        assert cached_api.cache.get_stats()["models"]["misses"] == 2
+
+    def test_bypass_cache_scan_skips_model_cache(self, cached_api, mock_http_client):
+        """Test a bypassing scan caches neither pages nor models."""
+        mock_http_client.get = Mock(
+            return_value={"data": [self._resource("Acme")], "meta": {}}
+        )
+
+        assert cached_api.list_all(bypass_cache=True)[0].name == "Acme"
+        assert [item.name for item in cached_api.iter_all(bypass_cache=True)] == [
+            "Acme"
+        ]
+
+        assert mock_http_client.get.call_count == 2
+        assert len(cached_api.cache.models) == 0
+        assert cached_api.cache.backend.cache == {}
@@ -256,3 +256,20 @@ class TestConfigurationsAPISpecializedMethods:
 
             assert result == mock_config
             mock_http_client.post.assert_called_once()
+
+    def test_get_configuration_statistics_streams_pages(
+        self, configurations_api, mock_http_client, sample_configuration_data
+    ):
+        """Test statistics are aggregated across streamed pages."""
+        mock_http_client.get = Mock(
+            side_effect=[
+                {"data": [sample_configuration_data], "meta": {"next-page": 2}},
+                {"data": [sample_configuration_data], "meta": {}},
+            ]
+        )
+
+        stats = configurations_api.get_configuration_statistics()
+
+        assert stats["total_count"] == 2
+        assert stats["by_status"] == {"Active": 2}
+        assert mock_http_client.get.call_count == 2
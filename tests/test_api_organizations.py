@@ -84,7 +84,11 @@ class TestOrganizationsAPISpecializedMethods:
             )
 
             assert result == mock_org
-            expected_params = {"filter[name]": "Test Organization", "page[size]": "1"}
+            expected_params = {
+                "filter[name]": "Test Organization",
+                "page[size]": "1",
+                "page[number]": "1",
+            }
             mock_http_client.get.assert_called_once_with(
                 "/organizations", params=expected_params
             )
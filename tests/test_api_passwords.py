@@ -133,31 +133,29 @@ class TestPasswordsAPISearch:
 
     
     def test_get_by_name_exact_match(
-        self, passwords_api, sample_password_collection_data
+        self, passwords_api, mock_http_client, sample_password_collection_data
     ):
         """Test getting password by exact name match."""
         password_data = sample_password_collection_data["data"][0]
-        passwords_api.list = Mock(
-            return_value=[Password.from_api_dict(password_data)]
-        )
+        mock_http_client.get.return_value = {"data": [password_data], "meta": {}}
 
         result = passwords_api.get_by_name("Gmail", organization_id="456")
 
-        passwords_api.list.assert_called_once_with(
-            params={"filter[name]": "Gmail", "filter[organization-id]": "456"}
-        )
+        params = mock_http_client.get.call_args[1]["params"]
+        assert params["filter[name]"] == "Gmail"
+        assert params["filter[organization-id]"] == "456"
         assert result is not None
         assert result.name == "Gmail"
 
     
     def test_get_by_name_case_insensitive(
-        self, passwords_api, sample_password_collection_data
+        self, passwords_api, mock_http_client, sample_password_collection_data
     ):
         """Test getting password by name with case insensitive matching."""
-        password_data = sample_password_collection_data["data"][0]
-        passwords_api.list = Mock(
-            return_value=[Password.from_api_dict(password_data)]
-        )
+        mock_http_client.get.return_value = {
+            "data": sample_password_collection_data["data"],
+            "meta": {},
+        }
 
         result = passwords_api.get_by_name("gmail")  # lowercase
 
@@ -165,9 +163,44 @@ class TestPasswordsAPISearch:
         assert result.name == "Gmail"
 
     
-    def test_get_by_name_not_found(self, passwords_api):
+    def test_get_by_name_stops_at_first_match(
+        self, passwords_api, mock_http_client, sample_password_collection_data
+    ):
+        """Test later pages are not fetched once a match is found."""
+        gmail, office = sample_password_collection_data["data"]
+        mock_http_client.get.side_effect = [
+            {"data": [office, gmail], "meta": {"next-page": 2}},
+            {"data": [office], "meta": {}},
+        ]
+
+        result = passwords_api.get_by_name("Gmail")
+
+        assert result.id == "1"
+        assert mock_http_client.get.call_count == 1
+
+    
+    def test_get_by_name_no_match_fetches_one_page(
+        self, passwords_api, mock_http_client, sample_password_collection_data
+    ):
+        """Test a lookup with only partial matches does not page through them."""
+        _, office = sample_password_collection_data["data"]
+        mock_http_client.get.side_effect = [
+            {"data": [office], "meta": {"next-page": 2}},
+            {"data": [office], "meta": {"next-page": 3}},
+            {"data": [office], "meta": {}},
+        ]
+
+        result = passwords_api.get_by_name("Office")
+
+        assert result is None
+        assert mock_http_client.get.call_count == 1
+        params = mock_http_client.get.call_args[1]["params"]
+        assert params["page[size]"] == "50"
+
+    
+    def test_get_by_name_not_found(self, passwords_api, mock_http_client):
         """Test getting password by name when not found."""
-        passwords_api.list = Mock(return_value=[])
+        mock_http_client.get.return_value = {"data": [], "meta": {}}
 
         result = passwords_api.get_by_name("NonExistent")
 
@@ -721,7 +754,7 @@ class TestPasswordsAPIManagement:
         result = passwords_api.toggle_favorite("123")
 
         # Should have called get to check current state
-        passwords_api.get.assert_called_once_with("123")
+        passwords_api.get.assert_called_once_with("123", force_refresh=True)
 
         # Should have called update with toggled value
         call_args = passwords_api.update.call_args
@@ -759,9 +792,9 @@ class TestPasswordsAPIAnalytics:
     """Test analytics and reporting methods."""
 
     
-    def test_get_password_statistics_empty(self, passwords_api):
+    def test_get_password_statistics_empty(self, passwords_api, mock_http_client):
         """Test getting statistics for empty password collection."""
-        passwords_api.get_active_passwords = Mock(return_value=[])
+        mock_http_client.get.return_value = {"data": [], "meta": {}}
 
         stats = passwords_api.get_password_statistics(organization_id="456")
 
@@ -772,25 +805,30 @@ class TestPasswordsAPIAnalytics:
 
     
     def test_get_password_statistics(
-        self, passwords_api, sample_password_collection_data
+        self, passwords_api, mock_http_client, sample_password_collection_data
     ):
         """Test getting comprehensive password statistics."""
-        active_passwords = [
-            Password.from_api_dict(data)
-            for data in sample_password_collection_data["data"]
+        first, second = sample_password_collection_data["data"]
+        mock_http_client.get.side_effect = [
+            # Active passwords, streamed over two pages
+            {"data": [first], "meta": {"current-page": 1, "next-page": 2}},
+            {"data": [second], "meta": {"current-page": 2}},
+            # Archived passwords, counted with a single-item probe
+            {"data": [], "meta": {"current-page": 1, "total-count": 3}},
         ]
-        archived_passwords = []
-
-        passwords_api.get_active_passwords = Mock(return_value=active_passwords)
-        passwords_api.get_archived_passwords = Mock(
-            return_value=archived_passwords
-        )
 
         stats = passwords_api.get_password_statistics(organization_id="456")
 
-        assert stats["total_passwords"] == 2  # active + archived
+        active_params = mock_http_client.get.call_args_list[0][1]["params"]
+        assert active_params["filter[archived]"] == "false"
+        assert active_params["filter[organization-id]"] == "456"
+        archived_params = mock_http_client.get.call_args_list[2][1]["params"]
+        assert archived_params["filter[archived]"] == "true"
+        assert archived_params["page[size]"] == "1"
+
+        assert stats["total_passwords"] == 5  # active + archived
         assert stats["active_passwords"] == 2
-        assert stats["archived_passwords"] == 0
+        assert stats["archived_passwords"] == 3
         assert stats["favorite_passwords"] == 1  # Gmail is favorite
         assert stats["critical_passwords"] == 1  # Office 365 is critical
         assert stats["high_security_passwords"] == 2  # both high and critical
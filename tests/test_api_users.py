@@ -86,38 +86,38 @@ class TestUsersAPI:
         self, users_api, mock_client, sample_users_list_data
     ):
         """Test getting user by email when user exists."""
-        mock_client.get.return_value = sample_users_list_data
+        mock_client.get.return_value = {
+            "data": sample_users_list_data["data"][:1],
+            "meta": {},
+        }
 
-        # Mock the list method to return the user
-        with patch.object(users_api, "list", new_callable=Mock) as mock_list:
-            mock_user = User.from_api_dict(sample_users_list_data["data"][0])
-            mock_list.return_value = [mock_user]
+        result = users_api.get_by_email("john@example.com")
 
-            result = users_api.get_by_email("john@example.com")
-
-            assert result is not None
-            assert result.email == "john@example.com"
-            mock_list.assert_called_once_with(
-                params={"filter[email]": "john@example.com"}, page_size=1
-            )
+        assert result is not None
+        assert result.email == "john@example.com"
+        mock_client.get.assert_called_once_with(
+            "/users",
+            params={
+                "page[size]": "1",
+                "filter[email]": "john@example.com",
+                "page[number]": "1",
+            },
+        )
 
     
     def test_get_by_email_not_found(self, users_api, mock_client):
         """Test getting user by email when user doesn't exist."""
-        with patch.object(users_api, "list", new_callable=Mock) as mock_list:
-            mock_list.return_value = []
+        mock_client.get.return_value = {"data": [], "meta": {}}
 
-            result = users_api.get_by_email("nonexistent@example.com")
+        result = users_api.get_by_email("nonexistent@example.com")
 
-            assert result is None
-            mock_list.assert_called_once_with(
-                params={"filter[email]": "nonexistent@example.com"}, page_size=1
-            )
+        assert result is None
+        mock_client.get.assert_called_once()
 
     
     def test_get_by_email_error(self, users_api, mock_client):
         """Test error handling in get_by_email."""
-        with patch.object(users_api, "list", side_effect=Exception("Network error")):
+        with patch.object(users_api, "first", side_effect=Exception("Network error")):
             with pytest.raises(ITGlueAPIError, match="Failed to get user by email"):
                 users_api.get_by_email("test@example.com")
 
@@ -342,9 +342,12 @@ class TestUsersAPI:
         self, users_api, mock_client, sample_users_list_data
     ):
         """Test getting user statistics."""
-        with patch.object(users_api, "list", new_callable=Mock) as mock_list:
+        with patch.object(users_api, "iter_pages", new_callable=Mock) as mock_iter:
             mock_collection = UserCollection.from_api_dict(sample_users_list_data)
-            mock_list.return_value = mock_collection
+            # One user per page, so the per-page statistics must be merged
+            mock_iter.return_value = iter(
+                [UserCollection(data=[user]) for user in mock_collection]
+            )
 
             result = users_api.get_user_statistics()
 
@@ -360,6 +363,9 @@ class TestUsersAPI:
             assert isinstance(result["role_distribution"], dict)
             assert isinstance(result["my_glue_statistics"], dict)
             assert isinstance(result["top_reputation_users"], list)
+            assert [u["id"] for u in result["top_reputation_users"]] == ["1", "2"]
+            assert result["average_reputation"] == 3750
+            assert result["role_distribution"] == {"Admin": 1, "Editor": 1}
 
     
     def test_search_users_with_email(
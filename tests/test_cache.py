@@ -2,15 +2,23 @@
 Tests for ITGlue Cache System
 """
 
+import json
+import os
+import threading
 import time
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, call
 import pytest
 
 from itglue.config import ITGlueConfig, ITGlueRegion
 from itglue.cache import (
     MemoryCache,
+    ShardedMemoryCache,
     RedisCache,
+    DiskCache,
+    TieredCache,
     CacheManager,
+    FrequencySketch,
+    ModelCache,
 )
 from itglue.exceptions import ITGlueCacheError
 
@@ -23,8 +31,7 @@ class TestMemoryCache:
         cache = MemoryCache(max_size=100)
 
         assert cache.max_size == 100
-        assert cache.cache == {}
-        assert cache.access_times == {}
+        assert len(cache.cache) == 0
 
     def test_set_and_get(self):
         """Test setting and getting values."""
@@ -88,7 +95,6 @@ class TestMemoryCache:
         cache.clear()
 
         assert len(cache.cache) == 0
-        assert len(cache.access_times) == 0
 
     def test_exists(self):
         """Test checking if key exists."""
@@ -130,24 +136,382 @@ class TestMemoryCache:
         # Adding one more should trigger cleanup
         cache.set("key4", {"value": 4})
 
-        # Should have removed oldest entry (20% = 1 entry)
+        # Should have evicted the least recently used entry
         assert len(cache.cache) == 3
         assert cache.get("key1") is None  # Oldest should be removed
         assert cache.get("key4") is not None  # New entry should exist
 
-    def test_access_time_update(self):
-        """Test that access times are updated on get."""
+    def test_get_refreshes_recency(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = MemoryCache(max_size=3)
+
+        cache.set("key1", {"value": 1})
+        cache.set("key2", {"value": 2})
+        cache.set("key3", {"value": 3})
+
+        cache.get("key1")
+        cache.set("key4", {"value": 4})
+
+        assert cache.get("key1") is not None
+        assert cache.get("key2") is None  # Least recently used
+
+    def test_overwrite_does_not_evict(self):
+        """Test that rewriting an existing key never evicts another."""
+        cache = MemoryCache(max_size=2)
+
+        cache.set("key1", {"value": 1})
+        cache.set("key2", {"value": 2})
+        cache.set("key1", {"value": 10})
+
+        assert cache.get("key1") == {"value": 10}
+        assert cache.get("key2") == {"value": 2}
+
+    def test_default_ttl_counts_from_write(self):
+        """Test entries expire by age since write, not since last read."""
+        cache = MemoryCache(ttl=1)
+
+        cache.set("test_key", {"key": "value"})
+        time.sleep(0.6)
+        assert cache.get("test_key") is not None
+        time.sleep(0.6)
+
+        assert cache.get("test_key") is None
+        assert len(cache.cache) == 0
+
+    def test_expiry_is_lazy(self):
+        """Test writes do not scan the cache for expired entries."""
         cache = MemoryCache()
-        data = {"key": "value"}
 
-        cache.set("test_key", data)
-        initial_time = cache.access_times["test_key"]
+        cache.set("old", {"value": 1}, ttl=1)
+        time.sleep(1.1)
+        cache.set("new", {"value": 2})
 
-        time.sleep(0.01)
-        cache.get("test_key")
+        assert "old" in cache.cache
+        assert cache.exists("old") is False
+        assert "old" not in cache.cache
+
+    def test_byte_limit_evicts_lru(self):
+        """Test the byte limit evicts least recently used entries."""
+        value = {"blob": "x" * 80}
+        size = len('{"blob": "' + "x" * 80 + '"}')
+        cache = MemoryCache(max_bytes=size * 2)
+
+        cache.set("key1", value)
+        cache.set("key2", value)
+        assert cache.current_bytes == size * 2
+
+        cache.set("key3", value)
+
+        assert cache.get("key1") is None
+        assert cache.get("key3") == value
+        assert cache.current_bytes == size * 2
+
+    def test_byte_accounting_on_overwrite_and_delete(self):
+        """Test the byte total tracks overwrites, deletes and clears."""
+        cache = MemoryCache()
+
+        cache.set("key", {"blob": "x" * 100})
+        cache.set("key", {"blob": "x"})
+        assert cache.current_bytes == len('{"blob": "x"}')
+
+        cache.delete("key")
+        assert cache.current_bytes == 0
+
+        cache.set("key", {"value": 1})
+        cache.clear()
+        assert cache.current_bytes == 0
+
+    def test_uncounted_keys_bounded_by_bytes(self):
+        """Test uncounted keys only count against the byte limit."""
+        cache = MemoryCache(max_size=2, max_bytes=10_000, uncounted_prefix="entity:")
+
+        cache.set("page1", {"value": 1})
+        for index in range(50):
+            cache.set(f"entity:{index}", {"value": index})
+        cache.set("page2", {"value": 2})
+
+        assert cache.counted == 2
+        assert cache.get("page1") == {"value": 1}
+        assert cache.get("entity:0") == {"value": 0}
+
+        # Entities older than the evicted page go with it, in LRU order
+        cache.set("page3", {"value": 3})
+        assert cache.get("page2") is None
+        assert cache.get("entity:1") is None
+        assert cache.get("page1") == {"value": 1}
+        assert cache.get("entity:0") == {"value": 0}
+        assert cache.counted == 2
+
+    def test_uncounted_prefix_needs_byte_limit(self):
+        """Test every key counts when there is no byte limit to bound them."""
+        cache = MemoryCache(max_size=2, uncounted_prefix="entity:")
+
+        cache.set("entity:1", {"value": 1})
+        cache.set("entity:2", {"value": 2})
+        cache.set("entity:3", {"value": 3})
+
+        assert len(cache.cache) == 2
+
+    def test_value_larger_than_limit_not_cached(self):
+        """Test an oversized value is skipped without flushing the cache."""
+        cache = MemoryCache(max_bytes=50)
+
+        cache.set("small", {"value": 1})
+        cache.set("huge", {"blob": "x" * 100})
+
+        assert cache.get("huge") is None
+        assert cache.get("small") == {"value": 1}
+
+    def test_shrinks_when_rss_over_limit(self):
+        """Test the cache sheds entries while process RSS is too high."""
+        cache = MemoryCache(max_rss_bytes=1000, rss_check_interval=4)
+
+        with patch("itglue.cache._process_rss_bytes", return_value=2000):
+            for i in range(4):
+                cache.set(f"key{i}", {"value": i})
+
+        # A quarter of the entries, least recently used first
+        assert len(cache.cache) == 3
+        assert cache.get("key0") is None
+
+        with patch("itglue.cache._process_rss_bytes", return_value=500):
+            for i in range(4, 8):
+                cache.set(f"key{i}", {"value": i})
+
+        assert len(cache.cache) == 7
+
+    def test_tag_index(self):
+        """Test tagged keys are invalidated together and untagged on removal."""
+        cache = MemoryCache(max_size=2)
+
+        cache.set("key1", {"value": 1})
+        cache.set("key2", {"value": 2})
+        cache.tag("key1", ["endpoint:/a"])
+        cache.tag("key2", ["endpoint:/a", "endpoint:/b"])
+        cache.tag("missing", ["endpoint:/a"])
+
+        assert cache.invalidate_tag("endpoint:/a") == 2
+        assert cache.get("key1") is None
+        assert cache.get("key2") is None
+        # Removing key2 also dropped it from its other tags
+        assert "endpoint:/b" not in cache.tags
+
+        cache.set("key3", {"value": 3})
+        cache.tag("key3", ["endpoint:/c"])
+        cache.set("key4", {"value": 4})
+        cache.set("key5", {"value": 5})
+
+        assert cache.get("key3") is None
+        assert cache.tags == {}
+
+    def test_concurrent_access(self):
+        """Test threads sharing one cache leave its state consistent."""
+        cache = MemoryCache(max_size=50, max_bytes=100_000)
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(300):
+                    key = f"key{(n * 7 + i) % 80}"
+                    cache.set(key, {"value": i})
+                    cache.tag(key, ["endpoint:/a"])
+                    cache.get(f"key{i % 80}")
+                    if i % 10 == 0:
+                        cache.delete(key)
+                    if i % 50 == 0:
+                        cache.invalidate_tag("endpoint:/a")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache.cache) <= 50
+        assert cache.current_bytes == sum(entry["size"] for entry in cache.cache.values())
+        assert all(keys <= set(cache.cache) for keys in cache.tags.values())
+
+
+class TestTinyLFUAdmission:
+    """Test frequency-based admission to the memory cache."""
+
+    def test_frequency_sketch_counts_and_ages(self):
+        """Test counts are estimated, capped and halved over time."""
+        sketch = FrequencySketch(16)
+
+        for _ in range(3):
+            sketch.increment("hot")
+        for _ in range(20):
+            sketch.increment("hotter")
+
+        assert sketch.frequency("hot") >= 3
+        assert sketch.frequency("hotter") == FrequencySketch.MAX_COUNT
+        assert sketch.frequency("cold") <= sketch.frequency("hot")
+
+        sketch.reset()
+        assert sketch.frequency("hotter") == FrequencySketch.MAX_COUNT // 2
+
+    def test_scan_does_not_evict_hot_keys(self):
+        """Test one-off writes are rejected in favour of frequently read keys."""
+        cache = MemoryCache(max_size=100, admission="tinylfu")
+        events = []
+        cache.listener = lambda event, value, size: events.append(event)
+
+        for i in range(100):
+            cache.set(f"hot{i}", {"value": i})
+        for _ in range(5):
+            for i in range(100):
+                cache.get(f"hot{i}")
+
+        for i in range(300):
+            cache.set(f"scan{i}", {"value": i})
+
+        # The sketch is approximate: a rare scan key whose counters all
+        # collide with hot keys may still be admitted
+        kept = sum(cache.get(f"hot{i}") == {"value": i} for i in range(100))
+        assert kept >= 95
+        assert events.count("rejection") >= 295
+
+        # Updating a stored key is always admitted
+        stored = next(iter(cache.cache))
+        cache.set(stored, {"value": "new"})
+        assert cache.get(stored) == {"value": "new"}
+
+    def test_frequent_newcomer_is_admitted(self):
+        """Test a key read more often than the LRU entry replaces it."""
+        cache = MemoryCache(max_size=2, admission="tinylfu")
+        cache.set("a", {"value": 1})
+        cache.set("b", {"value": 2})
+
+        for _ in range(3):
+            cache.get("c")
+        cache.set("c", {"value": 3})
+
+        assert cache.get("c") == {"value": 3}
+        assert len(cache.cache) == 2
+
+    def test_plain_lru_admits_everything(self):
+        """Test the default policy keeps plain LRU behaviour."""
+        cache = MemoryCache(max_size=2)
+        cache.get("a")
+        cache.set("a", {"value": 1})
+        cache.get("a")
+        cache.set("b", {"value": 2})
+        cache.set("c", {"value": 3})
+
+        assert cache.sketch is None
+        assert cache.get("a") is None
+        assert cache.get("c") == {"value": 3}
+
+    def test_invalid_policy(self):
+        """Test unknown admission policies are rejected."""
+        with pytest.raises(ValueError, match="Unknown cache admission policy"):
+            MemoryCache(admission="lfu")
+
+    def test_manager_counts_rejections(self):
+        """Test the manager configures admission and counts rejections."""
+        manager = CacheManager(
+            ITGlueConfig(api_key="test-key", cache_admission="tinylfu")
+        )
+        manager.backend.max_size = 1
+
+        manager.set("/organizations/1", {"data": {}})
+        manager.get("/organizations/1")
+        manager.set("/configurations", {"data": []})
+
+        assert manager.get("/organizations/1") == {"data": {}}
+        assert manager.get_stats()["rejections"] == 1
+
+
+class TestShardedMemoryCache:
+    """Test sharded in-memory cache functionality."""
+
+    def test_routing_and_limits(self):
+        """Test keys are spread over shards that split the size limits."""
+        cache = ShardedMemoryCache(shards=4, max_size=100, max_bytes=4000)
+
+        assert [shard.max_size for shard in cache.shards] == [25] * 4
+        assert [shard.max_bytes for shard in cache.shards] == [1000] * 4
 
-        updated_time = cache.access_times["test_key"]
-        assert updated_time > initial_time
+        for i in range(40):
+            cache.set(f"key{i}", {"value": i})
+
+        assert cache.count() == 40
+        assert sum(1 for shard in cache.shards if shard.cache) > 1
+        assert cache.get("key7") == {"value": 7}
+        assert cache._shard("key7").exists("key7")
+        assert cache.exists("key7")
+        assert cache.stored_bytes() == sum(s.current_bytes for s in cache.shards)
+
+        cache.delete("key7")
+        assert cache.get("key7") is None
+        assert cache.get_many(["key1", "key2", "key7"]) == {
+            "key1": {"value": 1},
+            "key2": {"value": 2},
+        }
+
+        cache.clear()
+        assert cache.count() == 0
+
+    def test_tags_and_entries_across_shards(self):
+        """Test tags invalidate keys in every shard."""
+        cache = ShardedMemoryCache(shards=4)
+        cache.set_many({f"key{i}": {"value": i} for i in range(20)}, ttl=60)
+        cache.tag_many({f"key{i}": ["endpoint:/a"] for i in range(10)})
+
+        entries = {key: tags for key, _, _, tags in cache.entries()}
+        assert len(entries) == 20
+        assert entries["key3"] == ["endpoint:/a"]
+
+        assert cache.invalidate_tag("endpoint:/a") == 10
+        assert cache.count() == 10
+        assert cache.get("key3") is None
+        assert cache.get("key15") == {"value": 15}
+
+    def test_listener_reaches_every_shard(self):
+        """Test the storage listener is installed on each shard."""
+        cache = ShardedMemoryCache(shards=3)
+        events = []
+        cache.listener = lambda event, key, size: events.append(event)
+
+        assert all(shard.listener is cache.listener for shard in cache.shards)
+        for i in range(10):
+            cache.set(f"key{i}", {"value": i})
+        assert len(events) == 10
+
+    def test_invalid_shard_count(self):
+        """Test a shard count below one is rejected."""
+        with pytest.raises(ValueError, match="Shard count must be positive"):
+            ShardedMemoryCache(shards=0)
+
+    def test_concurrent_access(self):
+        """Test threads working on all shards leave them consistent."""
+        cache = ShardedMemoryCache(shards=8, max_size=400)
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(500):
+                    key = f"key{(n * 13 + i) % 200}"
+                    cache.set(key, {"value": i})
+                    cache.get_many([key, f"key{i % 200}"])
+                    if i % 7 == 0:
+                        cache.delete(key)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        for shard in cache.shards:
+            assert shard.current_bytes == sum(e["size"] for e in shard.cache.values())
 
 
 class TestRedisCache:
@@ -179,17 +543,29 @@ class TestRedisCache:
     def test_set_and_get(self, redis_cache, mock_redis):
         """Test setting and getting values."""
         data = {"key": "value", "number": 42}
-        mock_redis.get.return_value = '{"key": "value", "number": 42}'
 
         redis_cache.set("test_key", data)
+        mock_redis.get.return_value = mock_redis.set.call_args[0][1]
         result = redis_cache.get("test_key")
 
         assert result == data
         mock_redis.set.assert_called_once_with(
-            "test:test_key", '{"key": "value", "number": 42}'
+            "test:test_key", b'IG\x01\x01\x00{"key":"value","number":42}'
         )
         mock_redis.get.assert_called_once_with("test:test_key")
 
+    def test_get_legacy_json(self, redis_cache, mock_redis):
+        """Test entries written as plain JSON before headers are still read."""
+        mock_redis.get.return_value = b'{"key": "value", "number": 42}'
+
+        assert redis_cache.get("test_key") == {"key": "value", "number": 42}
+
+    def test_get_unknown_version_is_miss(self, redis_cache, mock_redis):
+        """Test an entry from a newer format version is treated as a miss."""
+        mock_redis.get.return_value = b"IG\x09\x01\x00{}"
+
+        assert redis_cache.get("test_key") is None
+
     def test_set_with_ttl(self, redis_cache, mock_redis):
         """Test setting value with TTL."""
         data = {"key": "value"}
@@ -197,7 +573,7 @@ class TestRedisCache:
         redis_cache.set("test_key", data, ttl=300)
 
         mock_redis.setex.assert_called_once_with(
-            "test:test_key", 300, '{"key": "value"}'
+            "test:test_key", 300, redis_cache.codec.encode(data)
         )
 
     def test_get_nonexistent_key(self, redis_cache, mock_redis):
@@ -214,23 +590,51 @@ class TestRedisCache:
 
         mock_redis.delete.assert_called_once_with("test:test_key")
 
-    def test_clear(self, redis_cache, mock_redis):
-        """Test clearing all cache entries."""
-        mock_redis.keys.return_value = ["test:key1", "test:key2"]
+    def test_clear(self, mock_redis):
+        """Test clearing scans the keyspace and unlinks in batches."""
+        redis_cache = RedisCache(mock_redis, key_prefix="test:", scan_batch_size=2)
+        mock_redis.scan_iter.return_value = iter(["test:key1", "test:key2", "test:key3"])
 
         redis_cache.clear()
 
-        mock_redis.keys.assert_called_once_with("test:*")
-        mock_redis.delete.assert_called_once_with("test:key1", "test:key2")
+        mock_redis.scan_iter.assert_called_once_with(match="test:*", count=2)
+        assert mock_redis.unlink.call_args_list == [
+            call("test:key1", "test:key2"),
+            call("test:key3"),
+        ]
+        mock_redis.keys.assert_not_called()
+        mock_redis.delete.assert_not_called()
 
     def test_clear_no_keys(self, redis_cache, mock_redis):
         """Test clearing when no keys exist."""
-        mock_redis.keys.return_value = []
+        mock_redis.scan_iter.return_value = iter([])
 
         redis_cache.clear()
 
-        mock_redis.keys.assert_called_once_with("test:*")
-        mock_redis.delete.assert_not_called()
+        mock_redis.scan_iter.assert_called_once_with(match="test:*", count=500)
+        mock_redis.unlink.assert_not_called()
+
+    def test_get_many(self, redis_cache, mock_redis):
+        """Test several keys are read with a single MGET."""
+        mock_redis.mget.return_value = ['{"value": 1}', None]
+
+        result = redis_cache.get_many(["key1", "key2"])
+
+        assert result == {"key1": {"value": 1}}
+        mock_redis.mget.assert_called_once_with(["test:key1", "test:key2"])
+        mock_redis.get.assert_not_called()
+
+    def test_set_many(self, redis_cache, mock_redis):
+        """Test several keys are written in one pipeline."""
+        pipe = mock_redis.pipeline.return_value
+
+        redis_cache.set_many({"key1": {"value": 1}, "key2": {"value": 2}}, ttl=60)
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.setex.assert_any_call("test:key1", 60, b'IG\x01\x01\x00{"value":1}')
+        pipe.setex.assert_any_call("test:key2", 60, b'IG\x01\x01\x00{"value":2}')
+        pipe.execute.assert_called_once()
+        mock_redis.setex.assert_not_called()
 
     def test_exists(self, redis_cache, mock_redis):
         """Test checking if key exists."""
@@ -248,6 +652,279 @@ class TestRedisCache:
         with pytest.raises(ITGlueCacheError, match="Failed to get from Redis cache"):
             redis_cache.get("test_key")
 
+    def test_tag(self, redis_cache, mock_redis):
+        """Test keys are added to per-tag Redis sets."""
+        pipe = mock_redis.pipeline.return_value
+
+        redis_cache.tag("key", ["endpoint:/users", "resource:users:1"], ttl=60)
+
+        script = RedisCache._TAG_SCRIPT
+        pipe.eval.assert_any_call(script, 1, "test:tag:endpoint:/users", 60, "test:key")
+        pipe.eval.assert_any_call(
+            script, 1, "test:tag:resource:users:1", 60, "test:key"
+        )
+        pipe.expire.assert_not_called()
+        pipe.execute.assert_called_once()
+
+    def test_tag_many_only_extends_tag_expiry(self, redis_cache, mock_redis):
+        """Test tag sets are added to with each TTL and never re-expired."""
+        pipe = mock_redis.pipeline.return_value
+
+        redis_cache.tag_many(
+            {"long1": ["endpoint:/a"], "long2": ["endpoint:/a"]}, ttl=300
+        )
+        redis_cache.tag_many({"short": ["endpoint:/a"]}, ttl=60)
+
+        script = RedisCache._TAG_SCRIPT
+        assert pipe.eval.call_args_list == [
+            call(script, 1, "test:tag:endpoint:/a", 300, "test:long1", "test:long2"),
+            call(script, 1, "test:tag:endpoint:/a", 60, "test:short"),
+        ]
+        # Expiry is only set inside the script, which never shortens it
+        pipe.expire.assert_not_called()
+
+    def test_invalidate_tag(self, redis_cache, mock_redis):
+        """Test invalidating a tag deletes its members and the set."""
+        mock_redis.smembers.return_value = {"test:key1"}
+
+        assert redis_cache.invalidate_tag("endpoint:/users") == 1
+
+        mock_redis.smembers.assert_called_once_with("test:tag:endpoint:/users")
+        mock_redis.unlink.assert_any_call("test:key1")
+        mock_redis.unlink.assert_any_call("test:tag:endpoint:/users")
+
+
+class TestDiskCache:
+    """Test the SQLite disk cache backend."""
+
+    @pytest.fixture
+    def disk_cache(self, tmp_path):
+        """Create a disk cache in a temporary directory."""
+        cache = DiskCache(str(tmp_path / "cache" / "itglue.sqlite3"))
+        yield cache
+        cache.close()
+
+    def test_set_get_and_persist(self, disk_cache):
+        """Test entries survive reopening the database."""
+        disk_cache.set("key", {"data": [1, 2, 3]})
+
+        assert disk_cache.get("key") == {"data": [1, 2, 3]}
+        assert disk_cache.exists("key")
+
+        reopened = DiskCache(disk_cache.path)
+        try:
+            assert reopened.get("key") == {"data": [1, 2, 3]}
+        finally:
+            reopened.close()
+
+    def test_ttl_expiry(self, disk_cache):
+        """Test expired entries are misses and removed."""
+        disk_cache.set("short", {"value": 1}, ttl=10)
+        disk_cache.set("forever", {"value": 2}, ttl=0)
+
+        with patch("itglue.cache.time.time", return_value=time.time() + 60):
+            assert disk_cache.get("short") is None
+            assert not disk_cache.exists("short")
+            assert disk_cache.get("forever") == {"value": 2}
+
+    def test_get_many_and_set_many(self, disk_cache):
+        """Test batched reads and writes."""
+        disk_cache.set_many({"a": {"value": 1}, "b": {"value": 2}})
+
+        assert disk_cache.get_many(["a", "b", "c"]) == {
+            "a": {"value": 1},
+            "b": {"value": 2},
+        }
+
+    def test_size_limit_evicts_least_recently_read(self, tmp_path):
+        """Test purging keeps the stored size under the limit."""
+        cache = DiskCache(
+            str(tmp_path / "small.sqlite3"),
+            max_bytes=200,
+            purge_interval=1,
+            touch_interval=0,
+        )
+        try:
+            cache.set("old", {"blob": "x" * 60})
+            cache.set("hot", {"blob": "y" * 60})
+            with patch("itglue.cache.time.time", return_value=time.time() + 5):
+                cache.get("old")
+                cache.set("new", {"blob": "z" * 60})
+                cache.set("newest", {"blob": "w" * 60})
+
+            assert cache.get("hot") is None
+            assert cache.get("newest") is not None
+        finally:
+            cache.close()
+
+    def test_tags(self, disk_cache):
+        """Test tag invalidation and that rewrites drop old tags."""
+        disk_cache.set("key1", {"value": 1})
+        disk_cache.set("key2", {"value": 2})
+        disk_cache.tag_many({"key1": ["endpoint:/a"], "key2": ["endpoint:/a"]})
+        disk_cache.tag("missing", ["endpoint:/a"])
+
+        disk_cache.set("key2", {"value": 3})
+
+        assert disk_cache.invalidate_tag("endpoint:/a") == 1
+        assert disk_cache.get("key1") is None
+        assert disk_cache.get("key2") == {"value": 3}
+
+    def test_concurrent_writers(self, disk_cache):
+        """Test threads can share the cache through their own connections."""
+
+        def write(thread_id):
+            for i in range(20):
+                disk_cache.set(f"{thread_id}:{i}", {"value": i})
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(disk_cache.get_many([f"{n}:19" for n in range(4)])) == 4
+
+
+class TestTieredCache:
+    """Test the two-tier memory / Redis backend."""
+
+    @pytest.fixture
+    def mock_redis(self):
+        """Create mock Redis client."""
+        mock_redis = Mock()
+        mock_redis.get.return_value = None
+        return mock_redis
+
+    @pytest.fixture
+    def tiered(self, mock_redis):
+        """Create a tiered cache over a mock Redis."""
+        return TieredCache(MemoryCache(), RedisCache(mock_redis, key_prefix="test:"))
+
+    @staticmethod
+    def _published(mock_redis):
+        """Decode the last invalidation message published."""
+        channel, data = mock_redis.publish.call_args[0]
+        assert channel == "test:invalidate"
+        return json.loads(data)
+
+    def test_subscribes_to_invalidations(self, tiered, mock_redis):
+        """Test a listener thread is started on the invalidation channel."""
+        pubsub = mock_redis.pubsub.return_value
+
+        pubsub.subscribe.assert_called_once_with(
+            **{"test:invalidate": tiered._handle_message}
+        )
+        pubsub.run_in_thread.assert_called_once()
+
+        tiered.close()
+        pubsub.run_in_thread.return_value.stop.assert_called_once()
+
+    def test_l2_hit_fills_l1(self, tiered, mock_redis):
+        """Test a value read from Redis is served from memory afterwards."""
+        mock_redis.get.return_value = tiered.l2.codec.encode({"value": 1})
+
+        assert tiered.get("key") == {"value": 1}
+        assert tiered.get("key") == {"value": 1}
+
+        mock_redis.get.assert_called_once_with("test:key")
+
+    def test_set_writes_both_tiers_and_publishes(self, tiered, mock_redis):
+        """Test writes reach both tiers and are broadcast."""
+        tiered.set("key", {"value": 1}, ttl=300)
+
+        mock_redis.setex.assert_called_once()
+        assert tiered.l1.get("key") == {"value": 1}
+        assert self._published(mock_redis)["keys"] == ["key"]
+
+    def test_peer_invalidation(self, mock_redis):
+        """Test a write in one process drops the key from another's L1."""
+        first = TieredCache(MemoryCache(), RedisCache(mock_redis, key_prefix="test:"))
+        second = TieredCache(MemoryCache(), RedisCache(mock_redis, key_prefix="test:"))
+        second.l1.set("key", {"value": "old"})
+        second.l1.set("other", {"value": "kept"})
+
+        first.set("key", {"value": "new"})
+        message = {"data": mock_redis.publish.call_args[0][1]}
+        first._handle_message(message)
+        second._handle_message(message)
+
+        # The writer keeps its own fresh copy
+        assert first.l1.get("key") == {"value": "new"}
+        assert second.l1.get("key") is None
+        assert second.l1.get("other") == {"value": "kept"}
+
+        mock_redis.scan_iter.return_value = iter([])
+        first.clear()
+        second._handle_message({"data": mock_redis.publish.call_args[0][1]})
+        assert second.l1.get("other") is None
+
+    def test_invalidate_tag_reaches_l1(self, tiered, mock_redis):
+        """Test tag invalidation drops L2 members from every L1."""
+        tiered.l1.set("key1", {"value": 1})
+        mock_redis.smembers.return_value = {b"test:key1"}
+
+        assert tiered.invalidate_tag("endpoint:/users") == 1
+
+        assert tiered.l1.get("key1") is None
+        assert self._published(mock_redis)["keys"] == ["key1"]
+
+    @pytest.mark.integration
+    def test_against_local_redis(self):
+        """Test two tiered caches stay coherent through a real Redis.
+
+        Set ITGLUE_TEST_REDIS_URL, e.g. redis://localhost:6379/15, to run.
+        """
+        url = os.getenv("ITGLUE_TEST_REDIS_URL")
+        if not url:
+            pytest.skip("ITGLUE_TEST_REDIS_URL not set")
+        redis = pytest.importorskip("redis")
+
+        prefix = f"itglue-test-{os.getpid()}:"
+        first = TieredCache(MemoryCache(), RedisCache(redis.from_url(url), prefix))
+        second = TieredCache(MemoryCache(), RedisCache(redis.from_url(url), prefix))
+        try:
+            time.sleep(0.2)  # Let both subscriptions register
+            first.set("key", {"value": 1}, ttl=60)
+            assert second.get("key") == {"value": 1}
+
+            first.set("key", {"value": 2}, ttl=60)
+            deadline = time.time() + 5
+            while second.l1.get("key") is not None and time.time() < deadline:
+                time.sleep(0.05)
+
+            assert second.get("key") == {"value": 2}
+        finally:
+            first.clear()
+            first.close()
+            second.close()
+
+
+    @pytest.mark.integration
+    def test_tag_expiry_with_mixed_ttls_against_local_redis(self):
+        """Test a short-TTL member never shortens a tag set's expiry.
+
+        Set ITGLUE_TEST_REDIS_URL, e.g. redis://localhost:6379/15, to run.
+        """
+        url = os.getenv("ITGLUE_TEST_REDIS_URL")
+        if not url:
+            pytest.skip("ITGLUE_TEST_REDIS_URL not set")
+        redis = pytest.importorskip("redis")
+
+        client = redis.from_url(url)
+        cache = RedisCache(client, f"itglue-test-{os.getpid()}:")
+        tag_key = cache._get_tag_key("endpoint:/a")
+        try:
+            cache.tag("long", ["endpoint:/a"], ttl=300)
+            cache.tag("short", ["endpoint:/a"], ttl=60)
+            assert client.ttl(tag_key) > 60
+
+            cache.tag("forever", ["endpoint:/a"])
+            cache.tag("short", ["endpoint:/a"], ttl=60)
+            assert client.ttl(tag_key) == -1
+        finally:
+            client.delete(tag_key)
+
 
 class TestCacheManager:
     """Test cache manager functionality."""
@@ -289,6 +966,26 @@ class TestCacheManager:
         assert manager.backend is not None
         assert isinstance(manager.backend, MemoryCache)
 
+    def test_cache_manager_sharded_memory_backend(self, config_memory):
+        """Test cache manager shards the memory backend when configured."""
+        config_memory.cache_memory_shards = 4
+        manager = CacheManager(config_memory)
+
+        assert isinstance(manager.backend, ShardedMemoryCache)
+        assert len(manager.backend.shards) == 4
+
+        manager.set("/organizations", {"data": []})
+        assert manager.get("/organizations") == {"data": []}
+
+    def test_cache_manager_memory_limits(self, config_memory):
+        """Test memory backend size limits come from the config."""
+        config_memory.cache_max_bytes = 4096
+        config_memory.cache_max_rss_bytes = 2**30
+        manager = CacheManager(config_memory)
+
+        assert manager.backend.max_bytes == 4096
+        assert manager.backend.max_rss_bytes == 2**30
+
     def test_cache_manager_disabled(self, config_disabled):
         """Test cache manager with caching disabled."""
         manager = CacheManager(config_disabled)
@@ -299,21 +996,56 @@ class TestCacheManager:
         """Test cache manager with Redis backend."""
         redis = pytest.importorskip("redis")
         
-        with patch.object(redis, "from_url") as mock_redis_from_url:
-            mock_redis_client = Mock()
-            mock_redis_from_url.return_value = mock_redis_client
-
+        with patch.object(
+            redis.BlockingConnectionPool, "from_url"
+        ) as mock_pool_from_url, patch.object(redis, "Redis") as mock_redis_class:
             manager = CacheManager(config_redis)
 
             assert manager.backend is not None
             assert isinstance(manager.backend, RedisCache)
-            mock_redis_from_url.assert_called_once_with("redis://localhost:6379")
+            mock_pool_from_url.assert_called_once_with(
+                "redis://localhost:6379", max_connections=10
+            )
+            mock_redis_class.assert_called_once_with(
+                connection_pool=mock_pool_from_url.return_value
+            )
+
+    def test_cache_manager_tiered_backend(self, config_redis):
+        """Test cache manager with the tiered backend."""
+        redis = pytest.importorskip("redis")
+        config_redis.cache_type = "tiered"
+
+        with patch.object(redis.BlockingConnectionPool, "from_url"), patch.object(
+            redis, "Redis"
+        ):
+            manager = CacheManager(config_redis)
+
+        assert isinstance(manager.backend, TieredCache)
+        assert manager.backend.l1_ttl == config_redis.cache_l1_ttl
+        manager.close()
+
+    def test_cache_manager_disk_backend(self, tmp_path):
+        """Test cache manager with the disk backend."""
+        config = ITGlueConfig(
+            api_key="test-key",
+            cache_type="disk",
+            cache_disk_path=str(tmp_path / "cache.sqlite3"),
+        )
+        manager = CacheManager(config)
+
+        manager.set("/organizations", {"data": []})
+
+        assert isinstance(manager.backend, DiskCache)
+        assert CacheManager(config).get("/organizations") == {"data": []}
+        manager.close()
 
     def test_cache_manager_redis_import_error(self, config_redis):
         """Test fallback to memory cache when Redis import fails."""
         redis = pytest.importorskip("redis")
         
-        with patch.object(redis, "from_url") as mock_redis_from_url:
+        with patch.object(
+            redis.BlockingConnectionPool, "from_url"
+        ) as mock_redis_from_url:
             mock_redis_from_url.side_effect = ImportError("Redis not available")
 
             manager = CacheManager(config_redis)
@@ -326,7 +1058,9 @@ class TestCacheManager:
         """Test fallback to memory cache when Redis connection fails."""
         redis = pytest.importorskip("redis")
         
-        with patch.object(redis, "from_url") as mock_redis_from_url:
+        with patch.object(
+            redis.BlockingConnectionPool, "from_url"
+        ) as mock_redis_from_url:
             mock_redis_from_url.side_effect = Exception("Connection failed")
 
             manager = CacheManager(config_redis)
@@ -430,11 +1164,292 @@ class TestCacheManager:
         # Set some data
         manager.set("/organizations", {"data": []})
 
-        # Invalidate (currently just clears all)
+        manager.set("/organizations/5/relationships/configurations", {"data": []})
+        manager.set("/organizations/6", {"data": {}})
+        manager.set("/users", {"data": []})
+
+        manager.invalidate_endpoint("/organizations/5")
+
+        assert manager.get("/organizations") == {"data": []}
+        assert manager.get("/organizations/5/relationships/configurations") is None
+        assert manager.get("/organizations/6") == {"data": {}}
+
         manager.invalidate_endpoint("/organizations")
 
-        # Should be cleared
         assert manager.get("/organizations") is None
+        assert manager.get("/organizations/6") is None
+        assert manager.get("/users") == {"data": []}
+
+    def test_invalidate_resource(self, config_memory):
+        """Test responses embedding a resource are invalidated by its tag."""
+        manager = CacheManager(config_memory)
+        org = {"type": "organizations", "id": "5"}
+
+        manager.set("/organizations", {"data": [org]})
+        manager.set(
+            "/configurations/1",
+            {"data": {"type": "configurations", "id": "1"}, "included": [org]},
+        )
+        manager.set("/configurations/2", {"data": {"type": "configurations", "id": "2"}})
+
+        manager.invalidate_resource("organizations", "5")
+
+        assert manager.get("/organizations") is None
+        assert manager.get("/configurations/1") is None
+        assert manager.get("/configurations/2") is not None
+
+    def test_invalidate_resource_hyphenated_type(self, config_memory):
+        """Test a JSON:API type matches the underscored API resource type."""
+        config_memory.cache_normalize = False
+        manager = CacheManager(config_memory)
+        asset = {"type": "flexible-assets", "id": "7"}
+        manager.set("/flexible_assets", {"data": [asset]})
+
+        manager.invalidate_resource("flexible_assets", "7")
+
+        assert manager.get("/flexible_assets") is None
+
+    def test_normalized_entities_are_shared(self, config_memory):
+        """Test resources are stored once and lists read the latest version."""
+        config_memory.cache_normalize = True
+        manager = CacheManager(config_memory)
+        org = {"type": "organizations", "id": "5", "attributes": {"name": "Old"}}
+        config = {"type": "configurations", "id": "1"}
+
+        manager.set("/organizations", {"data": [org], "meta": {"total-count": 1}})
+        manager.set("/configurations/1", {"data": config, "included": [org]})
+
+        stored = manager.backend.get(manager._generate_cache_key("/organizations"))
+        assert stored["data"]["__itglue_refs__"]["data"] == [["organizations", "5"]]
+
+        renamed = {**org, "attributes": {"name": "New"}}
+        manager.put_entities([renamed])
+
+        assert manager.get("/organizations") == {
+            "data": [renamed],
+            "meta": {"total-count": 1},
+        }
+        assert manager.get("/configurations/1")["included"] == [renamed]
+        assert manager.get_entity("organizations", "5") == renamed
+
+    def test_sparse_representation_merges_into_entity(self, config_memory):
+        """Test a list item does not drop what a detail response cached."""
+        config_memory.cache_normalize = True
+        manager = CacheManager(config_memory)
+        org = {"type": "organizations", "id": "5", "attributes": {"name": "Acme"}}
+        detail = {
+            "data": {
+                "type": "configurations",
+                "id": "1",
+                "attributes": {"name": "web", "notes": "Primary"},
+                "relationships": {
+                    "organization": {"data": {"type": "organizations", "id": "5"}}
+                },
+            },
+            "included": [org],
+        }
+        listed = {"type": "configurations", "id": "1", "attributes": {"name": "web1"}}
+
+        manager.set("/configurations/1", detail)
+        manager.set("/configurations", {"data": [listed]})
+
+        cached = manager.get("/configurations/1")
+        assert cached["data"]["attributes"] == {"name": "web1", "notes": "Primary"}
+        assert cached["data"]["relationships"] == detail["data"]["relationships"]
+        assert cached["included"] == [org]
+        assert manager.get("/configurations")["data"] == [cached["data"]]
+
+    def test_normalized_response_misses_without_entities(self, config_memory):
+        """Test a response whose entity was evicted is a miss."""
+        config_memory.cache_normalize = True
+        manager = CacheManager(config_memory)
+        manager.set("/organizations", {"data": [{"type": "organizations", "id": "5"}]})
+
+        manager.backend.delete(manager._entity_key("organizations", "5"))
+
+        assert manager.get("/organizations") is None
+
+    def test_snapshot_pages_are_not_normalized(self, config_memory):
+        """Test scan snapshot pages keep the resources they were fetched with."""
+        config_memory.cache_normalize = True
+        manager = CacheManager(config_memory)
+        org = {"type": "organizations", "id": "5", "attributes": {"name": "Old"}}
+        manager.set("/organizations", {"data": [org]}, snapshot_id="scan")
+
+        manager.put_entities([{**org, "attributes": {"name": "New"}}])
+
+        assert manager.get("/organizations", snapshot_id="scan") == {"data": [org]}
+
+    def test_invalidate_queries(self, config_memory):
+        """Test filtered, sorted and nested lists are dropped by type."""
+        manager = CacheManager(config_memory)
+        page = {"data": [{"type": "configurations", "id": "1"}]}
+
+        manager.set("/configurations", page, {"page[number]": "1"})
+        manager.set("/configurations", page, {"filter[name]": "web"})
+        manager.set("/configurations", page, {"sort": "name"})
+        manager.set("/organizations/5/relationships/configurations", page)
+        manager.set("/configurations/1", {"data": page["data"][0]})
+
+        manager.invalidate_queries("configurations")
+
+        assert manager.get("/configurations", {"page[number]": "1"}) == page
+        assert manager.get("/configurations/1") is not None
+        assert manager.get("/configurations", {"filter[name]": "web"}) is None
+        assert manager.get("/configurations", {"sort": "name"}) is None
+        assert manager.get("/organizations/5/relationships/configurations") is None
+
+    def test_normalization_disabled(self, config_memory):
+        """Test responses are stored whole when normalization is off."""
+        config_memory.cache_normalize = False
+        manager = CacheManager(config_memory)
+        response = {"data": [{"type": "organizations", "id": "5"}]}
+
+        manager.set("/organizations", response)
+        manager.put_entities([{"type": "organizations", "id": "5", "attributes": {}}])
+
+        stored = manager.backend.get(manager._generate_cache_key("/organizations"))
+        assert stored["data"] == response
+        assert manager.get_entity("organizations", "5") is None
+
+    def test_get_many_and_set_many(self, config_memory):
+        """Test batched reads and writes line up with the single-key API."""
+        manager = CacheManager(config_memory)
+        pages = [{"page[number]": str(n)} for n in (1, 2, 3)]
+
+        manager.set_many(
+            "/organizations",
+            [(pages[0], {"data": [1]}), (pages[1], {"data": [2]})],
+        )
+
+        assert manager.get_many("/organizations", pages) == [
+            {"data": [1]},
+            {"data": [2]},
+            None,
+        ]
+        assert manager.get("/organizations", pages[1]) == {"data": [2]}
+
+        manager.invalidate_endpoint("/organizations")
+        assert manager.get_many("/organizations", pages) == [None, None, None]
+
+    def test_stats(self, config_memory):
+        """Test hits, misses, sets and latency are counted per endpoint."""
+        manager = CacheManager(config_memory)
+
+        manager.set("/organizations/1", {"data": {"id": "1"}})
+        manager.get("/organizations/1")
+        manager.get("/organizations/2")
+        manager.get("/users")
+
+        stats = manager.get_stats()
+        organizations = stats["endpoints"]["/organizations"]
+
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["hit_ratio"] == pytest.approx(1 / 3)
+        assert organizations["sets"] == 1
+        assert organizations["hit_ratio"] == 0.5
+        assert organizations["bytes_written"] > 0
+        assert organizations["get_latency_ms"]["calls"] == 2
+        assert stats["endpoints"]["/users"]["misses"] == 1
+        assert stats["bytes_stored"] == manager.backend.current_bytes
+
+        manager.reset_stats()
+        assert manager.get_stats()["endpoints"] == {}
+
+    def test_stats_evictions_and_expirations(self):
+        """Test backend evictions and expirations reach the statistics."""
+        config = ITGlueConfig(api_key="test-key")
+        manager = CacheManager(config)
+        manager.backend = MemoryCache(max_size=1)
+        manager.backend.listener = manager._on_backend_event
+
+        manager.set("/users/1", {"data": {}}, ttl=10)
+        manager.set("/contacts/1", {"data": {}}, ttl=10)
+        with patch("itglue.cache.time.time", return_value=time.time() + 60):
+            manager.get("/contacts/1")
+
+        stats = manager.get_stats()
+        assert stats["endpoints"]["/users"]["evictions"] == 1
+        assert stats["endpoints"]["/contacts"]["expirations"] == 1
+        assert stats["evictions"] == 1
+
+    def test_ttl_policies(self):
+        """Test TTLs follow endpoint and resource type policies."""
+        config = ITGlueConfig(
+            api_key="test-key",
+            cache_ttl=300,
+            cache_ttl_policies={
+                "/organizations/5": 10,
+                "configuration-types": 7200,
+                "passwords": 0,
+            },
+        )
+        manager = CacheManager(config)
+
+        assert manager.ttl_for("/organizations/5/relationships/passwords") == 10
+        assert manager.ttl_for("/organizations/6") == 300
+        assert manager.ttl_for("/configuration_types") == 7200
+        assert manager.ttl_for("/organizations/6/relationships/configurations/1") == 120
+        assert manager.ttl_for("/flexible_asset_types") == 6 * 3600
+
+        manager.set("/configuration_types", {"data": []})
+        manager.set("/passwords/1", {"data": {}})
+        manager.set("/passwords/2", {"data": {}}, ttl=60)
+
+        entry = manager.backend.get(manager._generate_cache_key("/configuration_types"))
+        assert entry["ttl"] == 7200
+        # A policy of 0 skips caching, even with a per-call TTL
+        assert manager.get("/passwords/1") is None
+        assert manager.get("/passwords/2") is None
+        assert manager.backend.get(manager._generate_cache_key("/passwords/2")) is None
+
+    def test_passwords_are_not_cached_by_default(self, config_memory):
+        """Test password details, which carry the secret, are never cached."""
+        manager = CacheManager(config_memory)
+        detail = {
+            "data": {
+                "type": "passwords",
+                "id": "1",
+                "attributes": {"name": "Gmail", "password": "secret"},
+            }
+        }
+
+        manager.set("/passwords/1", detail)
+        manager.set("/organizations/5/relationships/passwords", {"data": []})
+
+        assert manager.ttl_for("/passwords/1") == 0
+        assert manager.get("/passwords/1") is None
+        assert list(manager.backend.entries()) == []
+
+    def test_negative_cache(self, config_memory):
+        """Test negative results are scoped and invalidated together."""
+        manager = CacheManager(config_memory)
+
+        assert manager.is_negative("/users", "/users", {"filter[email]": "a"}) is False
+
+        manager.set_negative("/users", "/users", {"filter[email]": "a"})
+        manager.set_negative("/users", "/users/7")
+        manager.set_negative("/passwords", "/passwords", {"filter[name]": "a"})
+
+        assert manager.is_negative("/users", "/users", {"filter[email]": "a"})
+        assert manager.is_negative("/users", "/users/7")
+        assert not manager.is_negative("/users", "/users", {"filter[email]": "b"})
+
+        manager.invalidate_negative("/users")
+
+        assert not manager.is_negative("/users", "/users", {"filter[email]": "a"})
+        assert not manager.is_negative("/users", "/users/7")
+        assert manager.is_negative("/passwords", "/passwords", {"filter[name]": "a"})
+
+    def test_negative_cache_disabled(self, config_memory):
+        """Test a zero negative TTL disables negative caching."""
+        config_memory.cache_negative_ttl = 0
+        manager = CacheManager(config_memory)
+
+        manager.set_negative("/users", "/users/7")
+
+        assert manager.is_negative("/users", "/users/7") is False
 
     def test_cache_error_handling(self, config_memory):
         """Test error handling in cache operations."""
@@ -450,3 +1465,469 @@ class TestCacheManager:
 
         # Set should not raise error
         manager.set("/test", {"data": []})  # Should not raise
+
+
+class TestModelCache:
+    """Test the decoded model cache."""
+
+    @staticmethod
+    def _resource(resource_id="1", updated_at="2024-06-01T08:00:00.000Z", **attrs):
+        attributes = {"name": "Acme", "tags": ["a"], **attrs}
+        if updated_at is not None:
+            attributes["updated-at"] = updated_at
+        return {"type": "organizations", "id": resource_id, "attributes": attributes}
+
+    def test_hits_return_independent_copies(self):
+        """Test a cached model is copied, including nested attributes."""
+        from itglue.models.organization import Organization
+
+        cache = ModelCache()
+        first = cache.decode(Organization, self._resource())
+        first.attributes["tags"].append("b")
+        second = cache.decode(Organization, self._resource())
+        second.name = "Changed"
+        third = cache.decode(Organization, self._resource())
+
+        assert isinstance(third, Organization)
+        assert third.name == "Acme"
+        assert third.attributes["tags"] == ["a"]
+        assert cache.snapshot() == {"hits": 2, "misses": 1, "size": 1}
+
+    def test_relationships_follow_each_response(self):
+        """Test relationships are the caller's own and never go stale."""
+        from itglue.models.organization import Organization
+
+        def with_configurations(*ids):
+            refs = [{"type": "configurations", "id": i} for i in ids]
+            return {
+                **self._resource(),
+                "relationships": {"configurations": {"data": refs}},
+            }
+
+        cache = ModelCache()
+        first = cache.decode(Organization, with_configurations("1"))
+        first.relationships["configurations"].data.append(
+            first.relationships["configurations"].data[0]
+        )
+        second = cache.decode(Organization, with_configurations("1"))
+        second.relationships["configurations"].data[0].id = "9"
+        # A related record was added without changing updated-at
+        third = cache.decode(Organization, with_configurations("1", "2"))
+
+        assert second.get_related_ids("configurations") == ["9"]
+        assert third.get_related_ids("configurations") == ["1", "2"]
+        assert cache.decode(Organization, self._resource()).relationships is None
+        assert cache.snapshot() == {"hits": 3, "misses": 1, "size": 1}
+
+    def test_key_includes_version_and_fields(self):
+        """Test other versions and sparse fieldsets are decoded separately."""
+        from itglue.models.organization import Organization
+
+        cache = ModelCache()
+        cache.decode(Organization, self._resource())
+        cache.decode(Organization, self._resource(updated_at="2024-06-02T00:00:00Z"))
+        cache.decode(Organization, self._resource(alert="Check backups"))
+        cache.decode(Organization, self._resource(resource_id="2"))
+
+        assert cache.snapshot()["misses"] == 4
+
+    def test_unversioned_resources_are_not_cached(self):
+        """Test resources without an id or updated-at are always validated."""
+        from itglue.models.organization import Organization
+
+        cache = ModelCache()
+        cache.decode(Organization, self._resource(updated_at=None))
+        cache.decode(Organization, {"type": "organizations", "attributes": {}})
+
+        assert len(cache) == 0
+
+    def test_lru_bound(self):
+        """Test the least recently used model is dropped first."""
+        from itglue.models.organization import Organization
+
+        cache = ModelCache(max_size=2)
+        cache.decode(Organization, self._resource("1"))
+        cache.decode(Organization, self._resource("2"))
+        cache.decode(Organization, self._resource("1"))
+        cache.decode(Organization, self._resource("3"))
+        cache.decode(Organization, self._resource("1"))
+
+        assert len(cache) == 2
+        assert cache.snapshot()["hits"] == 2
+
+    def test_manager_decode_and_clear(self):
+        """Test the manager decodes through its model cache when enabled."""
+        from itglue.models.organization import Organization
+
+        manager = CacheManager(ITGlueConfig(api_key="test-key"))
+        assert manager.models is None
+        assert manager.decode(Organization, self._resource()).name == "Acme"
+        assert manager.get_stats()["models"] is None
+
+        manager = CacheManager(
+            ITGlueConfig(api_key="test-key", cache_model_max_size=10)
+        )
+        manager.decode(Organization, self._resource())
+        manager.decode(Organization, self._resource())
+        assert manager.get_stats()["models"]["hits"] == 1
+
+        manager.clear()
+        assert len(manager.models) == 0
+
+
+class TestCacheSnapshots:
+    """Test exporting and importing cache snapshots."""
+
+    def test_round_trip_keeps_entries_and_tags(self, tmp_path):
+        """Test a snapshot loads into a fresh manager with its tags."""
+        path = str(tmp_path / "cache.snapshot")
+        config = ITGlueConfig(api_key="test-key", cache_normalize=True)
+        source = CacheManager(config)
+        source.set("/organizations", {"data": [{"type": "organizations", "id": "5"}]})
+        source.set("/users", {"data": []}, {"filter[name]": "x"})
+
+        # The organization is stored as an entity next to the two responses
+        assert source.export_snapshot(path) == 3
+
+        target = CacheManager(config)
+        assert target.import_snapshot(path) == 3
+        assert target.get("/organizations") == {
+            "data": [{"type": "organizations", "id": "5"}]
+        }
+        assert target.get("/users", {"filter[name]": "x"}) == {"data": []}
+
+        target.invalidate_endpoint("/users")
+        assert target.get("/users", {"filter[name]": "x"}) is None
+
+    def test_expired_entries_are_skipped(self, tmp_path):
+        """Test entries whose lifetime ran out since the export are skipped."""
+        path = str(tmp_path / "cache.snapshot")
+        source = CacheManager(ITGlueConfig(api_key="test-key"))
+        source.set("/configurations/1", {"data": {}}, ttl=10)
+        source.set("/organizations/1", {"data": {}}, ttl=600)
+        source.export_snapshot(path)
+
+        target = CacheManager(ITGlueConfig(api_key="test-key"))
+        with patch("itglue.cache.time.time", return_value=time.time() + 60):
+            assert target.import_snapshot(path) == 1
+
+        assert target.get("/configurations/1") is None
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_snapshot_is_private_and_omits_secrets(self, tmp_path):
+        """Test the file is owner-only and password entries are left out."""
+        path = str(tmp_path / "cache.snapshot")
+        source = CacheManager(
+            ITGlueConfig(api_key="test-key", cache_ttl_policies={"passwords": 60})
+        )
+        secret = {"type": "passwords", "id": "1", "attributes": {"password": "s"}}
+        source.set("/passwords/1", {"data": secret})
+        source.set("/organizations/5/relationships/passwords", {"data": [secret]})
+        source.set("/configurations/1", {"data": {}})
+
+        assert source.export_snapshot(path) == 1
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+        target = CacheManager(ITGlueConfig(api_key="test-key"))
+        target.import_snapshot(path)
+        assert target.get("/configurations/1") == {"data": {}}
+        assert target.get_entity("passwords", "1") is None
+
+    def test_disk_snapshot_loads_into_memory(self, tmp_path):
+        """Test snapshots move between backends."""
+        path = str(tmp_path / "cache.snapshot")
+        source = CacheManager(
+            ITGlueConfig(
+                api_key="test-key",
+                cache_type="disk",
+                cache_disk_path=str(tmp_path / "cache.sqlite3"),
+            )
+        )
+        source.set("/organizations/1", {"data": {}})
+        source.export_snapshot(path)
+        source.close()
+
+        target = CacheManager(ITGlueConfig(api_key="test-key"))
+        target.import_snapshot(path)
+
+        assert target.get("/organizations/1") == {"data": {}}
+
+    def test_invalid_snapshot(self, tmp_path):
+        """Test unreadable files raise a cache error."""
+        manager = CacheManager(ITGlueConfig(api_key="test-key"))
+        path = tmp_path / "not-a-snapshot"
+        path.write_bytes(b"plain text")
+
+        with pytest.raises(ITGlueCacheError):
+            manager.import_snapshot(str(path))
+        with pytest.raises(ITGlueCacheError):
+            manager.import_snapshot(str(tmp_path / "missing"))
+
+    def test_redis_entries(self):
+        """Test Redis entries are listed with their TTLs and tags."""
+        redis_client = Mock()
+        cache = RedisCache(redis_client, key_prefix="test:")
+        encoded = cache.codec.encode({"data": []})
+        redis_client.scan_iter.side_effect = [
+            iter([b"test:tag:endpoint:/users"]),
+            iter([b"test:a", b"test:tag:endpoint:/users", b"test:lease:a", b"test:b"]),
+        ]
+        redis_client.smembers.return_value = {b"test:a"}
+        redis_client.pipeline.return_value.execute.return_value = [
+            encoded,
+            1500,
+            encoded,
+            -1,
+        ]
+
+        assert list(cache.entries()) == [
+            ("a", {"data": []}, 1.5, ["endpoint:/users"]),
+            ("b", {"data": []}, None, []),
+        ]
+
+
+class TestStampedeProtection:
+    """Test leases that let one caller recompute a missed key."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a memory cache manager with a short lease timeout."""
+        return CacheManager(ITGlueConfig(api_key="test-key", cache_lease_timeout=2))
+
+    @staticmethod
+    def _read(manager, fetch):
+        """Read through the cache the way the client does."""
+        data = manager.get("/organizations", refresh=fetch)
+        if data is None:
+            data = fetch()
+            manager.set("/organizations", data)
+        return data
+
+    def test_concurrent_misses_fetch_once(self, manager):
+        """Test threads missing the same key share one fetch."""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"data": [1]}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self._read(manager, fetch)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"data": [1]}] * 8
+
+    def test_uncached_endpoint_misses_do_not_wait(self, manager):
+        """Test concurrent reads of a TTL-0 endpoint never queue on a lease."""
+        timings = []
+
+        def read():
+            started = time.perf_counter()
+            manager.get("/passwords/1", refresh=Mock())
+            timings.append(time.perf_counter() - started)
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(timings) == 8
+        assert max(timings) < 1
+        assert manager._leases == {}
+
+    def test_released_lease_wakes_waiters(self, manager):
+        """Test a failed fetch does not leave others waiting out the timeout."""
+        assert manager.get("/organizations", refresh=Mock()) is None
+
+        waited = []
+
+        def wait():
+            started = time.perf_counter()
+            waited.append(manager.get("/organizations", refresh=Mock()))
+            waited.append(time.perf_counter() - started)
+
+        waiter = threading.Thread(target=wait)
+        waiter.start()
+        time.sleep(0.05)
+        manager.release_lease("/organizations")
+        waiter.join()
+
+        assert waited[0] is None
+        assert waited[1] < 1
+
+    def test_lapsed_lease_is_taken_over(self, manager):
+        """Test a lease that is never set or released stops blocking."""
+        manager.config.cache_lease_timeout = 0.05
+        assert manager.get("/organizations", refresh=Mock()) is None
+        time.sleep(0.1)
+
+        started = time.perf_counter()
+        assert manager.get("/organizations", refresh=Mock()) is None
+        assert time.perf_counter() - started < 0.05
+
+    def test_waits_for_other_process(self, manager):
+        """Test a caller denied the backend lease waits for the holder's value."""
+        manager.backend.acquire_lease = Mock(return_value=None)
+        fetch = Mock()
+
+        def other_process():
+            time.sleep(0.1)
+            manager.backend.set(
+                manager._generate_cache_key("/organizations"),
+                manager._wrap({"data": [2]}, 60, "/organizations"),
+            )
+
+        writer = threading.Thread(target=other_process)
+        writer.start()
+        result = manager.get("/organizations", refresh=fetch)
+        writer.join()
+
+        assert result == {"data": [2]}
+        fetch.assert_not_called()
+        assert manager._leases == {}
+
+    def test_without_refresh_no_lease(self, manager):
+        """Test plain lookups never wait or take leases."""
+        assert manager.get("/organizations") is None
+        assert manager._leases == {}
+
+    def test_redis_lease(self):
+        """Test Redis leases use SET NX PX and compare-and-delete."""
+        mock_redis = Mock()
+        cache = RedisCache(mock_redis, key_prefix="test:")
+
+        mock_redis.set.return_value = True
+        token = cache.acquire_lease("key", 1.5)
+        mock_redis.set.assert_called_once_with(
+            "test:lease:key", token, nx=True, px=1500
+        )
+
+        cache.release_lease("key", token)
+        mock_redis.eval.assert_called_once_with(
+            RedisCache._RELEASE_SCRIPT, 1, "test:lease:key", token
+        )
+
+        mock_redis.set.return_value = None
+        assert cache.acquire_lease("key", 1.5) is None
+
+
+class TestStaleWhileRevalidate:
+    """Test stale-while-revalidate and refresh-ahead in CacheManager."""
+
+    @pytest.fixture
+    def clock(self):
+        """Patch the cache module clock."""
+        with patch("itglue.cache.time") as mock_time:
+            mock_time.time.return_value = 1000.0
+            yield mock_time
+
+    @pytest.fixture
+    def manager(self, clock):
+        """Create a memory cache manager with a stale window."""
+        config = ITGlueConfig(
+            api_key="test-key", cache_ttl=60, cache_stale_ttl=30
+        )
+        return CacheManager(config)
+
+    @staticmethod
+    def _wait_for_refreshes(manager):
+        for future in list(manager._refreshing.values()):
+            future.result(timeout=5)
+
+    def test_fresh_entry_does_not_refresh(self, manager, clock):
+        """Test fresh entries are served without a refetch."""
+        refresh = Mock(return_value={"data": "new"})
+        manager.set("/organizations", {"data": "old"})
+
+        clock.time.return_value = 1059.0
+        assert manager.get("/organizations", refresh=refresh) == {"data": "old"}
+
+        refresh.assert_not_called()
+
+    def test_stale_entry_served_and_refreshed(self, manager, clock):
+        """Test a stale entry is returned at once and refreshed behind it."""
+        refresh = Mock(return_value={"data": "new"})
+        manager.set("/organizations", {"data": "old"})
+
+        clock.time.return_value = 1070.0
+        assert manager.get("/organizations", refresh=refresh) == {"data": "old"}
+        self._wait_for_refreshes(manager)
+
+        refresh.assert_called_once()
+        assert manager.get("/organizations", refresh=refresh) == {"data": "new"}
+
+    def test_stale_entry_is_miss_without_refresh(self, manager, clock):
+        """Test callers that cannot refresh never see stale data."""
+        manager.set("/organizations", {"data": "old"})
+
+        clock.time.return_value = 1070.0
+
+        assert manager.get("/organizations") is None
+
+    def test_entry_gone_after_stale_window(self, manager, clock):
+        """Test entries are dropped once the stale window has passed."""
+        refresh = Mock(return_value={"data": "new"})
+        manager.set("/organizations", {"data": "old"})
+
+        clock.time.return_value = 1091.0
+
+        assert manager.get("/organizations", refresh=refresh) is None
+        refresh.assert_not_called()
+
+    def test_one_refresh_per_key(self, manager, clock):
+        """Test concurrent stale reads trigger a single refresh."""
+        release = threading.Event()
+
+        def _slow_refresh():
+            release.wait(timeout=5)
+            return {"data": "new"}
+
+        refresh = Mock(side_effect=_slow_refresh)
+        manager.set("/organizations", {"data": "old"})
+
+        clock.time.return_value = 1070.0
+        for _ in range(3):
+            manager.get("/organizations", refresh=refresh)
+        release.set()
+        self._wait_for_refreshes(manager)
+
+        refresh.assert_called_once()
+
+    def test_failed_refresh_keeps_stale_entry(self, manager, clock):
+        """Test a failed refresh leaves the stale entry in place."""
+        refresh = Mock(side_effect=Exception("API down"))
+        manager.set("/organizations", {"data": "old"})
+
+        clock.time.return_value = 1070.0
+        manager.get("/organizations", refresh=refresh)
+        self._wait_for_refreshes(manager)
+
+        assert manager.get("/organizations", refresh=refresh) == {"data": "old"}
+
+    def test_refresh_ahead(self, clock):
+        """Test entries read near expiry are renewed before going stale."""
+        config = ITGlueConfig(api_key="test-key", cache_ttl=60, cache_refresh_ahead=0.25)
+        manager = CacheManager(config)
+        refresh = Mock(return_value={"data": "new"})
+        manager.set("/organizations", {"data": "old"})
+
+        clock.time.return_value = 1040.0
+        assert manager.get("/organizations", refresh=refresh) == {"data": "old"}
+        refresh.assert_not_called()
+
+        clock.time.return_value = 1050.0
+        assert manager.get("/organizations", refresh=refresh) == {"data": "old"}
+        self._wait_for_refreshes(manager)
+
+        refresh.assert_called_once()
+        clock.time.return_value = 1070.0
+        assert manager.get("/organizations") == {"data": "new"}
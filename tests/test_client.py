@@ -83,7 +83,7 @@ class TestITGlueClient:
             "/organizations/1", None
         )
         mock_components["cache"].set.assert_called_once_with(
-            "/organizations/1", mock_data, None
+            "/organizations/1", mock_data, None, ttl=None
         )
 
     def test_get_resource_list(self, config, mock_components):
@@ -101,7 +101,7 @@ class TestITGlueClient:
             "/organizations", params
         )
         mock_components["cache"].set.assert_called_once_with(
-            "/organizations", mock_data, params
+            "/organizations", mock_data, params, ttl=None
         )
 
     def test_get_resource_from_cache(self, config, mock_components):
@@ -115,6 +115,46 @@ class TestITGlueClient:
         assert result == cached_data
         mock_components["http_client"].get.assert_not_called()
 
+    def test_get_resource_passes_background_refresh(self, config, mock_components):
+        """Test cached reads can be revalidated with the same request."""
+        mock_components["cache"].get.return_value = {"data": []}
+        mock_components["http_client"].get.return_value = {"data": [{"id": "1"}]}
+
+        client = ITGlueClient(config)
+        client.get_resource("/organizations", params={"page[size]": 1})
+
+        refresh = mock_components["cache"].get.call_args[1]["refresh"]
+        assert refresh() == {"data": [{"id": "1"}]}
+        mock_components["http_client"].get.assert_called_once_with(
+            "/organizations", {"page[size]": 1}
+        )
+
+    def test_get_resource_cache_ttl_override(self, config, mock_components):
+        """Test a per-call TTL is passed to the cache."""
+        mock_components["cache"].get.return_value = None
+        mock_components["http_client"].get.return_value = {"data": []}
+
+        client = ITGlueClient(config)
+        client.get_resource("/passwords", cache_ttl=5)
+
+        mock_components["cache"].set.assert_called_once_with(
+            "/passwords", {"data": []}, None, ttl=5
+        )
+
+    def test_get_resource_failure_releases_lease(self, config, mock_components):
+        """Test a failed fetch releases the cache lease for waiting callers."""
+        mock_components["cache"].get.return_value = None
+        mock_components["http_client"].get.side_effect = ITGlueAPIError("Down")
+
+        client = ITGlueClient(config)
+        with pytest.raises(ITGlueAPIError):
+            client.get_resource("/organizations")
+
+        mock_components["cache"].release_lease.assert_called_once_with(
+            "/organizations", None, "GET"
+        )
+        mock_components["cache"].set.assert_not_called()
+
     def test_get_resource_force_refresh(self, config, mock_components):
         """Test force refresh bypasses cache."""
         cached_data = {"data": [{"id": "1", "type": "organizations"}]}
@@ -145,23 +185,24 @@ class TestITGlueClient:
 
         assert result == mock_response
         mock_components["pagination"].get_page.assert_called_once_with(
-            "/organizations", 2, 10, None
-        )
-
-    def test_get_resource_page_from_cache(self, config, mock_components):
-        """Test getting page from cache."""
-        mock_data = {"data": [{"id": "1"}], "meta": {"current-page": 1}}
-
-        mock_components["cache"].get.return_value = mock_data
-        mock_components["pagination"].parse_response.return_value = PaginatedResponse(
-            mock_data["data"], mock_data["meta"]
+            "/organizations", 2, 10, force_refresh=False, cache_ttl=None
         )
 
+    def test_get_resource_page_force_refresh(self, config, mock_components):
+        """Test force refresh and query params are passed to the page cache."""
         client = ITGlueClient(config)
-        result = client.get_resource_page("/organizations", page=1)
+        client.get_resource_page(
+            "/organizations", page=1, params={"filter[name]": "x"}, force_refresh=True
+        )
 
-        assert isinstance(result, PaginatedResponse)
-        mock_components["pagination"].get_page.assert_not_called()
+        mock_components["pagination"].get_page.assert_called_once_with(
+            "/organizations",
+            1,
+            None,
+            force_refresh=True,
+            cache_ttl=None,
+            **{"filter[name]": "x"},
+        )
 
     def test_get_all_resources(self, config, mock_components):
         """Test getting all resources across pages."""
@@ -177,7 +218,7 @@ class TestITGlueClient:
 
         assert result == mock_data
         mock_components["pagination"].get_all_pages.assert_called_once_with(
-            "/organizations", 10, None, 5
+            "/organizations", 10, 5
         )
 
     def test_iterate_resources(self, config, mock_components):
@@ -194,7 +235,7 @@ class TestITGlueClient:
         assert items[0]["id"] == "1"
 
         mock_components["pagination"].iterate_items.assert_called_once_with(
-            "/organizations", None, None, None
+            "/organizations", None, None, None, consistent=False, bypass_cache=False
         )
 
     def test_iterate_pages(self, config, mock_components):
@@ -253,6 +294,9 @@ class TestITGlueClient:
             "/organizations"
         )
         mock_components["cache"].delete.assert_called_once_with("/organizations/1")
+        mock_components["cache"].invalidate_resource.assert_called_once_with(
+            "organizations", "1"
+        )
 
     def test_delete_resource(self, config, mock_components):
         """Test deleting a resource."""
@@ -283,6 +327,7 @@ class TestITGlueClient:
         mock_backend.cache = {"key1": "value1", "key2": "value2"}
         mock_backend.max_size = 100
         mock_components["cache"].backend = mock_backend
+        mock_components["cache"].get_stats.return_value = {"hit_ratio": 0.5}
 
         client = ITGlueClient(config)
         stats = client.get_cache_stats()
@@ -290,6 +335,7 @@ class TestITGlueClient:
         assert stats["cache_enabled"] == True
         assert stats["cache_size"] == 2
         assert stats["cache_max_size"] == 100
+        assert stats["hit_ratio"] == 0.5
 
     def test_get_cache_stats_without_memory_backend(self, config, mock_components):
         """Test getting cache stats without memory backend."""
@@ -298,6 +344,7 @@ class TestITGlueClient:
         if hasattr(mock_backend, "cache"):
             del mock_backend.cache
         mock_components["cache"].backend = mock_backend
+        mock_components["cache"].get_stats.return_value = {}
 
         client = ITGlueClient(config)
         stats = client.get_cache_stats()
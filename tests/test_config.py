@@ -101,6 +101,72 @@ class TestITGlueConfig:
         assert config_dict["timeout"] == 45
         assert "base_url" in config_dict
 
+    def test_config_cache_limits(self):
+        """Test cache size limits are exported and validated."""
+        config = ITGlueConfig(api_key="test-key", cache_max_bytes=1024)
+
+        assert config.to_dict()["cache_max_bytes"] == 1024
+        assert config.to_dict()["cache_max_rss_bytes"] is None
+        config.validate()
+
+        config.cache_max_rss_bytes = 0
+        with pytest.raises(ValueError, match="Cache max RSS bytes must be positive"):
+            config.validate()
+
+        config.cache_max_rss_bytes = None
+        config.cache_memory_shards = 0
+        with pytest.raises(ValueError, match="Cache memory shards must be at least 1"):
+            config.validate()
+
+        config.cache_memory_shards = 1
+        config.cache_model_max_size = -1
+        with pytest.raises(ValueError, match="Cache model max size must be non-negative"):
+            config.validate()
+
+        config.cache_model_max_size = 0
+        config.cache_admission = "lfu"
+        with pytest.raises(ValueError, match="Cache admission must be"):
+            config.validate()
+
+        config.cache_admission = "tinylfu"
+        config.validate()
+        config.cache_refresh_ahead = 1.5
+        with pytest.raises(ValueError, match="refresh-ahead must be between 0 and 1"):
+            config.validate()
+
+        config.cache_refresh_ahead = 0.0
+        config.redis_max_connections = 0
+        with pytest.raises(ValueError, match="Redis max connections must be positive"):
+            config.validate()
+
+        config.redis_max_connections = 10
+        config.cache_compression = "lz4"
+        with pytest.raises(ValueError, match="Cache compression must be"):
+            config.validate()
+
+    def test_config_ttl_policies_from_environment(self):
+        """Test TTL policies are parsed from the environment."""
+        with patch.dict(
+            os.environ,
+            {
+                "ITGLUE_API_KEY": "env-key",
+                "ITGLUE_CACHE_TTL_POLICIES": "passwords=30, /organizations=900",
+            },
+        ):
+            config = ITGlueConfig.from_environment()
+
+        assert config.cache_ttl_policies == {"passwords": 30, "/organizations": 900}
+        assert config.cache_normalize is False
+
+        with patch.dict(
+            os.environ, {"ITGLUE_API_KEY": "env-key", "ITGLUE_CACHE_NORMALIZE": "true"}
+        ):
+            assert ITGlueConfig.from_environment().cache_normalize is True
+
+        config.cache_ttl_policies["passwords"] = -1
+        with pytest.raises(ValueError, match="TTL policies must be non-negative"):
+            config.validate()
+
     def test_config_from_dict(self):
         """Test creating config from dictionary."""
         config_dict = {"api_key": "dict-test-key", "timeout": 45, "max_retries": 5}
@@ -63,6 +63,29 @@ class TestSimpleRateLimiter:
         assert len(limiter.five_minute_requests) == 2  # Old request + new request
 
 
+    def test_rate_limiter_sleeps_without_lock(self):
+        """Test a caller waiting for budget does not block the others."""
+        limiter = SimpleRateLimiter(requests_per_minute=1)
+        limiter.minute_requests = [time.time() - 59.8]
+        limiter.five_minute_requests = list(limiter.minute_requests)
+        released = []
+
+        def sleep(seconds):
+            # Another thread can take the lock while this one sleeps
+            acquired = limiter._lock.acquire(blocking=False)
+            released.append(acquired)
+            if acquired:
+                limiter._lock.release()
+            limiter.minute_requests = []
+
+        with patch("itglue.http_client.time.sleep", side_effect=sleep) as mock_sleep:
+            limiter.wait_if_needed()
+
+        assert released == [True]
+        assert 0 < mock_sleep.call_args[0][0] <= 0.2
+        assert len(limiter.minute_requests) == 1
+
+
 class TestITGlueHTTPClient:
     """Test HTTP client functionality."""
 
@@ -2,6 +2,7 @@
 Tests for ITGlue Pagination Handler
 """
 
+import threading
 from unittest.mock import Mock, patch
 import pytest
 
@@ -9,8 +10,11 @@ from itglue.pagination import (
     PaginationInfo,
     PaginatedResponse,
     PaginationHandler,
+    PaginationCursor,
 )
-from itglue.exceptions import ITGlueAPIError
+from itglue.cache import CacheManager
+from itglue.config import ITGlueConfig
+from itglue.exceptions import ITGlueAPIError, ITGlueCacheError
 
 
 class TestPaginationInfo:
@@ -399,3 +403,412 @@ class TestPaginationHandler:
         assert items[0]["id"] == "1"
         assert items[1]["id"] == "2"
         assert items[2]["id"] == "3"
+
+
+class TestPaginationCursor:
+    """Test per-scan cursors and handler statelessness."""
+
+    @staticmethod
+    def _fake_get(endpoint, params):
+        page = int(params["page[number]"])
+        meta = {"current-page": page, "total-count": 3}
+        if page < 3:
+            meta["next-page"] = page + 1
+        return {"data": [{"id": f"{endpoint}-{page}"}], "meta": meta}
+
+    def test_fetch_next_advances_cursor(self):
+        """Test a cursor tracks its own scan's progress."""
+        handler = PaginationHandler(Mock(get=Mock(side_effect=self._fake_get)))
+        cursor = handler.open_cursor("/a", page_size=1, params={"sort": "name"})
+
+        assert isinstance(cursor, PaginationCursor)
+        assert cursor.query == {"sort": "name", "page[size]": "1"}
+        assert handler.get_current_page_info(cursor) == {}
+
+        first = handler.fetch_next(cursor)
+        assert first[0]["id"] == "/a-1"
+        assert handler.has_next_page(cursor)
+        assert handler.get_current_page_info(cursor)["current_page"] == 1
+
+        handler.fetch_next(cursor)
+        handler.fetch_next(cursor)
+
+        assert not handler.has_next_page(cursor)
+        assert cursor.pages_fetched == [1, 2, 3]
+        assert handler.fetch_next(cursor) is None
+
+    def test_interleaved_scans_are_independent(self):
+        """Test two scans on one handler do not share state."""
+        handler = PaginationHandler(Mock(get=Mock(side_effect=self._fake_get)))
+        a = handler.open_cursor("/a")
+        b = handler.open_cursor("/b")
+
+        handler.fetch_next(a)
+        handler.fetch_next(b)
+        handler.fetch_next(a)
+
+        assert a.pages_fetched == [1, 2]
+        assert b.pages_fetched == [1]
+        assert handler.get_current_page_info(a)["current_page"] == 2
+        assert handler.get_current_page_info(b)["current_page"] == 1
+
+    def test_iterate_pages_resumes_cursor(self):
+        """Test an iteration can be resumed from an existing cursor."""
+        handler = PaginationHandler(Mock(get=Mock(side_effect=self._fake_get)))
+        cursor = handler.open_cursor("/a")
+
+        first = list(handler.iterate_pages("/a", max_pages=1, cursor=cursor))
+        rest = list(handler.iterate_pages("/a", cursor=cursor))
+
+        assert [page[0]["id"] for page in first] == ["/a-1"]
+        assert [page[0]["id"] for page in rest] == ["/a-2", "/a-3"]
+
+    def test_concurrent_scans_share_handler(self):
+        """Test threads scanning through one handler get their own results."""
+        handler = PaginationHandler(Mock(get=Mock(side_effect=self._fake_get)))
+        endpoints = [f"/resource-{i}" for i in range(8)]
+        results = {}
+
+        def _scan(endpoint):
+            results[endpoint] = [item["id"] for item in handler.iterate_items(endpoint)]
+
+        threads = [threading.Thread(target=_scan, args=(e,)) for e in endpoints]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for endpoint in endpoints:
+            assert results[endpoint] == [f"{endpoint}-{page}" for page in (1, 2, 3)]
+
+
+class TestConsistentIteration:
+    """Test consistent-snapshot item iteration over changing data."""
+
+    class _Server:
+        """Page-number API over a list that can change between requests."""
+
+        def __init__(self, count, page_size):
+            self.records = [
+                {"type": "configurations", "id": str(i)} for i in range(count)
+            ]
+            self.page_size = page_size
+            self.requests = []
+            self.on_request = None
+
+        def get(self, endpoint, params):
+            page = int(params["page[number]"])
+            self.requests.append(page)
+            if self.on_request:
+                self.on_request(self, page)
+            start = (page - 1) * self.page_size
+            data = self.records[start : start + self.page_size]
+            meta = {"current-page": page, "total-count": len(self.records)}
+            if start + self.page_size < len(self.records):
+                meta["next-page"] = page + 1
+            return {"data": data, "meta": meta}
+
+    def test_plain_iteration_skips_after_delete(self):
+        """Test the failure mode consistency mode guards against."""
+        server = self._Server(9, 3)
+        server.on_request = lambda srv, page: page == 2 and srv.records.pop(0)
+        handler = PaginationHandler(server)
+
+        ids = [item["id"] for item in handler.iterate_items("/configurations")]
+
+        assert "3" not in ids
+
+    def test_recovers_records_shifted_by_deletes(self):
+        """Test deleted-record shifts are repaired by refetching prior pages."""
+        server = self._Server(9, 3)
+
+        def _delete_before_page_two(srv, page):
+            if page == 2 and len(srv.records) == 9:
+                del srv.records[0]
+
+        server.on_request = _delete_before_page_two
+        handler = PaginationHandler(server)
+
+        ids = [
+            item["id"]
+            for item in handler.iterate_items("/configurations", consistent=True)
+        ]
+
+        assert sorted(ids, key=int) == [str(i) for i in range(9)]
+        assert len(ids) == len(set(ids))
+        # Only the page before the change is fetched again
+        assert server.requests == [1, 2, 1, 3]
+
+    def test_deduplicates_records_shifted_by_inserts(self):
+        """Test records pushed forward by inserts are yielded once."""
+        server = self._Server(6, 3)
+
+        def _insert_before_page_two(srv, page):
+            if page == 2 and len(srv.records) == 6:
+                srv.records.insert(0, {"type": "configurations", "id": "new"})
+
+        server.on_request = _insert_before_page_two
+        handler = PaginationHandler(server)
+
+        ids = [
+            item["id"]
+            for item in handler.iterate_items("/configurations", consistent=True)
+        ]
+
+        assert ids == ["0", "1", "2", "3", "4", "5"]
+        assert server.requests == [1, 2, 3]
+
+    def test_large_delete_refetches_page_range(self):
+        """Test deletions spanning pages refetch each affected page."""
+        server = self._Server(12, 3)
+
+        def _delete_before_page_three(srv, page):
+            if page == 3 and len(srv.records) == 12:
+                del srv.records[0:4]
+
+        server.on_request = _delete_before_page_three
+        handler = PaginationHandler(server)
+
+        ids = [
+            item["id"]
+            for item in handler.iterate_items("/configurations", consistent=True)
+        ]
+
+        assert set(ids) == {str(i) for i in range(12)}
+        assert len(ids) == len(set(ids))
+        assert server.requests == [1, 2, 3, 1, 2]
+
+    def test_drifted_scan_is_not_cached_as_snapshot(self):
+        """Test a scan that observed changes is not replayed from cache."""
+        config = ITGlueConfig(api_key="test-key", cache_type="memory")
+        cache = CacheManager(config)
+        server = self._Server(6, 3)
+        server.on_request = (
+            lambda srv, page: page == 2 and len(srv.records) == 6 and srv.records.pop()
+        )
+        handler = PaginationHandler(server, cache=cache)
+
+        list(handler.iterate_items("/configurations", consistent=True))
+        assert cache.get_scan_snapshot("/configurations", {}) is None
+
+        list(handler.iterate_items("/configurations", consistent=True))
+        assert cache.get_scan_snapshot("/configurations", {}) is not None
+
+
+class TestPaginationCaching:
+    """Test page-level caching in the pagination handler."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create a memory-backed cache manager."""
+        config = ITGlueConfig(api_key="test-key", cache_type="memory", cache_ttl=300)
+        return CacheManager(config)
+
+    @pytest.fixture
+    def mock_http_client(self):
+        """Create mock HTTP client."""
+        return Mock()
+
+    @pytest.fixture
+    def handler(self, mock_http_client, cache):
+        """Create a caching pagination handler."""
+        return PaginationHandler(mock_http_client, cache=cache)
+
+    @staticmethod
+    def _pages(version):
+        return [
+            {"data": [{"id": f"{version}-1"}], "meta": {"current-page": 1, "next-page": 2}},
+            {"data": [{"id": f"{version}-2"}], "meta": {"current-page": 2}},
+        ]
+
+    def test_get_page_writes_and_reads_cache(self, handler, mock_http_client, cache):
+        """Test that fetched pages are cached by query, number and size."""
+        mock_http_client.get.return_value = {"data": [{"id": "1"}], "meta": {}}
+
+        first = handler.get_page("/organizations", 2, 10, **{"filter[name]": "a"})
+        second = handler.get_page("/organizations", 2, 10, **{"filter[name]": "a"})
+
+        assert first.data == second.data
+        mock_http_client.get.assert_called_once()
+        assert cache.get(
+            "/organizations",
+            {"filter[name]": "a", "page[number]": "2", "page[size]": "10"},
+        ) == {"data": [{"id": "1"}], "meta": {}}
+
+        # A different page size is a different cache entry
+        handler.get_page("/organizations", 2, 20, **{"filter[name]": "a"})
+        assert mock_http_client.get.call_count == 2
+
+    def test_get_page_force_refresh_rewrites_cache(self, handler, mock_http_client):
+        """Test force refresh bypasses the lookup but refreshes the entry."""
+        mock_http_client.get.side_effect = [
+            {"data": [{"id": "old"}], "meta": {}},
+            {"data": [{"id": "new"}], "meta": {}},
+        ]
+
+        handler.get_page("/organizations", 1)
+        refreshed = handler.get_page("/organizations", 1, force_refresh=True)
+        cached = handler.get_page("/organizations", 1)
+
+        assert refreshed[0]["id"] == "new"
+        assert cached[0]["id"] == "new"
+        assert mock_http_client.get.call_count == 2
+
+    def test_repeated_scan_served_from_snapshot(self, handler, mock_http_client):
+        """Test a completed scan is replayed from its cached snapshot."""
+        mock_http_client.get.side_effect = self._pages("v1") + self._pages("v2")
+
+        first = [item["id"] for item in handler.iterate_items("/organizations")]
+        second = [item["id"] for item in handler.iterate_items("/organizations")]
+
+        assert first == ["v1-1", "v1-2"]
+        assert second == ["v1-1", "v1-2"]
+        assert mock_http_client.get.call_count == 2
+
+    def test_incomplete_snapshot_is_never_mixed(
+        self, handler, mock_http_client, cache
+    ):
+        """Test that losing one snapshot page forces a fully fresh scan."""
+        mock_http_client.get.side_effect = self._pages("v1") + self._pages("v2")
+
+        list(handler.iterate_items("/organizations"))
+
+        manifest = cache.get_scan_snapshot("/organizations", {})
+        cache.backend.delete(
+            cache._generate_cache_key(
+                "/organizations",
+                {"page[number]": "2"},
+                snapshot_id=manifest["snapshot_id"],
+            )
+        )
+
+        items = [item["id"] for item in handler.iterate_items("/organizations")]
+
+        assert items == ["v2-1", "v2-2"]
+        assert mock_http_client.get.call_count == 4
+
+    def test_snapshot_page_evicted_mid_scan_is_never_mixed(
+        self, handler, mock_http_client, cache
+    ):
+        """Test a middle page evicted mid-scan retires the snapshot."""
+
+        def pages(version):
+            return [
+                {
+                    "data": [{"id": f"{version}-{number}"}],
+                    "meta": {
+                        "current-page": number,
+                        "next-page": number + 1 if number < 3 else None,
+                    },
+                }
+                for number in (1, 2, 3)
+            ]
+
+        mock_http_client.get.side_effect = pages("v1") + pages("v2")
+        list(handler.iterate_items("/organizations"))
+
+        manifest = cache.get_scan_snapshot("/organizations", {})
+        scan = handler.iterate_pages("/organizations")
+        assert next(scan)[0]["id"] == "v1-1"
+
+        cache.backend.delete(
+            cache._generate_cache_key(
+                "/organizations",
+                {"page[number]": "2"},
+                snapshot_id=manifest["snapshot_id"],
+            )
+        )
+        with pytest.raises(ITGlueCacheError, match="page 2"):
+            next(scan)
+
+        # Nothing was fetched live for the abandoned scan
+        assert mock_http_client.get.call_count == 3
+        assert cache.get_scan_snapshot("/organizations", {}) is None
+
+        items = [item["id"] for item in handler.iterate_items("/organizations")]
+        assert items == ["v2-1", "v2-2", "v2-3"]
+        assert cache.get_scan_snapshot("/organizations", {})["snapshot_id"] != (
+            manifest["snapshot_id"]
+        )
+
+    def test_snapshot_page_evicted_before_first_page_restarts_live(
+        self, handler, mock_http_client, cache
+    ):
+        """Test a scan that lost its first page restarts under a new snapshot."""
+        mock_http_client.get.side_effect = self._pages("v1") + self._pages("v2")
+        list(handler.iterate_items("/organizations"))
+
+        cursor = handler.open_cursor("/organizations")
+        assert cursor.from_snapshot
+        old_snapshot_id = cursor.snapshot_id
+        cache.backend.delete(
+            cache._generate_cache_key(
+                "/organizations", {"page[number]": "1"}, snapshot_id=old_snapshot_id
+            )
+        )
+
+        items = [
+            item["id"]
+            for page in handler.iterate_pages("/organizations", cursor=cursor)
+            for item in page
+        ]
+
+        assert items == ["v2-1", "v2-2"]
+        assert cursor.snapshot_id != old_snapshot_id
+        assert cache.get_scan_snapshot("/organizations", {})["snapshot_id"] == (
+            cursor.snapshot_id
+        )
+
+    def test_partial_scan_does_not_publish_snapshot(
+        self, handler, mock_http_client, cache
+    ):
+        """Test a scan stopped early is not reused as a complete listing."""
+        mock_http_client.get.side_effect = self._pages("v1") + self._pages("v2")
+
+        list(handler.iterate_pages("/organizations", max_pages=1))
+
+        assert cache.get_scan_snapshot("/organizations", {}) is None
+        # Its pages, which no manifest could reach, are not cached either
+        assert list(cache.backend.entries()) == []
+
+    def test_force_refresh_scan_skips_snapshot(self, handler, mock_http_client):
+        """Test force refresh starts a new snapshot."""
+        mock_http_client.get.side_effect = self._pages("v1") + self._pages("v2")
+
+        list(handler.iterate_items("/organizations"))
+        items = [
+            item["id"]
+            for page in handler.iterate_pages("/organizations", force_refresh=True)
+            for item in page
+        ]
+
+        assert items == ["v2-1", "v2-2"]
+
+    def test_bypass_cache_scan_leaves_cache_untouched(
+        self, handler, mock_http_client, cache
+    ):
+        """Test a bypassing scan neither reads nor writes the cache."""
+        mock_http_client.get.side_effect = (
+            self._pages("v1") + self._pages("v2") + self._pages("v3")
+        )
+
+        list(handler.iterate_items("/organizations"))
+        stored = len(cache.backend.cache)
+
+        bypassed = [
+            item["id"]
+            for item in handler.iterate_items("/organizations", bypass_cache=True)
+        ]
+        consistent = [
+            item["id"]
+            for item in handler.iterate_items(
+                "/organizations", consistent=True, bypass_cache=True
+            )
+        ]
+
+        assert bypassed == ["v2-1", "v2-2"]
+        assert consistent == ["v3-1", "v3-2"]
+        assert len(cache.backend.cache) == stored
+        # The snapshot of the cached scan is still served
+        items = [item["id"] for item in handler.iterate_items("/organizations")]
+        assert items == ["v1-1", "v1-2"]
@@ -0,0 +1,87 @@
+"""
+Tests for ITGlue Cache Serialization
+"""
+
+import json
+
+import pytest
+
+from itglue.serialization import CacheCodec, FORMAT_VERSION
+
+
+def _page(count):
+    """A JSON:API page with repeated attribute keys."""
+    return {
+        "data": [
+            {
+                "type": "configurations",
+                "id": str(i),
+                "attributes": {"name": f"server-{i}", "hostname": f"host{i}.local"},
+            }
+            for i in range(count)
+        ],
+        "meta": {"current-page": 1, "total-count": count},
+    }
+
+
+class TestCacheCodec:
+    """Test cache entry encoding."""
+
+    def test_round_trip_small_value_uncompressed(self):
+        """Test values under the threshold are stored uncompressed."""
+        codec = CacheCodec(compress_threshold=1024)
+        value = {"data": {"id": "1"}}
+
+        encoded = codec.encode(value)
+
+        assert encoded[:5] == b"IG" + bytes((FORMAT_VERSION, 1, 0))
+        assert codec.decode(encoded) == value
+
+    def test_round_trip_compressed(self):
+        """Test large values are compressed and read back."""
+        codec = CacheCodec(compress_threshold=256)
+        value = _page(100)
+
+        encoded = codec.encode(value)
+
+        assert encoded[4] == 1  # zlib
+        assert len(encoded) < len(json.dumps(value)) / 4
+        assert codec.decode(encoded) == value
+
+    def test_compression_disabled(self):
+        """Test compression can be turned off."""
+        codec = CacheCodec(compression=None, compress_threshold=0)
+
+        assert codec.encode(_page(10))[4] == 0
+
+    def test_decodes_other_settings_and_legacy_json(self):
+        """Test a codec reads entries written with other settings."""
+        writer = CacheCodec(compress_threshold=0)
+        reader = CacheCodec(compression=None)
+        value = _page(3)
+
+        assert reader.decode(writer.encode(value)) == value
+        assert reader.decode(json.dumps(value)) == value
+
+    def test_unknown_formats_rejected(self):
+        """Test unknown versions and formats raise ValueError."""
+        codec = CacheCodec()
+
+        with pytest.raises(ValueError, match="version"):
+            codec.decode(b"IG\x63\x01\x00{}")
+        with pytest.raises(ValueError, match="serializer"):
+            codec.decode(bytes((ord("I"), ord("G"), FORMAT_VERSION, 9, 0)) + b"{}")
+        with pytest.raises(ValueError, match="Unknown cache serializer"):
+            CacheCodec(serializer="pickle")
+
+    def test_msgpack_zstd(self):
+        """Test the msgpack serializer with zstd compression."""
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+        codec = CacheCodec(serializer="msgpack", compression="zstd")
+        value = _page(100)
+
+        encoded = codec.encode(value)
+
+        assert encoded[3:5] == bytes((2, 2))
+        assert codec.decode(encoded) == value
@@ -0,0 +1,78 @@
+"""
+Tests for ITGlue Cache Warm-up
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from itglue.client import ITGlueClient
+from itglue.config import ITGlueConfig
+from itglue.exceptions import ITGlueAPIError
+from itglue.warmup import WarmupQuery, reference_data_queries
+
+
+def _response(endpoint, params=None):
+    """A JSON:API response for the fake HTTP client."""
+    if endpoint == "/flexible_asset_types":
+        return {
+            "data": [
+                {"type": "flexible_asset_types", "id": "1"},
+                {"type": "flexible_asset_types", "id": "2"},
+            ]
+        }
+    if endpoint == "/flexible_asset_fields":
+        type_id = params["filter[flexible_asset_type_id]"]
+        return {"data": [{"type": "flexible_asset_fields", "id": f"{type_id}0"}]}
+    return {"data": []}
+
+
+class TestWarmCache:
+    """Test the client's cache warm-up."""
+
+    @pytest.fixture
+    def client(self):
+        """Client with a memory cache and a fake HTTP client."""
+        with patch("itglue.client.ITGlueHTTPClient") as mock_http:
+            mock_http.return_value.get = Mock(side_effect=_response)
+            client = ITGlueClient(ITGlueConfig(api_key="test-key"))
+            yield client
+            client.cache.close()
+
+    def test_reference_data_warm_up(self, client):
+        """Test presets and their follow-ups are cached for real calls."""
+        progress = []
+
+        results = client.warm_cache(
+            reference_data_queries(),
+            progress=lambda result, done, total: progress.append((done, total)),
+        )
+
+        assert len(results) == 6
+        assert all(result.ok for result in results)
+        assert [done for done, _ in progress] == [1, 2, 3, 4, 5, 6]
+        assert progress[-1][1] == 6
+
+        # The typed API is now served from the cache
+        client.http_client.get.reset_mock()
+        client.flexible_asset_types.get_enabled_types()
+        client.flexible_asset_fields.get_by_type(2)
+        client.http_client.get.assert_not_called()
+
+    def test_failures_are_reported(self, client):
+        """Test a failed query is returned, not raised."""
+        client.http_client.get.side_effect = ITGlueAPIError("boom", status_code=500)
+
+        results = client.warm_cache(["/organizations", WarmupQuery("/users")])
+
+        assert [result.ok for result in results] == [False, False]
+        assert isinstance(results[0].error, ITGlueAPIError)
+
+    def test_cached_queries_are_not_refetched(self, client):
+        """Test warming twice only fetches again with force_refresh."""
+        client.warm_cache(["/organizations"], max_workers=1)
+        client.warm_cache(["/organizations"], max_workers=1)
+        assert client.http_client.get.call_count == 1
+
+        client.warm_cache(["/organizations"], force_refresh=True)
+        assert client.http_client.get.call_count == 2